@@ -10,7 +10,7 @@ Author: SatWatch Project
 
 import math
 from datetime import datetime, timezone, timedelta
-from skyfield.api import load, EarthSatellite
+from skyfield.api import EarthSatellite
 from typing import Dict, Tuple, Optional
 
 
@@ -46,7 +46,7 @@ def calculate_conjunction_risk(
         ValueError: If TLE data is missing required fields
         Exception: If satellite propagation fails
     """
-    from iss_tracker_json import parse_tle_from_json
+    from iss_tracker_json import get_timescale, parse_tle_from_json
     
     # Validate TLE data
     for sat_name, sat_data in [("sat1", sat1_tle), ("sat2", sat2_tle)]:
@@ -67,8 +67,8 @@ def calculate_conjunction_risk(
     sat1_name = sat1_tle.get('OBJECT_NAME', 'Unknown')
     sat2_name = sat2_tle.get('OBJECT_NAME', 'Unknown')
     
-    # Initialize Skyfield timescale
-    ts = load.timescale()
+    # Shared Skyfield timescale (loaded once per process)
+    ts = get_timescale()
     
     # Start from current time
     start_time = datetime.now(timezone.utc)
@@ -11,12 +11,13 @@ Author: SatWatch Project
 import sys
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import List, Tuple, Optional
+from typing import Optional, Final
 import math
 import time
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import cached_property
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
 import plotly.graph_objects as go
 import numpy as np
 
@@ -25,160 +26,398 @@ sys.path.insert(0, str(Path(__file__).parent))
 from iss_tracker_json import (
     load_iss_tle_from_file,
     download_iss_tle_json,
+    get_timescale,
     parse_tle_from_json,
+    tle_lines_from_elements,
     calculate_iss_position
 )
+from orbital_hints import ECCENTRICITY_HINTS, INCLINATION_HINTS, PERIOD_HINTS, classify_orbit_value
+from geometry import any_within_radius, pairwise_min_distance, spherical_to_cartesian, teme_to_geodetic
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from skyfield.api import load, EarthSatellite
+from skyfield.api import EarthSatellite, wgs84
+from sgp4.api import Satrec, SatrecArray
+from sgp4.conveniences import jday_datetime
+
+# orjson parses JSON several times faster than the stdlib; use it when installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 from pathlib import Path
 
+# Physical constants, bound once at module level
+EARTH_RADIUS_KM: Final[float] = 6371.0                # Mean Earth radius (used for 3D display)
+EARTH_EQUATORIAL_RADIUS_KM: Final[float] = 6378.137   # WGS84 equatorial radius (apogee/perigee)
+MU: Final[float] = 398600.4418                        # Earth's gravitational parameter (km³/s²)
+TWO_PI: Final[float] = 2 * math.pi
+DAY_MIN: Final[float] = 1440.0                        # Minutes per day
+
+# Decimal places kept for lat/lon sent to the 2D map (~1 m, well below pixel resolution)
+MAP_COORD_DECIMALS: Final[int] = 5
+
+# Seconds between automatic dashboard refreshes
+AUTO_REFRESH_SECONDS: Final[int] = 10
+
+# Ordering of conjunction risk levels (higher is more severe)
+RISK_PRIORITY: Final[dict] = {'CRITICAL': 2, 'HIGH RISK': 1, 'NORMAL': 0}
+
+# Sidebar indicator per risk level (anything else shows as 🟢)
+RISK_INDICATORS: Final[dict] = {'CRITICAL': '🔴', 'HIGH RISK': '🟠'}
+
+# Legends shown under the 3D views
+TRACKED_VIEW_FEATURES_MD: Final[str] = """\
+- **Earth**: Semi-transparent gray sphere (radius: 6,371 km)
+- **ISS Position**: Red dot showing current location
+- **Orbit Path**: Red line showing predicted path for next 90 minutes
+- **Stations**: Red markers (space stations)
+- **Satellites**: Blue markers (operational satellites)
+- **Debris**: Orange markers (space debris)
+- **Interactive**: Rotate, zoom, and pan to explore the 3D view
+- **Proximity Filter**: Only objects within the selected radius are shown
+"""
+ORBIT_VIEW_FEATURES_MD: Final[str] = """\
+- **Earth**: Semi-transparent gray sphere (radius: 6,371 km)
+- **ISS Position**: Red dot showing current location
+- **Orbit Path**: Red line showing predicted path for next 90 minutes
+- **Interactive**: Rotate, zoom, and pan to explore the 3D view
+"""
 
-def fetch_satellites(catnr_list: list) -> list:
+# Keys a satellite record needs before it can be propagated
+REQUIRED_TLE_FIELDS: Final[frozenset] = frozenset({'TLE_LINE1', 'TLE_LINE2'})
+
+
+def to_display_array(values) -> np.ndarray:
     """
-    Fetch TLE data for multiple satellites by their NORAD catalog numbers.
+    Downcast coordinates to float32 before handing them to Plotly.
+    
+    Only used on the display side: the browser renders with float32 anyway, so
+    this halves the payload without visible loss. Propagation and distance math
+    stay in float64.
+    
+    Args:
+        values: Sequence or array of coordinates
+        
+    Returns:
+        np.ndarray: float32 array
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+@dataclass
+class SatPositions:
+    """
+    Positions of many satellites stored as parallel arrays (structure-of-arrays).
+
+    Entry i of every field describes the same satellite, so the arrays can be
+    filtered with one boolean mask and handed straight to Plotly or Folium
+    without unpacking a tuple per satellite.
+
+    Attributes:
+        x: X coordinates in kilometers
+        y: Y coordinates in kilometers
+        z: Z coordinates in kilometers
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+        alt: Altitudes in kilometers
+        catnr: NORAD catalog numbers
+        names: Satellite names
+        types: Satellite types ('station', 'satellite', 'debris')
+        valid: True where every coordinate is finite; computed once on
+            construction so consumers share one mask instead of re-checking
+    """
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    alt: np.ndarray
+    catnr: np.ndarray
+    names: list
+    types: np.ndarray
+    valid: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.valid = (
+            np.isfinite(self.x) & np.isfinite(self.y) & np.isfinite(self.z)
+            & np.isfinite(self.lat) & np.isfinite(self.lon) & np.isfinite(self.alt)
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @property
+    def xyz(self) -> np.ndarray:
+        """np.ndarray: Cartesian positions stacked into shape (N, 3)."""
+        return np.column_stack([self.x, self.y, self.z])
+    
+    @cached_property
+    def row_by_catnr(self) -> dict:
+        """dict: Maps each catalog number to its (first) row index, built on first use."""
+        rows = {}
+        for i, catnr in enumerate(self.catnr.tolist()):
+            rows.setdefault(catnr, i)
+        return rows
+    
+    def select(self, mask: np.ndarray) -> 'SatPositions':
+        """
+        Return only the satellites where mask is True.
+        
+        Args:
+            mask: Boolean array with one entry per satellite
+            
+        Returns:
+            SatPositions: New instance holding the selected rows
+        """
+        return SatPositions(
+            x=self.x[mask],
+            y=self.y[mask],
+            z=self.z[mask],
+            lat=self.lat[mask],
+            lon=self.lon[mask],
+            alt=self.alt[mask],
+            catnr=self.catnr[mask],
+            names=[self.names[i] for i in np.flatnonzero(mask)],
+            types=self.types[mask]
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list) -> 'SatPositions':
+        """
+        Build a SatPositions from a list of (x, y, z, lat, lon, alt, catnr, name, sat_type) rows.
+
+        Args:
+            rows: List of per-satellite rows in the order above
+
+        Returns:
+            SatPositions: Column arrays built from the rows (empty arrays if no rows)
+        """
+        if not rows:
+            rows_t = [[]] * 9
+        else:
+            rows_t = list(zip(*rows))
+        return cls(
+            x=np.asarray(rows_t[0], dtype=float),
+            y=np.asarray(rows_t[1], dtype=float),
+            z=np.asarray(rows_t[2], dtype=float),
+            lat=np.asarray(rows_t[3], dtype=float),
+            lon=np.asarray(rows_t[4], dtype=float),
+            alt=np.asarray(rows_t[5], dtype=float),
+            catnr=np.asarray(rows_t[6], dtype=int),
+            names=list(rows_t[7]),
+            types=np.asarray(rows_t[8], dtype=object)
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session used for CelesTrak downloads.
     
-    This function takes a list of NORAD catalog numbers and fetches 3LE (three-line element)
-    format data from CelesTrak. The 3LE format includes TLE lines directly, which is
-    what Skyfield needs for position calculations.
+    A shared session keeps connections to celestrak.org alive, so cache misses
+    (and the one-request-per-satellite loop in fetch_satellites) skip a fresh
+    TCP and TLS handshake for every request.
+    
+    Returns:
+        requests.Session: Session with a small HTTPS connection pool
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=256)
+def fetch_satellite(catnr: int) -> dict:
+    """
+    Fetch TLE data for one satellite by its NORAD catalog number.
+    
+    Requests 3LE (three-line element) format from CelesTrak, falling back to
+    JSON on a 403. The 3LE format includes TLE lines directly, which is what
+    Skyfield needs for position calculations.
+    
+    Cached for an hour per catalog number, so reruns don't re-request every
+    tracked satellite. Errors are raised rather than returned so failed
+    downloads are not cached (see fetch_satellites for the warnings).
     
     Args:
-        catnr_list: List of NORAD catalog numbers (e.g., [25544, 44713, 34009])
+        catnr: NORAD catalog number (e.g., 25544)
         
     Returns:
-        list: List of satellite dictionaries with TLE data. Each dict contains:
+        dict: Satellite dictionary with TLE data:
             - OBJECT_NAME: Satellite name
             - TLE_LINE1: First line of TLE data
             - TLE_LINE2: Second line of TLE data
             - NORAD_CAT_ID: NORAD catalog ID (extracted from TLE_LINE1)
+            
+    Raises:
+        requests.RequestException: If the download fails (including 403 Forbidden)
+        ValueError: If CelesTrak returns no data or malformed TLE lines
+    """
+    # CelesTrak API endpoint for individual satellite by catalog number
+    # Format: https://celestrak.org/NORAD/elements/gp.php?CATNR={id}&FORMAT=3LE
+    # 3LE format returns three lines: name, TLE line 1, TLE line 2
+    url = "https://celestrak.org/NORAD/elements/gp.php"
+    params = {
+        'CATNR': catnr,  # Catalog number
+        'FORMAT': '3le'  # Request 3LE (three-line element) format
+    }
+    
+    # Download the 3LE text data with timeout
+    # Add User-Agent header to avoid 403 errors
+    headers = {
+        'User-Agent': 'SatWatch/1.0 (Educational/Research Project)'
+    }
+    response = get_http_session().get(url, params=params, timeout=10, headers=headers)
+    
+    # Handle 403 Forbidden errors
+    if response.status_code == 403:
+        # Try JSON format as fallback
+        params_json = params.copy()
+        params_json['FORMAT'] = 'json'
+        response_json = get_http_session().get(url, params=params_json, timeout=10, headers=headers)
+        if response_json.status_code == 200:
+            # Parse JSON response
+            json_data = json_loads(response_json.content)
+            if json_data and len(json_data) > 0:
+                sat_data = json_data[0]
+                # Extract TLE lines if available
+                tle_line1 = sat_data.get('TLE_LINE1', '')
+                tle_line2 = sat_data.get('TLE_LINE2', '')
+                if tle_line1 and tle_line2:
+                    name_line = sat_data.get('OBJECT_NAME', 'Unknown')
+                    # Create satellite data in same format as 3LE
+                    return {
+                        'OBJECT_NAME': name_line,
+                        'TLE_LINE1': tle_line1,
+                        'TLE_LINE2': tle_line2,
+                        'NORAD_CAT_ID': str(catnr),
+                        'OBJECT_ID': str(catnr)
+                    }
+        
+        # Both formats failed
+        raise requests.RequestException(f"Satellite {catnr} returned 403 Forbidden")
+    
+    response.raise_for_status()  # Raise an error if download failed
+    
+    # Check if response has content
+    if not response.text or not response.text.strip():
+        raise ValueError(f"No data returned for satellite {catnr} (may not exist in database)")
+    
+    # Parse the 3LE format (three lines: name, line1, line2)
+    # Split by newline and filter out empty lines (in case of extra whitespace)
+    lines = [line.strip() for line in response.text.strip().split('\n') if line.strip()]
+    
+    # 3LE format should have exactly 3 lines per satellite
+    if len(lines) < 3:
+        raise ValueError(f"Invalid 3LE format for satellite {catnr}: Expected 3 lines, got {len(lines)}")
+    
+    # Extract the three lines
+    name_line = lines[0]
+    tle_line1 = lines[1]
+    tle_line2 = lines[2]
+    
+    # Validate TLE line format
+    if not tle_line1.startswith('1 ') or not tle_line2.startswith('2 '):
+        raise ValueError(f"Invalid TLE format for satellite {catnr}: TLE lines don't start with '1 ' and '2 '")
+    
+    # Extract catalog number from TLE line 1 (positions 2-7, 0-indexed: 2:7)
+    # Format: "1 25544U ..." - catalog number is at positions 2-7
+    try:
+        norad_cat_id = int(tle_line1[2:7].strip())
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Could not extract catalog number from TLE line 1 for satellite {catnr}: {e}") from e
+    
+    # Create satellite data dictionary in the format expected by the rest of the code
+    return {
+        'OBJECT_NAME': name_line,
+        'TLE_LINE1': tle_line1,
+        'TLE_LINE2': tle_line2,
+        'NORAD_CAT_ID': str(norad_cat_id),  # Store as string for consistency with JSON format
+        'OBJECT_ID': str(norad_cat_id)  # Also include for compatibility
+    }
+
+
+def fetch_satellites(catnr_list: tuple) -> list:
+    """
+    Fetch TLE data for multiple satellites by their NORAD catalog numbers.
+    
+    Each satellite goes through fetch_satellite (cached for an hour per
+    catalog number). Satellites that fail are skipped with a warning and
+    retried on the next rerun, so a temporary rate limit or network error
+    doesn't drop them for an hour.
+    
+    Args:
+        catnr_list: Tuple of NORAD catalog numbers (e.g., (25544, 44713, 34009))
+        
+    Returns:
+        list: List of satellite dictionaries with TLE data (see fetch_satellite)
     """
     satellites = []
     
     # Fetch each satellite individually
     for catnr in catnr_list:
         try:
-            # CelesTrak API endpoint for individual satellite by catalog number
-            # Format: https://celestrak.org/NORAD/elements/gp.php?CATNR={id}&FORMAT=3LE
-            # 3LE format returns three lines: name, TLE line 1, TLE line 2
-            url = "https://celestrak.org/NORAD/elements/gp.php"
-            params = {
-                'CATNR': catnr,  # Catalog number
-                'FORMAT': '3le'  # Request 3LE (three-line element) format
-            }
-            
-            # Download the 3LE text data with timeout
-            # Add User-Agent header to avoid 403 errors
-            headers = {
-                'User-Agent': 'SatWatch/1.0 (Educational/Research Project)'
-            }
-            response = requests.get(url, params=params, timeout=10, headers=headers)
-            
-            # Handle 403 Forbidden errors
-            if response.status_code == 403:
-                # Try JSON format as fallback
-                params_json = params.copy()
-                params_json['FORMAT'] = 'json'
-                response_json = requests.get(url, params=params_json, timeout=10, headers=headers)
-                if response_json.status_code == 200:
-                    # Parse JSON response
-                    json_data = response_json.json()
-                    if json_data and len(json_data) > 0:
-                        sat_data = json_data[0]
-                        # Extract TLE lines if available
-                        tle_line1 = sat_data.get('TLE_LINE1', '')
-                        tle_line2 = sat_data.get('TLE_LINE2', '')
-                        if tle_line1 and tle_line2:
-                            name_line = sat_data.get('OBJECT_NAME', 'Unknown')
-                            # Create satellite data in same format as 3LE
-                            satellite_data = {
-                                'OBJECT_NAME': name_line,
-                                'TLE_LINE1': tle_line1,
-                                'TLE_LINE2': tle_line2,
-                                'NORAD_CAT_ID': str(catnr),
-                                'OBJECT_ID': str(catnr)
-                            }
-                            satellites.append(satellite_data)
-                            continue
-                
-                # If both formats fail, show warning but don't stop
-                st.warning(f"⚠️ Satellite {catnr} returned 403 Forbidden. This satellite may not be available in CelesTrak database or access may be restricted. Skipping this satellite.")
-                continue
-            
-            response.raise_for_status()  # Raise an error if download failed
-            
-            # Check if response has content
-            if not response.text or not response.text.strip():
-                st.warning(f"No data returned for satellite {catnr} (may not exist in database)")
-                continue
-            
-            # Parse the 3LE format (three lines: name, line1, line2)
-            # Split by newline and filter out empty lines (in case of extra whitespace)
-            lines = [line.strip() for line in response.text.strip().split('\n') if line.strip()]
-            
-            # 3LE format should have exactly 3 lines per satellite
-            if len(lines) < 3:
-                st.warning(f"Invalid 3LE format for satellite {catnr}: Expected 3 lines, got {len(lines)}")
-                continue
-            
-            # Extract the three lines
-            name_line = lines[0]
-            tle_line1 = lines[1]
-            tle_line2 = lines[2]
-            
-            # Validate TLE line format
-            if not tle_line1.startswith('1 ') or not tle_line2.startswith('2 '):
-                st.warning(f"Invalid TLE format for satellite {catnr}: TLE lines don't start with '1 ' and '2 '")
-                continue
-            
-            # Extract catalog number from TLE line 1 (positions 2-7, 0-indexed: 2:7)
-            # Format: "1 25544U ..." - catalog number is at positions 2-7
-            try:
-                norad_cat_id = int(tle_line1[2:7].strip())
-            except (ValueError, IndexError) as e:
-                st.warning(f"Could not extract catalog number from TLE line 1 for satellite {catnr}: {e}")
-                continue
-            
-            # Create satellite data dictionary in the format expected by the rest of the code
-            satellite_data = {
-                'OBJECT_NAME': name_line,
-                'TLE_LINE1': tle_line1,
-                'TLE_LINE2': tle_line2,
-                'NORAD_CAT_ID': str(norad_cat_id),  # Store as string for consistency with JSON format
-                'OBJECT_ID': str(norad_cat_id)  # Also include for compatibility
-            }
-            
-            satellites.append(satellite_data)
-                
+            satellites.append(fetch_satellite(catnr))
         except requests.HTTPError as e:
             # Handle HTTP errors (including 403)
-            if e.response and e.response.status_code == 403:
+            if e.response is not None and e.response.status_code == 403:
                 st.warning(f"⚠️  Satellite {catnr} access forbidden (403). This satellite may not be publicly available in CelesTrak or may require authentication.")
             else:
-                status_code = e.response.status_code if e.response else "Unknown"
+                status_code = e.response.status_code if e.response is not None else "Unknown"
                 st.warning(f"⚠️  Failed to fetch satellite {catnr}: HTTP {status_code} - {e}")
-            continue
         except requests.RequestException as e:
             # Network error - log but continue with other satellites
             # Check if it's a 403 error in the message
             if "403" in str(e) or "Forbidden" in str(e):
-                st.warning(f"⚠️  Satellite {catnr} access forbidden (403). This satellite may not be publicly available in CelesTrak or may require authentication.")
+                st.warning(f"⚠️ Satellite {catnr} returned 403 Forbidden. This satellite may not be available in CelesTrak database or access may be restricted. Skipping this satellite.")
             else:
                 st.warning(f"⚠️  Failed to fetch satellite {catnr}: Network error - {e}")
-            continue
+        except ValueError as e:
+            # Empty or malformed response
+            st.warning(str(e))
         except Exception as e:
             # Any other error - log but continue
             st.warning(f"Unexpected error fetching satellite {catnr}: {e}")
-            continue
     
     return satellites
 
 
+@st.cache_data(show_spinner=False)
+def read_satellites_config(file_path: str, modified_time: float) -> dict:
+    """
+    Parse the satellites configuration file and prepare its search keys.
+    
+    Cached per file path and modification time, so reruns (one per keystroke in
+    the search box) skip the file read, and each tracked satellite gets its
+    lowercased name and catalog number string computed once per file change.
+    
+    Args:
+        file_path: Path to satellites.json file
+        modified_time: File modification time, part of the cache key only
+        
+    Returns:
+        dict: Configuration dictionary with 'tracked_satellites' list; each entry
+            also has 'name_lower' and 'catnr_str' for the sidebar search
+    """
+    with open(file_path, 'rb') as f:
+        config = json_loads(f.read())
+    
+    for sat in config.get('tracked_satellites', []):
+        sat['name_lower'] = sat['name'].lower()
+        sat['catnr_str'] = str(sat['catnr'])
+    
+    return config
+
+
 def load_satellites_config(file_path: str = None) -> dict:
     """
     Load the satellites configuration file.
     
     The config file defines which satellites to track, their names, catalog numbers,
-    and types (station, satellite, debris).
+    and types (station, satellite, debris). Parsing is cached by
+    read_satellites_config until the file changes.
     
     Args:
         file_path: Path to satellites.json file. If None, uses 'satellites.json' in project root.
@@ -201,11 +440,8 @@ def load_satellites_config(file_path: str = None) -> dict:
     if not file_path.exists():
         raise FileNotFoundError(f"Satellites config file not found: {file_path}")
     
-    # Read and parse the JSON file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
-    
-    return config
+    # Read and parse the JSON file (cached until it is modified)
+    return read_satellites_config(str(file_path), file_path.stat().st_mtime)
 
 
 def calculate_position_at_time(satellite: EarthSatellite, target_time: datetime) -> dict:
@@ -222,10 +458,8 @@ def calculate_position_at_time(satellite: EarthSatellite, target_time: datetime)
     Returns:
         dict: Dictionary containing latitude, longitude, altitude, and timestamp
     """
-    from skyfield.api import load
-    
     # Load the timescale
-    ts = load.timescale()
+    ts = get_timescale()
     
     # Convert datetime to Skyfield time
     skyfield_time = ts.from_datetime(target_time)
@@ -234,12 +468,12 @@ def calculate_position_at_time(satellite: EarthSatellite, target_time: datetime)
     geocentric = satellite.at(skyfield_time)
     
     # Convert to geographic coordinates
-    subpoint = geocentric.subpoint()
+    geo_position = wgs84.geographic_position_of(geocentric)
     
     # Extract the values
-    latitude = subpoint.latitude.degrees
-    longitude = subpoint.longitude.degrees
-    altitude = subpoint.elevation.km
+    latitude = geo_position.latitude.degrees
+    longitude = geo_position.longitude.degrees
+    altitude = geo_position.elevation.km
     
     return {
         'latitude': latitude,
@@ -268,7 +502,7 @@ def get_iss_data(use_local: bool = True, target_time: datetime = None):
             json_data = download_iss_tle_json()
         
         # Parse TLE and calculate position
-        satellite = parse_tle_from_json(json_data)
+        satellite = get_earth_satellite(json_data)
         
         # Calculate position at specified time or current time
         if target_time is not None:
@@ -282,19 +516,25 @@ def get_iss_data(use_local: bool = True, target_time: datetime = None):
         return None, None, str(e)
 
 
-def download_multiple_satellites(group: str = 'active', limit: int = 50):
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_satellite_group(group: str, limit: int) -> list:
     """
-    Download TLE data for multiple satellites from CelesTrak.
+    Fetch and parse a CelesTrak group in 3LE format.
     
-    Optimized for near real-time performance (30-100 objects, 200-500ms).
-    Uses 3LE format to ensure TLE lines are available for position calculations.
+    Cached for an hour per (group, limit): TLEs stay usable for days, so reruns
+    (e.g. every time slider change) reuse the download instead of hitting
+    CelesTrak again. Errors are raised rather than returned so failed downloads
+    are not cached.
     
     Args:
         group: CelesTrak group name ('active', 'stations', 'starlink', 'weather', etc.)
-        limit: Maximum number of satellites to download (30-100 recommended for speed)
+        limit: Maximum number of satellites to parse
         
     Returns:
         list: List of satellite dictionaries with TLE data (OBJECT_NAME, TLE_LINE1, TLE_LINE2, NORAD_CAT_ID)
+        
+    Raises:
+        requests.RequestException: If the download fails or CelesTrak is rate-limiting
     """
     url = "https://celestrak.org/NORAD/elements/gp.php"
     params = {
@@ -302,63 +542,278 @@ def download_multiple_satellites(group: str = 'active', limit: int = 50):
         'FORMAT': '3le'  # Use 3LE format for reliable TLE lines
     }
     
+    headers = {'User-Agent': 'SatWatch/1.0 (Educational/Research Project)'}
+    
+    # Add small delay to avoid rate limiting (CelesTrak may throttle rapid requests)
+    time.sleep(0.5)  # 500ms delay to be respectful to CelesTrak
+    
+    # Reduced timeout for faster failure (5s instead of 60s)
+    response = get_http_session().get(url, params=params, timeout=5, headers=headers)
+    
+    # Handle 403 Forbidden (rate limiting)
+    if response.status_code == 403:
+        raise requests.RequestException(
+            "CelesTrak is rate-limiting requests. Please wait a few minutes and try again, "
+            "or reduce the traffic density slider."
+        )
+    
+    response.raise_for_status()
+    
+    # Parse 3LE format (three lines per satellite: name, TLE line 1, TLE line 2)
+    # Optimized parsing - stop early when limit reached
+    lines = response.text.strip().split('\n')
+    satellites = []
+    
+    i = 0
+    while i < len(lines) and len(satellites) < limit:
+        # Skip empty lines
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        
+        if i + 2 < len(lines):
+            name_line = lines[i].strip()
+            tle_line1 = lines[i + 1].strip()
+            tle_line2 = lines[i + 2].strip()
+            
+            # Quick validation - check TLE line format
+            if tle_line1.startswith('1 ') and tle_line2.startswith('2 '):
+                # Extract catalog number from TLE line 1 (positions 2-7)
+                try:
+                    catnr = int(tle_line1[2:7])
+                    satellites.append({
+                        'OBJECT_NAME': name_line,
+                        'TLE_LINE1': tle_line1,
+                        'TLE_LINE2': tle_line2,
+                        'NORAD_CAT_ID': str(catnr),
+                        'OBJECT_ID': str(catnr)
+                    })
+                except (ValueError, IndexError):
+                    pass  # Skip invalid TLE
+            
+            i += 3  # Move to next satellite
+        else:
+            break
+    
+    return satellites
+
+
+def download_multiple_satellites(group: str = 'active', limit: int = 50):
+    """
+    Download TLE data for multiple satellites from CelesTrak.
+    
+    Optimized for near real-time performance (30-100 objects, 200-500ms).
+    Uses 3LE format to ensure TLE lines are available for position calculations.
+    Downloads are cached for an hour (see fetch_satellite_group).
+    
+    Args:
+        group: CelesTrak group name ('active', 'stations', 'starlink', 'weather', etc.)
+        limit: Maximum number of satellites to download (30-100 recommended for speed)
+        
+    Returns:
+        list: List of satellite dictionaries with TLE data (OBJECT_NAME, TLE_LINE1, TLE_LINE2, NORAD_CAT_ID)
+    """
     try:
-        headers = {'User-Agent': 'SatWatch/1.0 (Educational/Research Project)'}
+        return fetch_satellite_group(group, limit)
+    except Exception as e:
+        st.warning(f"Could not download satellite data: {e}")
+        return []
+
+
+def validate_tle_lines(tle_data: dict) -> tuple[str, str]:
+    """
+    Extract and check the two TLE lines from a TLE JSON record.
+    
+    Args:
+        tle_data: Dictionary with TLE_LINE1 and TLE_LINE2
         
-        # Add small delay to avoid rate limiting (CelesTrak may throttle rapid requests)
-        time.sleep(0.5)  # 500ms delay to be respectful to CelesTrak
+    Returns:
+        tuple: (line1, line2) stripped of surrounding whitespace
         
-        # Reduced timeout for faster failure (5s instead of 60s)
-        response = requests.get(url, params=params, timeout=5, headers=headers)
+    Raises:
+        KeyError: If either TLE line is missing
+        ValueError: If the lines are not in TLE format
+    """
+    line1 = tle_data['TLE_LINE1'].strip()
+    line2 = tle_data['TLE_LINE2'].strip()
+    if not line1.startswith('1 ') or not line2.startswith('2 '):
+        raise ValueError("Invalid TLE format in JSON data")
+    return line1, line2
+
+
+def record_tle_lines(tle_data: dict) -> tuple[str, str]:
+    """
+    Get the TLE lines for a record, building them from orbital elements if needed.
+    
+    CelesTrak's JSON format (used e.g. for the ISS fallback download) only
+    has orbital elements, so those records are formatted into TLE lines the
+    same way parse_tle_from_json does and can join a batched propagation.
+    
+    Args:
+        tle_data: Dictionary with TLE_LINE1/TLE_LINE2 or orbital elements
         
-        # Handle 403 Forbidden (rate limiting)
-        if response.status_code == 403:
-            raise requests.RequestException(
-                "CelesTrak is rate-limiting requests. Please wait a few minutes and try again, "
-                "or reduce the traffic density slider."
-            )
+    Returns:
+        tuple: (line1, line2)
         
-        response.raise_for_status()
+    Raises:
+        ValueError: If the lines are invalid, or there are no lines and
+            orbital elements are missing
+    """
+    if tle_data.get('TLE_LINE1', '').strip() and tle_data.get('TLE_LINE2', '').strip():
+        return validate_tle_lines(tle_data)
+    return tle_lines_from_elements(tle_data)
+
+
+def extract_catnr(sat_data: dict) -> Optional[int]:
+    """
+    Get the NORAD catalog number from a TLE JSON record.
+    
+    NORAD_CAT_ID is preferred; OBJECT_ID is used when numeric (it is often an
+    international designator such as '1998-067A'); otherwise the number is read
+    from columns 3-7 of TLE line 1. Digit checks are used instead of int()
+    inside try/except, so records that miss a field stay cheap.
+    
+    Args:
+        sat_data: Satellite dictionary with TLE data
         
-        # Parse 3LE format (three lines per satellite: name, TLE line 1, TLE line 2)
-        # Optimized parsing - stop early when limit reached
-        lines = response.text.strip().split('\n')
-        satellites = []
+    Returns:
+        int: Catalog number, or None if none of the fields holds one
+    """
+    for key in ('NORAD_CAT_ID', 'OBJECT_ID'):
+        value = str(sat_data.get(key, '')).strip()
+        if value.isdigit():
+            return int(value)
+    
+    catnr_field = sat_data.get('TLE_LINE1', '')[2:7].strip()
+    if catnr_field.isdigit():
+        return int(catnr_field)
+    return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def cached_full_traffic(count: int) -> dict:
+    """
+    Full-traffic TLE records keyed by catalog number, memoized per count.
+    
+    Switching between traffic counts reuses earlier results instead of
+    refetching. Download errors are raised (and so not cached).
+    
+    Args:
+        count: Number of active satellites to fetch
         
-        i = 0
-        while i < len(lines) and len(satellites) < limit:
-            # Skip empty lines
-            while i < len(lines) and not lines[i].strip():
-                i += 1
-            
-            if i + 2 < len(lines):
-                name_line = lines[i].strip()
-                tle_line1 = lines[i + 1].strip()
-                tle_line2 = lines[i + 2].strip()
-                
-                # Quick validation - check TLE line format
-                if tle_line1.startswith('1 ') and tle_line2.startswith('2 '):
-                    # Extract catalog number from TLE line 1 (positions 2-7)
-                    try:
-                        catnr = int(tle_line1[2:7])
-                        satellites.append({
-                            'OBJECT_NAME': name_line,
-                            'TLE_LINE1': tle_line1,
-                            'TLE_LINE2': tle_line2,
-                            'NORAD_CAT_ID': str(catnr),
-                            'OBJECT_ID': str(catnr)
-                        })
-                    except (ValueError, IndexError):
-                        pass  # Skip invalid TLE
-                
-                i += 3  # Move to next satellite
-            else:
-                break
+    Returns:
+        dict: Catalog number -> satellite dictionary with TLE lines
+    """
+    full_traffic_data = {}
+    for sat_data in fetch_satellite_group('active', count):
+        if REQUIRED_TLE_FIELDS.issubset(sat_data):
+            catnr = extract_catnr(sat_data)
+            if catnr:
+                full_traffic_data[catnr] = sat_data
+    return full_traffic_data
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def cached_satrec_array(tle_pairs: tuple) -> SatrecArray:
+    """
+    Parse a batch of TLEs into one SGP4 SatrecArray, memoized on the TLE lines.
+    
+    TLEs only change when fresh data is fetched, so reruns with the same
+    satellites reuse the parsed array.
+    
+    Args:
+        tle_pairs: Tuple of (line1, line2) tuples
         
-        return satellites
-    except Exception as e:
-        st.warning(f"Could not download satellite data: {e}")
-        return []
+    Returns:
+        SatrecArray: Vectorized SGP4 propagator for all satellites
+    """
+    return SatrecArray([Satrec.twoline2rv(line1, line2) for line1, line2 in tle_pairs])
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def cached_earth_satellite(line1: str, line2: str, name: str) -> EarthSatellite:
+    """
+    Build a Skyfield EarthSatellite, memoized on its TLE lines.
+    
+    Line 1 carries the element set epoch, so a TLE refresh produces a new key
+    and a fresh object while reruns reuse the parsed one.
+    
+    Args:
+        line1: TLE line 1
+        line2: TLE line 2
+        name: Satellite name
+        
+    Returns:
+        EarthSatellite: Skyfield satellite object ready for calculations
+    """
+    return EarthSatellite(line1, line2, name, get_timescale())
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def cached_satellite_from_elements(record_items: tuple) -> EarthSatellite:
+    """
+    Build a Skyfield EarthSatellite from orbital elements, memoized on them.
+    
+    CelesTrak's JSON format has no TLE lines, so parse_tle_from_json has to
+    format them from the elements first; caching skips that on every rerun.
+    
+    Args:
+        record_items: Sorted (key, value) pairs of the JSON record
+        
+    Returns:
+        EarthSatellite: Skyfield satellite object ready for calculations
+    """
+    return parse_tle_from_json(dict(record_items))
+
+
+def get_earth_satellite(json_data: dict) -> EarthSatellite:
+    """
+    Get the Skyfield satellite for a TLE JSON record.
+    
+    Records with TLE lines go through cached_earth_satellite; records with only
+    orbital elements go through cached_satellite_from_elements.
+    
+    Args:
+        json_data: Dictionary containing TLE data or orbital elements
+        
+    Returns:
+        EarthSatellite: Skyfield satellite object ready for calculations
+        
+    Raises:
+        ValueError: If the record has neither valid TLE lines nor orbital elements
+    """
+    if json_data.get('TLE_LINE1', '').strip() and json_data.get('TLE_LINE2', '').strip():
+        line1, line2 = validate_tle_lines(json_data)
+        return cached_earth_satellite(line1, line2, json_data.get('OBJECT_NAME', 'ISS').strip())
+    return cached_satellite_from_elements(tuple(sorted(json_data.items())))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def batch_geographic_positions(tle_pairs: tuple, current_time: datetime) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Propagate many satellites to one instant with a single SGP4 call.
+    
+    Positions go straight from TEME to WGS84 with one sidereal-time rotation
+    (see teme_to_geodetic) instead of EarthSatellite.at()'s GCRS path, for
+    all satellites at once instead of one Python call per satellite. Results are
+    cached per TLE set and instant, so reruns at the same target time (e.g. a
+    widget change in live mode within the same second) skip propagation.
+    
+    Args:
+        tle_pairs: Tuple of (line1, line2) tuples
+        current_time: Timezone-aware datetime to propagate to
+        
+    Returns:
+        tuple: (latitudes, longitudes, altitudes) arrays in degrees, degrees, km.
+            Satellites that SGP4 reports as failed get NaN.
+    """
+    jd, fr = jday_datetime(current_time)
+    errors, r_teme, _ = cached_satrec_array(tle_pairs).sgp4(np.array([jd]), np.array([fr]))
+    r_teme = r_teme[:, 0, :]
+    r_teme[errors[:, 0] != 0] = np.nan
+    
+    # One GMST value (hours -> radians) shared by every satellite at this instant
+    gmst = get_timescale().from_datetime(current_time).gmst * (np.pi / 12)
+    return teme_to_geodetic(r_teme, gmst)
 
 
 def calculate_satellite_positions(satellites_data: list, current_time: datetime):
@@ -370,65 +825,47 @@ def calculate_satellite_positions(satellites_data: list, current_time: datetime)
         current_time: Current datetime object
         
     Returns:
-        list: List of (x, y, z, name, altitude) tuples
+        SatPositions: Column arrays of positions (type 'satellite'), in the same
+            layout as calculate_tracked_satellite_positions
     """
-    from skyfield.api import load
-    
-    ts = load.timescale()
-    skyfield_time = ts.from_datetime(current_time)
-    
-    positions = []
+    tle_pairs = []
+    names = []
+    catnrs = []
     
     for sat_data in satellites_data:
         try:
-            # Parse TLE from JSON data
-            satellite = parse_tle_from_json(sat_data)
-            
-            # Calculate position
-            geocentric = satellite.at(skyfield_time)
-            subpoint = geocentric.subpoint()
-            
-            lat = subpoint.latitude.degrees
-            lon = subpoint.longitude.degrees
-            alt = subpoint.elevation.km
-            
-            # Convert to x, y, z
-            x, y, z = lat_lon_alt_to_xyz(lat, lon, alt)
+            # Check the TLE lines; the whole batch is propagated at once below
+            tle_pair = validate_tle_lines(sat_data)
             
             name = sat_data.get('OBJECT_NAME', 'Unknown')
             
             # Extract catalog number (NORAD_CAT_ID is preferred, fallback to OBJECT_ID or TLE)
-            catnr = None
-            if 'NORAD_CAT_ID' in sat_data:
-                try:
-                    catnr = int(sat_data['NORAD_CAT_ID'])
-                except (ValueError, TypeError):
-                    pass
-            
-            # If NORAD_CAT_ID not available, try OBJECT_ID
-            if catnr is None and 'OBJECT_ID' in sat_data:
-                obj_id = sat_data['OBJECT_ID']
-                try:
-                    catnr = int(obj_id)
-                except (ValueError, TypeError):
-                    # OBJECT_ID might be international designator, try extracting from TLE
-                    tle_line1 = sat_data.get('TLE_LINE1', '')
-                    if tle_line1.startswith('1 '):
-                        try:
-                            catnr = int(tle_line1[2:7].strip())
-                        except (ValueError, IndexError):
-                            pass
+            catnr = extract_catnr(sat_data)
             
             # If still no catalog number, skip this satellite
             if catnr is None:
                 continue
             
-            positions.append((x, y, z, name, alt, catnr))
+            tle_pairs.append(tle_pair)
+            names.append(name)
+            catnrs.append(catnr)
         except Exception as e:
             # Skip satellites that can't be parsed
             continue
     
-    return positions
+    if not tle_pairs:
+        return SatPositions.from_rows([])
+    
+    lat, lon, alt = batch_geographic_positions(tuple(tle_pairs), current_time)
+    xyz = lat_lon_alt_to_xyz(lat, lon, alt)
+    
+    return SatPositions(
+        x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2],
+        lat=lat, lon=lon, alt=alt,
+        catnr=np.asarray(catnrs, dtype=int),
+        names=names,
+        types=np.full(len(names), 'satellite', dtype=object)
+    )
 
 
 def load_conjunction_results() -> dict:
@@ -443,45 +880,184 @@ def load_conjunction_results() -> dict:
     
     try:
         if results_file.exists():
-            with open(results_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(results_file, 'rb') as f:
+                return json_loads(f.read())
     except Exception as e:
         st.warning(f"Could not load conjunction results: {e}")
     
     return None
 
 
-def get_satellite_risks(conjunction_results: dict, catnr: int, sat_name: str) -> list:
+def format_conjunction_time(time_value) -> Optional[str]:
     """
-    Get all conjunction risks for a specific satellite.
+    Format a conjunction's time of closest approach for display.
+    
+    Args:
+        time_value: ISO 8601 time string from the conjunction results
+        
+    Returns:
+        str: 'YYYY-MM-DD HH:MM:SS UTC', the raw string if it can't be parsed,
+             or None if the value isn't a string
+    """
+    if not isinstance(time_value, str):
+        return None
+    try:
+        risk_time = datetime.fromisoformat(time_value.replace('Z', '+00:00'))
+        return risk_time.strftime('%Y-%m-%d %H:%M:%S UTC')
+    except ValueError:
+        return time_value
+
+
+@st.cache_data(show_spinner=False)
+def index_conjunctions(conjunction_results: dict) -> dict:
+    """
+    Group conjunction results by satellite name.
+    
+    Built once per set of results so per-satellite lookups don't have to scan
+    every conjunction result, and each satellite's risk record is assembled
+    here rather than on every lookup.
+    
+    Args:
+        conjunction_results: Conjunction results dictionary
+        
+    Returns:
+        dict: Maps satellite name to a list of (result_index, side, risk)
+              tuples in result order, where side is 0 for sat1 and 1 for sat2
+              and risk is the dict get_satellite_risks returns for that
+              satellite's side of the result (with a display-ready 'time_str')
+    """
+    if not conjunction_results or 'results' not in conjunction_results:
+        return {}
+    
+    index = {}
+    for i, result in enumerate(conjunction_results['results']):
+        # Both sides share the time, so it is parsed and formatted once here
+        time_value = result.get('min_distance_time', '')
+        time_str = format_conjunction_time(time_value)
+        for side, (role, other_role) in enumerate((('sat1', 'sat2'), ('sat2', 'sat1'))):
+            name = result.get(f'{role}_name', '')
+            # A result lists a satellite once even if both sides share its name
+            if role == 'sat2' and name == result.get('sat1_name', ''):
+                continue
+            index.setdefault(name, []).append((i, side, {
+                'risk_level': result.get('risk_level', 'NORMAL'),
+                'distance_km': result.get('min_distance_km', 0),
+                'time': time_value,
+                'time_str': time_str,
+                'other_satellite': result.get(f'{other_role}_name', ''),
+                'position_at_closest': result.get(f'{role}_position_at_closest', {})
+            }))
+    return index
+
+
+@st.cache_data(show_spinner=False)
+def index_max_risk(conjunction_results: dict) -> dict:
+    """
+    Map each satellite name to its highest conjunction risk level.
+    
+    Lets the sidebar pick a row's risk indicator with a dict lookup instead of
+    collecting and ranking every risk for the satellite.
     
     Args:
         conjunction_results: Conjunction results dictionary
+        
+    Returns:
+        dict: Maps satellite name to its most severe risk level
+    """
+    if not conjunction_results or 'results' not in conjunction_results:
+        return {}
+    
+    max_risk = {}
+    for result in conjunction_results['results']:
+        risk_level = result.get('risk_level', 'NORMAL')
+        for name in (result.get('sat1_name', ''), result.get('sat2_name', '')):
+            current = max_risk.get(name)
+            if current is None or RISK_PRIORITY.get(risk_level, 0) > RISK_PRIORITY.get(current, 0):
+                max_risk[name] = risk_level
+    return max_risk
+
+
+def get_max_risk_level(max_risk_index: dict, sat_name: str) -> Optional[str]:
+    """
+    Get the highest conjunction risk level for a satellite.
+    
+    Uses the same name matching as get_satellite_risks: exact name first, then
+    a substring match over the names in the index.
+    
+    Args:
+        max_risk_index: Index built by index_max_risk()
+        sat_name: Name of the satellite
+        
+    Returns:
+        str: Most severe risk level, or None if the satellite has no conjunctions
+    """
+    if sat_name in max_risk_index:
+        return max_risk_index[sat_name]
+    
+    levels = [level for name, level in max_risk_index.items() if sat_name in name]
+    return max(levels, key=lambda level: RISK_PRIORITY.get(level, 0)) if levels else None
+
+
+@st.cache_data(show_spinner=False)
+def index_risk_indicators(max_risk_index: dict, sat_names: tuple) -> dict:
+    """
+    Map each satellite name to its sidebar risk indicator.
+    
+    Built once per set of results and tracked names, so the sidebar tables
+    don't repeat get_max_risk_level's substring fallback on every rerun.
+    
+    Args:
+        max_risk_index: Index built by index_max_risk()
+        sat_names: Names of the tracked satellites
+        
+    Returns:
+        dict: Maps satellite name to its RISK_INDICATORS emoji ('🟢' if none)
+    """
+    return {
+        name: RISK_INDICATORS.get(get_max_risk_level(max_risk_index, name), "🟢")
+        for name in sat_names
+    }
+
+
+def get_satellite_risks(conjunction_index: dict, catnr: int, sat_name: str) -> list:
+    """
+    Get all conjunction risks for a specific satellite.
+    
+    Looks the satellite up by exact name first. Names in satellites.json are often
+    shorter than the CelesTrak names stored in the results (e.g. "ISS" vs
+    "ISS (ZARYA)"), so if there is no exact match we fall back to a substring
+    match over the distinct names in the index.
+    
+    Args:
+        conjunction_index: Index built by index_conjunctions()
         catnr: Catalog number of the satellite
         sat_name: Name of the satellite
         
     Returns:
         list: List of risk dictionaries for this satellite
     """
-    if not conjunction_results or 'results' not in conjunction_results:
+    if not conjunction_index:
         return []
     
+    entries = conjunction_index.get(sat_name)
+    if entries is not None:
+        # Exact match: entries are already in result order
+        return [risk for _, _, risk in entries]
+    
+    entries = [
+        entry
+        for name, name_entries in conjunction_index.items() if sat_name in name
+        for entry in name_entries
+    ]
+    
     risks = []
-    for result in conjunction_results['results']:
-        # Check if this satellite is involved in this conjunction
-        sat1_name = result.get('sat1_name', '')
-        sat2_name = result.get('sat2_name', '')
-        
-        if sat_name in sat1_name or sat_name in sat2_name:
-            # Determine the other satellite
-            other_sat = sat2_name if sat_name in sat1_name else sat1_name
-            risks.append({
-                'risk_level': result.get('risk_level', 'NORMAL'),
-                'distance_km': result.get('min_distance_km', 0),
-                'time': result.get('min_distance_time', ''),
-                'other_satellite': other_sat,
-                'position_at_closest': result.get('sat1_position_at_closest' if sat_name in sat1_name else 'sat2_position_at_closest', {})
-            })
+    seen = set()
+    for i, _, risk in sorted(entries, key=lambda entry: entry[:2]):
+        # A result can match under both names; report it once (as sat1 first)
+        if i in seen:
+            continue
+        seen.add(i)
+        risks.append(risk)
     
     return risks
 
@@ -500,17 +1076,14 @@ def calculate_tracked_satellite_positions(tracked_satellites: list, satellites_t
         current_time: Current datetime object
         
     Returns:
-        list: List of (x, y, z, name, altitude, sat_type, catnr, lat, lon) tuples
+        SatPositions: Column arrays of positions for every satellite that could be calculated
     """
-    from skyfield.api import load
-    
-    ts = load.timescale()
-    positions = []
+    tle_pairs = []
+    configs = []
     
     for sat_config in tracked_satellites:
         catnr = sat_config['catnr']
         sat_name = sat_config['name']
-        sat_type = sat_config['type']
         
         # Get TLE data for this satellite
         tle_data = satellites_tle_data.get(catnr)
@@ -518,72 +1091,147 @@ def calculate_tracked_satellite_positions(tracked_satellites: list, satellites_t
             continue  # Skip if we don't have TLE data
         
         try:
-            # Parse TLE from JSON data
-            satellite = parse_tle_from_json(tle_data)
-            
-            # Calculate position
-            geocentric = satellite.at(ts.from_datetime(current_time))
-            subpoint = geocentric.subpoint()
-            
-            lat = subpoint.latitude.degrees
-            lon = subpoint.longitude.degrees
-            alt = subpoint.elevation.km
-            
-            # Check for NaN values
-            if math.isnan(lat) or math.isnan(lon) or math.isnan(alt):
-                st.warning(f"Position calculation returned NaN for {sat_name} (CATNR: {catnr})")
-                continue
-            
-            # Convert to x, y, z
-            x, y, z = lat_lon_alt_to_xyz(lat, lon, alt)
-            
-            # Check for NaN in converted coordinates
-            if math.isnan(x) or math.isnan(y) or math.isnan(z):
-                st.warning(f"Coordinate conversion returned NaN for {sat_name} (CATNR: {catnr})")
-                continue
-            
-            # Return: (x, y, z, name, alt, sat_type, catnr) for 3D view
-            # Also store lat/lon for 2D map use
-            positions.append((x, y, z, sat_name, alt, sat_type, catnr, lat, lon))
+            # Check the TLE lines; the whole batch is propagated at once below
+            tle_pairs.append(record_tle_lines(tle_data))
+            configs.append(sat_config)
         except Exception as e:
             # Log the error for debugging
             st.warning(f"Error calculating position for {sat_name} (CATNR: {catnr}): {e}")
             continue
     
+    if not tle_pairs:
+        return SatPositions.from_rows([])
+    
+    lat, lon, alt = batch_geographic_positions(tuple(tle_pairs), current_time)
+    
+    # Convert to x, y, z for the 3D view (NaN in lat/lon/alt carries through);
+    # lat/lon are kept for the 2D map
+    xyz = lat_lon_alt_to_xyz(lat, lon, alt)
+    positions = SatPositions(
+        x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2],
+        lat=lat, lon=lon, alt=alt,
+        catnr=np.asarray([sat_config['catnr'] for sat_config in configs], dtype=int),
+        names=[sat_config['name'] for sat_config in configs],
+        types=np.asarray([sat_config['type'] for sat_config in configs], dtype=object)
+    )
+    
+    # Check the whole batch for NaN/inf at once and report it in a single warning
+    bad = ~positions.valid
+    if bad.any():
+        bad_names = [positions.names[i] for i in np.flatnonzero(bad)]
+        st.warning(
+            f"{len(bad_names)} satellite(s) had invalid positions and were skipped "
+            f"(e.g. {', '.join(bad_names[:3])})"
+        )
+        positions = positions.select(~bad)
+    
     return positions
 
 
-def calculate_distance_3d(pos1: tuple, pos2: tuple) -> float:
+def tracked_satellites_key(tracked_satellites: list, satellites_tle_data: dict) -> tuple[tuple, tuple]:
     """
-    Calculate 3D Euclidean distance between two points.
+    Small hashable keys identifying a tracked list and its TLEs.
     
     Args:
-        pos1: (x, y, z) tuple for first point
-        pos2: (x, y, z) tuple for second point
+        tracked_satellites: List of satellite config dicts with 'name', 'catnr', 'type'
+        satellites_tle_data: Dict mapping catalog numbers to TLE data
         
     Returns:
-        float: Distance in kilometers
+        tuple: (tracked_key, tle_key) where tracked_key holds (catnr, name, type)
+               and tle_key the TLE lines per tracked satellite (the sorted
+               record items for element-only records, None where missing)
     """
-    x1, y1, z1 = pos1
-    x2, y2, z2 = pos2
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
+    tracked_key = tuple((sat['catnr'], sat['name'], sat['type']) for sat in tracked_satellites)
+    tle_key = []
+    for sat in tracked_satellites:
+        tle_data = satellites_tle_data.get(sat['catnr'])
+        if not tle_data:
+            tle_key.append(None)
+        elif tle_data.get('TLE_LINE1') and tle_data.get('TLE_LINE2'):
+            tle_key.append((tle_data['TLE_LINE1'], tle_data['TLE_LINE2']))
+        else:
+            tle_key.append(tuple(sorted(tle_data.items())))
+    return tracked_key, tuple(tle_key)
 
 
-def create_altitude_bands(earth_radius: float = 6371.0):
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_tracked_positions(
+    _tracked_satellites: list,
+    _satellites_tle_data: dict,
+    tracked_key: tuple,
+    tle_key: tuple,
+    current_time: datetime
+):
     """
-    Create visualization for altitude bands (LEO, MEO, GEO).
+    Memoized calculate_tracked_satellite_positions.
+    
+    The config list and TLE dict are not hashed (leading underscore); the
+    small keys built by get_tracked_satellite_positions identify them instead.
     
     Args:
-        earth_radius: Earth radius in kilometers
+        _tracked_satellites: List of satellite config dicts with 'name', 'catnr', 'type'
+        _satellites_tle_data: Dict mapping catalog numbers to TLE data
+        tracked_key: Key from tracked_satellites_key
+        tle_key: Key from tracked_satellites_key
+        current_time: Current datetime object
+        
+    Returns:
+        SatPositions: As from calculate_tracked_satellite_positions
+    """
+    return calculate_tracked_satellite_positions(_tracked_satellites, _satellites_tle_data, current_time)
+
+
+def get_tracked_satellite_positions(tracked_satellites: list, satellites_tle_data: dict, current_time: datetime):
+    """
+    Positions for tracked satellites, reused across reruns at the same time.
+    
+    Widget interactions that don't change the time, the tracked list or the
+    TLEs (star clicks, toggles, the three views in one rerun) reuse the
+    cached result. Live mode times are whole seconds, so they share it too.
+    
+    Args:
+        tracked_satellites: List of satellite config dicts with 'name', 'catnr', 'type'
+        satellites_tle_data: Dict mapping catalog numbers to TLE data
+        current_time: Current datetime object
+        
+    Returns:
+        SatPositions: As from calculate_tracked_satellite_positions
+    """
+    tracked_key, tle_key = tracked_satellites_key(tracked_satellites, satellites_tle_data)
+    return cached_tracked_positions(
+        tracked_satellites, satellites_tle_data, tracked_key, tle_key, current_time
+    )
+
+
+def calculate_distance_3d(pos1, pos2):
+    """
+    Calculate 3D Euclidean distance between points.
+    
+    Works on single points or whole batches: either argument can be an
+    (x, y, z) tuple or an (N, 3) array, and they broadcast against each other.
+    
+    Args:
+        pos1: (x, y, z) tuple or (N, 3) array for the first point(s)
+        pos2: (x, y, z) tuple or (N, 3) array for the second point(s)
         
+    Returns:
+        float or np.ndarray: Distance in kilometers (shape (N,) for batches)
+    """
+    return np.linalg.norm(np.subtract(pos2, pos1), axis=-1)
+
+
+def create_altitude_bands():
+    """
+    Create visualization for altitude bands (LEO, MEO, GEO).
+    
     Returns:
         list: List of Plotly traces for altitude bands
     """
     bands = []
     
     # LEO: 160-2000 km
-    leo_radius = earth_radius + 2000
-    leo_x, leo_y, leo_z = create_earth_sphere(leo_radius, resolution=30)
+    leo_radius = EARTH_RADIUS_KM + 2000
+    leo_x, leo_y, leo_z, _ = create_earth_sphere(leo_radius, resolution=30, add_noise=False)
     bands.append(go.Surface(
         x=leo_x, y=leo_y, z=leo_z,
         colorscale=[[0, 'rgba(0, 100, 255, 0.1)'], [1, 'rgba(0, 100, 255, 0.1)']],
@@ -593,8 +1241,8 @@ def create_altitude_bands(earth_radius: float = 6371.0):
     ))
     
     # MEO: 2000-35786 km (show at 10000 km for visibility)
-    meo_radius = earth_radius + 10000
-    meo_x, meo_y, meo_z = create_earth_sphere(meo_radius, resolution=30)
+    meo_radius = EARTH_RADIUS_KM + 10000
+    meo_x, meo_y, meo_z, _ = create_earth_sphere(meo_radius, resolution=30, add_noise=False)
     bands.append(go.Surface(
         x=meo_x, y=meo_y, z=meo_z,
         colorscale=[[0, 'rgba(255, 200, 0, 0.1)'], [1, 'rgba(255, 200, 0, 0.1)']],
@@ -656,12 +1304,15 @@ def get_data_freshness_status(epoch_str: str) -> tuple[str, float, str]:
         return 'expired', 999, "Unable to determine data age"
 
 
+@st.cache_data(show_spinner=False, max_entries=512)
 def calculate_orbital_parameters(tle_data: dict) -> dict:
     """
     Calculate orbital parameters from TLE data.
     
     Extracts and calculates key orbital parameters that are useful for
-    understanding a satellite's orbit characteristics.
+    understanding a satellite's orbit characteristics. The result depends
+    only on the TLE record, so it is memoized on it and reopening a profile
+    (or any rerun until the next TLE refresh) is a cache hit.
     
     Args:
         tle_data: Dictionary containing TLE_LINE1, TLE_LINE2, and optionally
@@ -679,11 +1330,6 @@ def calculate_orbital_parameters(tle_data: dict) -> dict:
             - raan: Right Ascension of Ascending Node in degrees
             - arg_perigee: Argument of Perigee in degrees
     """
-    # Earth's radius in km
-    EARTH_RADIUS_KM = 6378.137
-    # Earth's gravitational parameter (km³/s²)
-    MU = 398600.4418
-    
     params = {}
     
     try:
@@ -747,12 +1393,12 @@ def calculate_orbital_parameters(tle_data: dict) -> dict:
             mean_motion = params['mean_motion']
             
             # Orbital period in minutes
-            params['period_minutes'] = 1440.0 / mean_motion  # 1440 = minutes per day
+            params['period_minutes'] = DAY_MIN / mean_motion
             
             # Semi-major axis using Kepler's third law
             # T = 2π√(a³/μ) => a = (μ(T/2π)²)^(1/3)
             period_seconds = params['period_minutes'] * 60
-            params['semi_major_axis_km'] = (MU * (period_seconds / (2 * math.pi))**2)**(1/3)
+            params['semi_major_axis_km'] = (MU * (period_seconds / TWO_PI)**2)**(1/3)
             
             # Calculate apogee and perigee if we have eccentricity
             if 'eccentricity' in params:
@@ -761,8 +1407,8 @@ def calculate_orbital_parameters(tle_data: dict) -> dict:
                 
                 # Apogee = a(1+e) - Earth_radius
                 # Perigee = a(1-e) - Earth_radius
-                params['apogee_km'] = sma * (1 + ecc) - EARTH_RADIUS_KM
-                params['perigee_km'] = sma * (1 - ecc) - EARTH_RADIUS_KM
+                params['apogee_km'] = sma * (1 + ecc) - EARTH_EQUATORIAL_RADIUS_KM
+                params['perigee_km'] = sma * (1 - ecc) - EARTH_EQUATORIAL_RADIUS_KM
         
         return params
         
@@ -772,11 +1418,26 @@ def calculate_orbital_parameters(tle_data: dict) -> dict:
         return params
 
 
+# JavaScript used by FastMarkerCluster to draw each satellite as a colored circle.
+# Row layout: [lat, lon, name, altitude_km, type, color]; the popup and tooltip
+# are assembled here from the name, altitude and type columns
+SATELLITE_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 8, color: row[5], fillColor: row[5], fillOpacity: 0.8, weight: 2
+    });
+    marker.bindPopup(row[2] + '<br>Altitude: ' + row[3].toFixed(2) + ' km<br>Type: ' + row[4]);
+    marker.bindTooltip(row[2]);
+    return marker;
+}
+"""
+
+
 def create_map(
     latitude: float, 
     longitude: float, 
     altitude: float,
-    all_satellites: Optional[List[Tuple[float, float, float, str, str, int]]] = None
+    all_satellites: Optional[SatPositions] = None
 ):
     """
     Create a Folium map with satellite position markers.
@@ -785,8 +1446,7 @@ def create_map(
         latitude: Primary satellite (ISS) latitude in degrees (for centering)
         longitude: Primary satellite (ISS) longitude in degrees (for centering)
         altitude: Primary satellite (ISS) altitude in kilometers
-        all_satellites: Optional list of (lat, lon, alt, name, sat_type, catnr) tuples
-                      for all tracked satellites to display
+        all_satellites: Optional SatPositions for all tracked satellites to display
         
     Returns:
         folium.Map: Map object with satellite markers
@@ -794,20 +1454,36 @@ def create_map(
     Raises:
         ValueError: If latitude, longitude, or altitude contains NaN values
     """
+    # Imported here: folium is only needed when a 2D map is built, so the
+    # dashboard does not pay for it at startup
+    import folium
+    from folium.plugins import FastMarkerCluster
+    
     # Validate that position values are not NaN
-    if math.isnan(latitude) or math.isnan(longitude) or math.isnan(altitude):
+    if not np.isfinite([latitude, longitude, altitude]).all():
         raise ValueError(
             f"Invalid position values: latitude={latitude}, longitude={longitude}, altitude={altitude}. "
             "Position calculation may have failed. Try refreshing or using CelesTrak API data source."
         )
     
     # Create map centered on primary satellite (ISS) position
+    # prefer_canvas draws vector markers on one <canvas> instead of one SVG node each
     m = folium.Map(
         location=[latitude, longitude],
         zoom_start=3,
-        tiles='CartoDB dark_matter'  # Dark theme
+        tiles=None,
+        prefer_canvas=True
     )
     
+    # Dark theme tiles; only load new tiles once panning stops and keep a wider
+    # ring of already-loaded tiles so small pans don't refetch
+    folium.TileLayer(
+        'CartoDB dark_matter',
+        control=False,
+        update_when_idle=True,
+        keep_buffer=4
+    ).add_to(m)
+    
     # Color coding for satellite types
     type_colors = {
         'station': 'red',
@@ -816,57 +1492,55 @@ def create_map(
     }
     
     # Add markers for all tracked satellites if provided
-    if all_satellites:
-        for sat_data in all_satellites:
-            # Handle both formats: (x, y, z, name, alt, sat_type, catnr, lat, lon) or (lat, lon, alt, name, sat_type, catnr)
-            if len(sat_data) == 9:
-                # New format with x, y, z and lat, lon
-                x, y, z, sat_name, sat_alt, sat_type, catnr, sat_lat, sat_lon = sat_data
-            elif len(sat_data) == 6:
-                # Old format: (lat, lon, alt, name, sat_type, catnr)
-                sat_lat, sat_lon, sat_alt, sat_name, sat_type, catnr = sat_data
-            else:
-                # Unexpected format, skip
-                continue
-            # Skip if position is invalid
-            if math.isnan(sat_lat) or math.isnan(sat_lon) or math.isnan(sat_alt):
-                continue
-            
-            # Determine color based on type
-            color = type_colors.get(sat_type, 'gray')
-            
-            # Special styling for ISS (larger, more prominent)
-            if catnr == 25544 or 'ISS' in sat_name.upper():
-                radius = 12
-                weight = 3
-            else:
-                radius = 8
-                weight = 2
-            
-            # Add marker
-            folium.CircleMarker(
-                location=[sat_lat, sat_lon],
-                radius=radius,
-                popup=f'{sat_name}<br>Altitude: {sat_alt:.2f} km<br>Type: {sat_type}',
-                tooltip=sat_name,
-                color=color,
-                fill=True,
-                fillColor=color,
-                fillOpacity=0.8,
-                weight=weight
+    if all_satellites is not None and len(all_satellites) > 0:
+        # Skip satellites with invalid positions
+        sats = all_satellites.select(all_satellites.valid)
+        
+        types = sats.types.tolist()
+        colors = [type_colors.get(sat_type, 'gray') for sat_type in types]
+        is_iss = [
+            catnr == 25544 or 'ISS' in sat_name.upper()
+            for catnr, sat_name in zip(sats.catnr.tolist(), sats.names)
+        ]
+        
+        # Round lat/lon so the generated map HTML carries short coordinates
+        lats = np.round(sats.lat, MAP_COORD_DECIMALS).tolist()
+        lons = np.round(sats.lon, MAP_COORD_DECIMALS).tolist()
+        alts = np.round(sats.alt, 2).tolist()
+        
+        # One row per satellite for FastMarkerCluster; the markers and popups are
+        # built in the browser by SATELLITE_MARKER_CALLBACK, which acts as the popup
+        # template, instead of one Python object and HTML string each
+        marker_rows = [
+            [sat_lat, sat_lon, sat_name, sat_alt, sat_type, color]
+            for sat_lat, sat_lon, sat_name, sat_alt, sat_type, color, iss
+            in zip(lats, lons, sats.names, alts, types, colors, is_iss)
+            if not iss
+        ]
+        
+        # ISS gets its own prominent marker outside the cluster
+        for sat_lat, sat_lon, sat_name, sat_alt, sat_type, iss in zip(lats, lons, sats.names, alts, types, is_iss):
+            if iss:
+                folium.Marker(
+                    location=[sat_lat, sat_lon],
+                    popup=f'{sat_name}<br>Altitude: {sat_alt:.2f} km<br>Type: {sat_type}',
+                    tooltip=sat_name,
+                    icon=folium.Icon(color='red', icon='rocket', prefix='fa')
+                ).add_to(m)
+        
+        if marker_rows:
+            FastMarkerCluster(
+                data=marker_rows,
+                callback=SATELLITE_MARKER_CALLBACK,
+                name='Satellites'
             ).add_to(m)
     else:
         # Fallback: Just show ISS if no satellite list provided
-        folium.CircleMarker(
+        folium.Marker(
             location=[latitude, longitude],
-            radius=10,
             popup=f'ISS<br>Altitude: {altitude:.2f} km',
             tooltip='International Space Station',
-            color='red',
-            fill=True,
-            fillColor='red',
-            fillOpacity=0.8,
-            weight=2
+            icon=folium.Icon(color='red', icon='rocket', prefix='fa')
         ).add_to(m)
     
     # Add legend
@@ -887,25 +1561,41 @@ def create_map(
     return m
 
 
-def lat_lon_alt_to_xyz(latitude: float, longitude: float, altitude: float, earth_radius: float = 6371.0) -> tuple[float, float, float]:
+def lat_lon_alt_to_xyz(latitude, longitude, altitude):
     """
     Convert latitude, longitude, and altitude to 3D Cartesian coordinates (x, y, z).
     
+    Scalars take a plain ``math`` fast path; NumPy arrays are converted in one
+    vectorized pass.
+    
     Args:
-        latitude: Latitude in degrees (-90 to 90)
-        longitude: Longitude in degrees (-180 to 180)
-        altitude: Altitude in kilometers above sea level
-        earth_radius: Earth radius in kilometers (default: 6371 km)
+        latitude: Latitude in degrees (-90 to 90), scalar or array
+        longitude: Longitude in degrees (-180 to 180), scalar or array
+        altitude: Altitude in kilometers above sea level (added to EARTH_RADIUS_KM)
         
     Returns:
-        tuple: (x, y, z) coordinates in kilometers
+        tuple: (x, y, z) coordinates in kilometers for scalar input, or an
+            array of shape (..., 3) when any input is an array
     """
+    if any(isinstance(v, np.ndarray) for v in (latitude, longitude, altitude)):
+        lat, lon, alt = np.broadcast_arrays(
+            np.asarray(latitude, dtype=float),
+            np.asarray(longitude, dtype=float),
+            np.asarray(altitude, dtype=float)
+        )
+        xyz = spherical_to_cartesian(
+            np.ascontiguousarray(lat).ravel(),
+            np.ascontiguousarray(lon).ravel(),
+            EARTH_RADIUS_KM + alt.ravel()
+        )
+        return xyz.reshape(lat.shape + (3,))
+    
     # Convert degrees to radians
     lat_rad = math.radians(latitude)
     lon_rad = math.radians(longitude)
     
     # Calculate radius from Earth center (Earth radius + altitude)
-    r = earth_radius + altitude
+    r = EARTH_RADIUS_KM + altitude
     
     # Convert to Cartesian coordinates
     # x: points toward (0°N, 0°E) - intersection of equator and prime meridian
@@ -922,6 +1612,9 @@ def calculate_orbit_path(satellite, start_datetime, duration_minutes: int = 90,
     """
     Calculate ISS orbit path for the next N minutes.
     
+    All steps are propagated with a single Skyfield time array rather than
+    one ``satellite.at()`` call per point.
+    
     Args:
         satellite: Skyfield EarthSatellite object
         start_datetime: datetime object for start time
@@ -929,107 +1622,176 @@ def calculate_orbit_path(satellite, start_datetime, duration_minutes: int = 90,
         step_minutes: Time step between points (in minutes)
         
     Returns:
-        list: List of (x, y, z) tuples representing orbit path
+        np.ndarray: float32 array of shape (N, 3) with the x, y, z of each orbit
+            point (display-only, so it is stored at Plotly's precision)
+    """
+    ts = get_timescale()
+    
+    # One time array covering every step along the orbit
+    minutes = np.arange(0, duration_minutes + 1, step_minutes)
+    skyfield_times = ts.from_datetime(start_datetime) + minutes / DAY_MIN
+    
+    # Calculate all positions at once
+    geocentric = satellite.at(skyfield_times)
+    geo_position = wgs84.geographic_position_of(geocentric)
+    
+    # Convert to x, y, z
+    return lat_lon_alt_to_xyz(
+        geo_position.latitude.degrees,
+        geo_position.longitude.degrees,
+        geo_position.elevation.km
+    ).astype(np.float32)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_orbit_path(
+    _satellite,
+    satnum: int,
+    epoch: float,
+    step_index: int,
+    duration_minutes: int,
+    step_minutes: int
+) -> np.ndarray:
     """
-    from skyfield.api import load
+    Memoized calculate_orbit_path for a start time snapped to the step grid.
     
-    ts = load.timescale()
-    path_points = []
+    The satellite object itself is not hashed (leading underscore); its catalog
+    number and TLE epoch identify it instead, so a TLE refresh gives a new key.
     
-    # Calculate points along the orbit
-    for minutes in range(0, duration_minutes + 1, step_minutes):
-        # Calculate time for this point
-        future_time = start_datetime + timedelta(minutes=minutes)
-        skyfield_time = ts.from_datetime(future_time)
-        
-        # Calculate position at this time
-        geocentric = satellite.at(skyfield_time)
-        subpoint = geocentric.subpoint()
+    Args:
+        _satellite: Skyfield EarthSatellite object
+        satnum: Catalog number of the satellite
+        epoch: TLE epoch as a Julian date
+        step_index: Start time as a whole number of steps since the Unix epoch
+        duration_minutes: How many minutes into the future to calculate
+        step_minutes: Time step between points (in minutes)
         
-        # Convert to x, y, z
-        lat = subpoint.latitude.degrees
-        lon = subpoint.longitude.degrees
-        alt = subpoint.elevation.km
+    Returns:
+        np.ndarray: float32 array of shape (N, 3), as from calculate_orbit_path
+    """
+    start_datetime = datetime.fromtimestamp(step_index * step_minutes * 60, tz=timezone.utc)
+    return calculate_orbit_path(_satellite, start_datetime, duration_minutes, step_minutes)
+
+
+def get_orbit_path(satellite, current_time: datetime, duration_minutes: int = 90, step_minutes: int = 2) -> np.ndarray:
+    """
+    Orbit path from current_time to duration_minutes ahead.
+    
+    The cached path starts at the last step boundary at or before current_time
+    and runs one step longer, so time changes within one step (and every
+    live-mode rerun inside it) reuse it. Points outside the next
+    duration_minutes are trimmed and the satellite's current position is put
+    first, so the path never starts in the past.
+    
+    Args:
+        satellite: Skyfield EarthSatellite object
+        current_time: Current datetime object
+        duration_minutes: How many minutes into the future to calculate
+        step_minutes: Time step between points (in minutes)
         
-        x, y, z = lat_lon_alt_to_xyz(lat, lon, alt)
-        path_points.append((x, y, z))
+    Returns:
+        np.ndarray: float32 array of shape (N, 3), as from calculate_orbit_path
+    """
+    step_index = int(current_time.timestamp() // (step_minutes * 60))
+    model = satellite.model
+    path = cached_orbit_path(
+        satellite, model.satnum, model.jdsatepoch + model.jdsatepochF,
+        step_index, duration_minutes + step_minutes, step_minutes
+    )
     
-    return path_points
+    # Minutes from current_time to each cached point
+    offsets = np.arange(len(path)) * step_minutes - (current_time.timestamp() / 60 - step_index * step_minutes)
+    ahead = path[(offsets > 0) & (offsets <= duration_minutes)]
+    return np.concatenate([calculate_orbit_path(satellite, current_time, 0, step_minutes), ahead])
 
 
-def create_earth_sphere(earth_radius: float = 6371.0, resolution: int = 50):
+@st.cache_resource(show_spinner=False, max_entries=4)
+def create_earth_sphere(earth_radius: float = EARTH_RADIUS_KM, resolution: int = 50, add_noise: bool = True):
     """
     Create a 3D sphere representing Earth with realistic coloring.
     
+    The result is cached per argument set and the returned arrays are
+    read-only, since every caller shares the same copies.
+    
     Args:
         earth_radius: Earth radius in kilometers
         resolution: Number of points for sphere resolution
+        add_noise: If True, add a small fixed texture noise to the colors
+            (callers that ignore the colors can skip it)
         
     Returns:
-        tuple: (x, y, z, colors) arrays for sphere surface with color data
+        tuple: (x, y, z, colors) for the sphere surface. x, y, z are float32
+            (display-only, so they are built at WebGL's precision); colors is a
+            uint8 texture (0-255) for ``surfacecolor``, a quarter of the float32
+            payload with no visible difference through the colorscale
     """
-    # Create sphere using spherical coordinates
-    theta = np.linspace(0, 2 * np.pi, resolution)  # Longitude
-    phi = np.linspace(0, np.pi, resolution)       # Latitude
+    # Create sphere using spherical coordinates; phi is a column and theta a
+    # row so every product below broadcasts to (resolution, resolution)
+    # without materializing a meshgrid
+    theta = np.linspace(0, 2 * np.pi, resolution, dtype=np.float32)[None, :]  # Longitude
+    phi = np.linspace(0, np.pi, resolution, dtype=np.float32)[:, None]        # Latitude
     
-    theta, phi = np.meshgrid(theta, phi)
+    sin_phi = np.sin(phi)
     
     # Convert to Cartesian coordinates
-    x = earth_radius * np.sin(phi) * np.cos(theta)
-    y = earth_radius * np.sin(phi) * np.sin(theta)
-    z = earth_radius * np.cos(phi)
+    x = earth_radius * sin_phi * np.cos(theta)
+    y = earth_radius * sin_phi * np.sin(theta)
+    z = np.broadcast_to(earth_radius * np.cos(phi), x.shape)
     
     # Create realistic Earth coloring based on latitude/longitude patterns
     # This creates an approximation of Earth's appearance
-    colors = np.zeros_like(phi)
     
     # Convert phi to latitude (-90 to 90) and theta to longitude (-180 to 180)
     lat = 90 - np.degrees(phi)  # phi=0 is north pole, phi=pi is south pole
     lon = np.degrees(theta) - 180  # Center on prime meridian
     
-    # Base ocean color (value ~0.3 for blue)
-    colors[:] = 0.3
-    
-    # Approximate continental patterns
-    # North America (lat 25-70, lon -170 to -50)
-    na_mask = (lat > 25) & (lat < 70) & (lon > -170) & (lon < -50)
-    colors[na_mask] = 0.55
-    
-    # South America (lat -55 to 15, lon -80 to -35)
-    sa_mask = (lat > -55) & (lat < 15) & (lon > -80) & (lon < -35)
-    colors[sa_mask] = 0.5
-    
-    # Europe (lat 35-70, lon -10 to 40)
-    eu_mask = (lat > 35) & (lat < 70) & (lon > -10) & (lon < 40)
-    colors[eu_mask] = 0.55
-    
-    # Africa (lat -35 to 37, lon -20 to 55)
-    af_mask = (lat > -35) & (lat < 37) & (lon > -20) & (lon < 55)
-    colors[af_mask] = 0.6
-    
-    # Asia (lat 5-75, lon 40 to 180)
-    as_mask = (lat > 5) & (lat < 75) & (lon > 40) & (lon < 180)
-    colors[as_mask] = 0.55
+    # Approximate continental patterns. np.select takes the first matching
+    # region, so regions that should win on overlap are listed first.
+    regions = [
+        (lat > 75, 0.9),                                                  # Arctic ice
+        (lat < -60, 0.95),                                                # Antarctica
+        ((lat > -45) & (lat < -10) & (lon > 110) & (lon < 155), 0.6),     # Australia
+        ((lat > 5) & (lat < 75) & (lon > 40) & (lon < 180), 0.55),        # Asia
+        ((lat > -35) & (lat < 37) & (lon > -20) & (lon < 55), 0.6),       # Africa
+        ((lat > 35) & (lat < 70) & (lon > -10) & (lon < 40), 0.55),       # Europe
+        ((lat > -55) & (lat < 15) & (lon > -80) & (lon < -35), 0.5),      # South America
+        ((lat > 25) & (lat < 70) & (lon > -170) & (lon < -50), 0.55),     # North America
+    ]
+    masks = [np.broadcast_to(mask, x.shape) for mask, _ in regions]
     
-    # Australia (lat -45 to -10, lon 110 to 155)
-    au_mask = (lat > -45) & (lat < -10) & (lon > 110) & (lon < 155)
-    colors[au_mask] = 0.6
+    # Base ocean color (value ~0.3 for blue)
+    colors = np.select(masks, [value for _, value in regions], default=0.3).astype(np.float32)
     
-    # Antarctica (lat < -60)
-    ant_mask = lat < -60
-    colors[ant_mask] = 0.95
+    # Add some variation/noise for texture (fixed seed so the cache is stable)
+    if add_noise:
+        colors += np.random.default_rng(0).uniform(-0.05, 0.05, colors.shape)
+        np.clip(colors, 0, 1, out=colors)
     
-    # Arctic ice (lat > 75)
-    arc_mask = lat > 75
-    colors[arc_mask] = 0.9
+    # Quantize to an 8-bit texture; the colorscale is applied over the data
+    # range, so the mapping is unchanged up to 1/255 steps
+    colors = np.rint(colors * 255).astype(np.uint8)
     
-    # Add some variation/noise for texture
-    noise = np.random.uniform(-0.05, 0.05, colors.shape)
-    colors = np.clip(colors + noise, 0, 1)
+    for arr in (x, y, colors):
+        arr.setflags(write=False)
     
     return x, y, z, colors
 
 
+# Custom colorscale for realistic Earth rendering (constant, so built once)
+EARTH_COLORSCALE: Final[list] = [
+    [0.0, 'rgb(10, 30, 60)'],      # Deep ocean (dark blue)
+    [0.25, 'rgb(30, 80, 140)'],    # Ocean (medium blue)
+    [0.35, 'rgb(50, 120, 180)'],   # Shallow water (light blue)
+    [0.45, 'rgb(80, 120, 80)'],    # Coastal/lowland (green)
+    [0.55, 'rgb(100, 140, 80)'],   # Plains (light green)
+    [0.65, 'rgb(140, 130, 90)'],   # Highland (tan)
+    [0.75, 'rgb(120, 100, 70)'],   # Mountains (brown)
+    [0.85, 'rgb(180, 180, 180)'],  # Snow/high altitude (light gray)
+    [0.95, 'rgb(240, 245, 255)'],  # Ice caps (white)
+    [1.0, 'rgb(255, 255, 255)'],   # Bright ice (pure white)
+]
+
+
 def get_earth_colorscale():
     """
     Return a custom colorscale for realistic Earth rendering.
@@ -1037,18 +1799,104 @@ def get_earth_colorscale():
     Returns:
         list: Plotly colorscale for Earth visualization
     """
-    return [
-        [0.0, 'rgb(10, 30, 60)'],      # Deep ocean (dark blue)
-        [0.25, 'rgb(30, 80, 140)'],    # Ocean (medium blue)
-        [0.35, 'rgb(50, 120, 180)'],   # Shallow water (light blue)
-        [0.45, 'rgb(80, 120, 80)'],    # Coastal/lowland (green)
-        [0.55, 'rgb(100, 140, 80)'],   # Plains (light green)
-        [0.65, 'rgb(140, 130, 90)'],   # Highland (tan)
-        [0.75, 'rgb(120, 100, 70)'],   # Mountains (brown)
-        [0.85, 'rgb(180, 180, 180)'],  # Snow/high altitude (light gray)
-        [0.95, 'rgb(240, 245, 255)'],  # Ice caps (white)
-        [1.0, 'rgb(255, 255, 255)'],   # Bright ice (pure white)
-    ]
+    return EARTH_COLORSCALE
+
+
+def dark_scene_layout(axis_range: float, camera_eye: dict) -> dict:
+    """
+    Build the dark, axis-free 3D scene layout shared by both 3D views.
+    
+    Args:
+        axis_range: Half-width of each axis range in kilometers
+        camera_eye: Plotly camera eye position, e.g. dict(x=2.0, y=2.0, z=1.5)
+        
+    Returns:
+        dict: Value for the ``scene`` argument of ``fig.update_layout``
+    
+    The scene has a constant ``uirevision``, so when a rerun sends a new figure
+    Plotly updates the data in place and keeps the user's rotation and zoom
+    instead of snapping back to ``camera_eye``.
+    """
+    axis = dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117')
+    return dict(
+        xaxis=axis,
+        yaxis=axis,
+        zaxis=axis,
+        aspectmode='cube',
+        camera=dict(
+            eye=camera_eye,
+            center=dict(x=0, y=0, z=0),
+            up=dict(x=0, y=0, z=1)
+        ),
+        bgcolor='#0e1117',
+        uirevision='satwatch-3d'
+    )
+
+
+def iss_marker_trace(
+    iss_xyz: tuple,
+    iss_hover: str,
+    size: float,
+    line_width: float,
+    show_label: bool = False,
+    background: Optional[dict] = None
+) -> go.Scatter3d:
+    """
+    Build the ISS marker trace, optionally sharing it with a background point layer.
+    
+    Merging the ISS with the orbital shell or nearby objects keeps one marker
+    trace (and one hover pick buffer) instead of two; each point is styled
+    through per-point size and color arrays.
+    
+    Args:
+        iss_xyz: ISS (x, y, z) in kilometers
+        iss_hover: Hover text for the ISS point
+        size: ISS marker size
+        line_width: Marker outline width (outlines are transparent for background points)
+        show_label: If True, draw an "ISS" text label next to the marker
+        background: Optional dict with 'x', 'y', 'z', 'hover' (sequences) and
+            'size', 'color', 'name' for the background points
+        
+    Returns:
+        go.Scatter3d: Marker trace with the background points first and the ISS last
+    """
+    xs, ys, zs = [iss_xyz[0]], [iss_xyz[1]], [iss_xyz[2]]
+    sizes = [size]
+    colors = ['red']
+    line_colors = ['darkred']
+    hovers = [iss_hover]
+    labels = ['ISS']
+    name = 'ISS Current Position'
+    
+    if background is not None and len(background['x']):
+        n = len(background['x'])
+        xs = np.concatenate([background['x'], xs])
+        ys = np.concatenate([background['y'], ys])
+        zs = np.concatenate([background['z'], zs])
+        sizes = [background['size']] * n + sizes
+        colors = [background['color']] * n + colors
+        line_colors = ['rgba(0, 0, 0, 0)'] * n + line_colors
+        hovers = list(background['hover']) + hovers
+        labels = [''] * n + labels
+        name = f"ISS + {background['name']}"
+    
+    return go.Scatter3d(
+        x=to_display_array(xs),
+        y=to_display_array(ys),
+        z=to_display_array(zs),
+        mode='markers+text' if show_label else 'markers',
+        marker=dict(
+            size=sizes,
+            color=colors,
+            symbol='circle',
+            line=dict(width=line_width, color=line_colors)
+        ),
+        text=labels if show_label else None,
+        textposition='top center' if show_label else None,
+        name=name,
+        hovertemplate='%{customdata}<extra></extra>',
+        customdata=hovers
+    )
 
 
 def create_3d_tracked_satellites_plot(
@@ -1063,7 +1911,8 @@ def create_3d_tracked_satellites_plot(
     proximity_radius_km: float = 1000.0,
     focus_mode: bool = False,
     conjunction_results: dict = None,
-    satellite_visibility: dict = None
+    satellite_visibility: dict = None,
+    tracked_positions: SatPositions = None
 ):
     """
     Create a 3D Plotly plot showing Earth, ISS, and tracked satellites with color coding.
@@ -1088,158 +1937,130 @@ def create_3d_tracked_satellites_plot(
         show_debris: If True, show debris
         proximity_radius_km: Radius in km around ISS to show other objects
         focus_mode: If True, show tracked satellites prominently with nearby objects as secondary
+        tracked_positions: Positions of tracked_satellites at current_time when
+            the caller already has them; calculated here when None
         
     Returns:
         tuple: (plotly.graph_objects.Figure, int, int, int) - (figure, shown_count, total_count, nearby_count)
     """
-    earth_radius = 6371.0  # km
-    
     # Convert ISS position to x, y, z
     iss_x, iss_y, iss_z = lat_lon_alt_to_xyz(
         iss_position['latitude'],
         iss_position['longitude'],
-        iss_position['altitude'],
-        earth_radius
+        iss_position['altitude']
     )
     iss_pos_3d = (iss_x, iss_y, iss_z)
     
     # Calculate ISS orbit path for next 90 minutes
-    orbit_path = calculate_orbit_path(iss_satellite, current_time, duration_minutes=90, step_minutes=2)
+    orbit_path = get_orbit_path(iss_satellite, current_time, duration_minutes=90, step_minutes=2)
     
     # Create Earth sphere with realistic colors
-    earth_x, earth_y, earth_z, earth_colors = create_earth_sphere(earth_radius, resolution=80)
-    
-    # Calculate positions for all tracked satellites
-    all_sat_positions = calculate_tracked_satellite_positions(
-        tracked_satellites, 
-        satellites_tle_data, 
-        current_time
-    )
+    earth_x, earth_y, earth_z, earth_colors = create_earth_sphere(EARTH_RADIUS_KM, resolution=80)
+    
+    # Calculate positions for all tracked satellites (unless the caller passed them in)
+    all_sat_positions = tracked_positions
+    if all_sat_positions is None:
+        all_sat_positions = get_tracked_satellite_positions(
+            tracked_satellites, 
+            satellites_tle_data, 
+            current_time
+        )
     
-    # Get tracked satellite catalog numbers for focus mode
+    # Get tracked satellite catalog numbers (nearby objects skip these in focus mode)
     tracked_catnrs = {sat['catnr'] for sat in tracked_satellites}
     
-    # In focus mode, calculate positions of all tracked satellites for proximity checks
-    tracked_sat_positions_3d = {}
-    if focus_mode:
-        # Calculate 3D positions for all tracked satellites
-        for x, y, z, name, alt, sat_type, catnr, lat, lon in all_sat_positions:
-            if not (math.isnan(x) or math.isnan(y) or math.isnan(z)):
-                tracked_sat_positions_3d[catnr] = (x, y, z)
+    # Positions of all tracked satellites, used for proximity checks
+    tracked_sat_xyz = all_sat_positions.xyz
     
-    # Filter satellites by type and proximity
+    # Filter satellites by type and proximity with column masks
     # Primary: tracked satellites (in focus mode) or all (in normal mode)
-    primary_stations_data = {'x': [], 'y': [], 'z': [], 'names': [], 'catnrs': []}
-    primary_satellites_data = {'x': [], 'y': [], 'z': [], 'names': [], 'catnrs': []}
-    primary_debris_data = {'x': [], 'y': [], 'z': [], 'names': [], 'catnrs': []}
     
     # Secondary: nearby objects (only in focus mode)
     secondary_data = {'x': [], 'y': [], 'z': [], 'names': []}
     
     # Total count should be based on configured satellites, not just successfully calculated ones
     total_count = len(tracked_satellites)
-    shown_count = 0
     nearby_count = 0
     
-    for x, y, z, name, alt, sat_type, catnr, lat, lon in all_sat_positions:
-        if math.isnan(x) or math.isnan(y) or math.isnan(z):
-            continue
-        
-        # Check visibility - skip if satellite is hidden
-        if satellite_visibility and catnr in satellite_visibility:
-            if not satellite_visibility[catnr]:
-                continue
-        
-        is_tracked = catnr in tracked_catnrs
-        
-        if focus_mode:
-            # Focus mode: Show tracked satellites as primary, nearby objects as secondary
-            if is_tracked:
-                # This is a tracked satellite - show as primary
-                shown_count += 1
-                hover_text = f"{name}<br>Alt: {alt:.0f} km<br>Type: {sat_type}"
-                
-                if sat_type == 'station' and show_stations:
-                    primary_stations_data['x'].append(x)
-                    primary_stations_data['y'].append(y)
-                    primary_stations_data['z'].append(z)
-                    primary_stations_data['names'].append(hover_text)
-                    primary_stations_data['catnrs'].append(catnr)
-                elif sat_type == 'satellite' and show_satellites:
-                    primary_satellites_data['x'].append(x)
-                    primary_satellites_data['y'].append(y)
-                    primary_satellites_data['z'].append(z)
-                    primary_satellites_data['names'].append(hover_text)
-                    primary_satellites_data['catnrs'].append(catnr)
-                elif sat_type == 'debris' and show_debris:
-                    primary_debris_data['x'].append(x)
-                    primary_debris_data['y'].append(y)
-                    primary_debris_data['z'].append(z)
-                    primary_debris_data['names'].append(hover_text)
-                    primary_debris_data['catnrs'].append(catnr)
-            # Skip tracked satellites in this loop (they're handled above)
-            # This loop only processes tracked satellites from all_sat_positions
-        else:
-            # Normal mode: Show all objects within proximity of ISS
-            distance = calculate_distance_3d(iss_pos_3d, (x, y, z))
-            
-            if distance <= proximity_radius_km:
-                shown_count += 1
-                
-                # Skip ISS itself (we'll show it separately)
-                if catnr == 25544:
-                    continue
-                
-                hover_text = f"{name}<br>Alt: {alt:.0f} km<br>Distance from ISS: {distance:.0f} km"
-                
-                if sat_type == 'station' and show_stations:
-                    primary_stations_data['x'].append(x)
-                    primary_stations_data['y'].append(y)
-                    primary_stations_data['z'].append(z)
-                    primary_stations_data['names'].append(hover_text)
-                    primary_stations_data['catnrs'].append(catnr)
-                elif sat_type == 'satellite' and show_satellites:
-                    primary_satellites_data['x'].append(x)
-                    primary_satellites_data['y'].append(y)
-                    primary_satellites_data['z'].append(z)
-                    primary_satellites_data['names'].append(hover_text)
-                    primary_satellites_data['catnrs'].append(catnr)
-                elif sat_type == 'debris' and show_debris:
-                    primary_debris_data['x'].append(x)
-                    primary_debris_data['y'].append(y)
-                    primary_debris_data['z'].append(z)
-                    primary_debris_data['names'].append(hover_text)
-                    primary_debris_data['catnrs'].append(catnr)
+    # Check visibility - hidden satellites are masked out
+    hidden_catnrs = [catnr for catnr, is_visible in (satellite_visibility or {}).items() if not is_visible]
+    visible = ~np.isin(all_sat_positions.catnr, hidden_catnrs)
+    
+    # Hover texts are only built for the rows that end up on the plot
+    hover_texts = np.empty(len(all_sat_positions), dtype=object)
+    
+    if focus_mode:
+        # Focus mode: Show tracked satellites as primary, nearby objects as secondary.
+        # Every row of all_sat_positions is a tracked satellite by construction.
+        shown = visible
+        shown_count = int(shown.sum())
+        shown_idx = np.flatnonzero(shown)
+        hover_texts[shown_idx] = [
+            f"{all_sat_positions.names[i]}<br>Alt: {alt:.0f} km<br>Type: {sat_type}"
+            for i, alt, sat_type in zip(
+                shown_idx.tolist(), all_sat_positions.alt[shown_idx].tolist(), all_sat_positions.types[shown_idx].tolist()
+            )
+        ]
+    else:
+        # Normal mode: Show all objects within proximity of ISS
+        distances = np.linalg.norm(tracked_sat_xyz - np.array(iss_pos_3d), axis=1)
+        shown = visible & (distances <= proximity_radius_km)
+        shown_count = int(shown.sum())
+        
+        # Skip ISS itself (we'll show it separately)
+        shown &= all_sat_positions.catnr != 25544
+        shown_idx = np.flatnonzero(shown)
+        hover_texts[shown_idx] = [
+            f"{all_sat_positions.names[i]}<br>Alt: {alt:.0f} km<br>Distance from ISS: {distance:.0f} km"
+            for i, alt, distance in zip(
+                shown_idx.tolist(), all_sat_positions.alt[shown_idx].tolist(), distances[shown_idx].tolist()
+            )
+        ]
+    
+    primary_stations_mask = shown & (all_sat_positions.types == 'station') & show_stations
+    primary_satellites_mask = shown & (all_sat_positions.types == 'satellite') & show_satellites
+    primary_debris_mask = shown & (all_sat_positions.types == 'debris') & show_debris
+    
+    # Hover texts start with the satellite name, so the on-plot labels in focus
+    # mode come straight from each bucket's names column
+    primary_stations = all_sat_positions.select(primary_stations_mask)
+    primary_stations_names = hover_texts[primary_stations_mask]
+    primary_satellites = all_sat_positions.select(primary_satellites_mask)
+    primary_satellites_names = hover_texts[primary_satellites_mask].tolist()
+    primary_debris = all_sat_positions.select(primary_debris_mask)
+    primary_debris_names = hover_texts[primary_debris_mask].tolist()
     
     # In focus mode, fetch and process nearby objects from CelesTrak
-    if focus_mode and tracked_sat_positions_3d:
+    if focus_mode and len(tracked_sat_xyz):
         try:
             # Fetch additional satellites from CelesTrak for nearby objects
             nearby_satellites_data = download_multiple_satellites(group='active', limit=300)
-            nearby_objects_positions = calculate_satellite_positions(nearby_satellites_data, current_time)
+            nearby_objects = calculate_satellite_positions(nearby_satellites_data, current_time)
             
-            # Filter to only show objects near tracked satellites
-            for x, y, z, name, alt, catnr in nearby_objects_positions:
-                if catnr in tracked_catnrs:
-                    continue  # Skip tracked satellites
-                
-                if math.isnan(x) or math.isnan(y) or math.isnan(z):
-                    continue
+            # Skip tracked satellites
+            nearby_objects = nearby_objects.select(~np.isin(nearby_objects.catnr, list(tracked_catnrs)))
+            
+            if len(nearby_objects):
+                nearby_xyz = nearby_objects.xyz
                 
-                # Check distance to nearest tracked satellite
-                min_distance = float('inf')
-                for tracked_pos in tracked_sat_positions_3d.values():
-                    distance = calculate_distance_3d(tracked_pos, (x, y, z))
-                    min_distance = min(min_distance, distance)
+                # Radius check against every tracked satellite on squared
+                # distances; NaN positions never pass and drop out here
+                near_mask = any_within_radius(nearby_xyz, tracked_sat_xyz, proximity_radius_km)
+                nearby_count = int(near_mask.sum())
                 
-                if min_distance <= proximity_radius_km:
-                    # Nearby object - show as secondary
-                    nearby_count += 1
-                    hover_text = f"{name}<br>Alt: {alt:.0f} km<br>Distance: {min_distance:.0f} km"
-                    secondary_data['x'].append(x)
-                    secondary_data['y'].append(y)
-                    secondary_data['z'].append(z)
-                    secondary_data['names'].append(hover_text)
+                # Nearby objects - show as secondary; distances and labels are
+                # only built for the rows that passed the radius check
+                near_objects = nearby_objects.select(near_mask)
+                min_distances = pairwise_min_distance(nearby_xyz[near_mask], tracked_sat_xyz)
+                secondary_data['x'] = near_objects.x
+                secondary_data['y'] = near_objects.y
+                secondary_data['z'] = near_objects.z
+                secondary_data['names'] = [
+                    f"{name}<br>Alt: {alt:.0f} km<br>Distance: {distance:.0f} km"
+                    for name, alt, distance in zip(
+                        near_objects.names, near_objects.alt.tolist(), min_distances.tolist()
+                    )
+                ]
         except Exception:
             # If fetching nearby objects fails, continue without them
             pass
@@ -1268,10 +2089,8 @@ def create_3d_tracked_satellites_plot(
     ))
     
     # Add ISS orbit path
-    if orbit_path:
-        path_x = [p[0] for p in orbit_path]
-        path_y = [p[1] for p in orbit_path]
-        path_z = [p[2] for p in orbit_path]
+    if len(orbit_path):
+        path_x, path_y, path_z = orbit_path.T
         
         fig.add_trace(go.Scatter3d(
             x=path_x,
@@ -1288,6 +2107,19 @@ def create_3d_tracked_satellites_plot(
     conjunction_pairs = []  # List of (sat1_catnr, sat2_catnr, risk_level, distance)
     
     if conjunction_results and 'results' in conjunction_results:
+        # Exact name lookups first; substring matching is only the fallback
+        name_to_catnr = {sat['name']: sat['catnr'] for sat in tracked_satellites}
+        
+        def find_catnr(conjunction_name):
+            catnr = name_to_catnr.get(conjunction_name)
+            if catnr is None:
+                catnr = next(
+                    (c for n, c in reversed(name_to_catnr.items())
+                     if n in conjunction_name or conjunction_name in n),
+                    None
+                )
+            return catnr
+        
         for result in conjunction_results['results']:
             sat1_name = result.get('sat1_name', '')
             sat2_name = result.get('sat2_name', '')
@@ -1295,20 +2127,14 @@ def create_3d_tracked_satellites_plot(
             distance = result.get('min_distance_km', 0)
             
             # Find catalog numbers for these satellites
-            sat1_catnr = None
-            sat2_catnr = None
-            for sat in tracked_satellites:
-                if sat['name'] in sat1_name or sat1_name in sat['name']:
-                    sat1_catnr = sat['catnr']
-                if sat['name'] in sat2_name or sat2_name in sat['name']:
-                    sat2_catnr = sat['catnr']
+            sat1_catnr = find_catnr(sat1_name)
+            sat2_catnr = find_catnr(sat2_name)
             
             if sat1_catnr and sat2_catnr:
                 # Update risk map
                 for catnr in [sat1_catnr, sat2_catnr]:
                     current_risk = risk_map.get(catnr, 'NORMAL')
-                    risk_priority = {'CRITICAL': 2, 'HIGH RISK': 1, 'NORMAL': 0}
-                    if risk_priority.get(risk_level, 0) > risk_priority.get(current_risk, 0):
+                    if RISK_PRIORITY.get(risk_level, 0) > RISK_PRIORITY.get(current_risk, 0):
                         risk_map[catnr] = risk_level
                 
                 # Store conjunction pair
@@ -1328,131 +2154,63 @@ def create_3d_tracked_satellites_plot(
         secondary_marker_size = 4
         secondary_opacity = 0.5
     
-    # Helper function to get marker color and glow based on risk
-    def get_marker_style(catnr, base_color, base_size):
-        risk = risk_map.get(catnr, 'NORMAL')
-        if risk == 'CRITICAL':
-            # Red pulsing glow effect (larger size, red color)
-            return {
-                'size': base_size * 1.5,
-                'color': 'red',
-                'symbol': 'circle',
-                'line': dict(width=primary_line_width * 2, color='darkred'),
-                'opacity': 1.0
-            }
-        elif risk == 'HIGH RISK':
-            # Orange highlight
-            return {
-                'size': base_size * 1.2,
-                'color': 'orange',
-                'symbol': 'circle',
-                'line': dict(width=primary_line_width * 1.5, color='darkorange'),
-                'opacity': 1.0
-            }
-        else:
-            return {
-                'size': base_size,
-                'color': base_color,
-                'symbol': 'circle',
-                'line': dict(width=primary_line_width, color=f'dark{base_color}' if base_color != 'gray' else 'darkgray'),
-                'opacity': 1.0
-            }
-    
     # Add primary stations (red) - tracked satellites in focus mode, or all in normal mode
-    # Separate by risk level for different styling
-    if primary_stations_data['x']:
-        # Group by risk level
-        critical_stations = {'x': [], 'y': [], 'z': [], 'names': []}
-        high_risk_stations = {'x': [], 'y': [], 'z': [], 'names': []}
-        normal_stations = {'x': [], 'y': [], 'z': [], 'names': []}
-        
-        for i, catnr in enumerate(primary_stations_data['catnrs']):
-            risk = risk_map.get(catnr, 'NORMAL')
-            if risk == 'CRITICAL':
-                critical_stations['x'].append(primary_stations_data['x'][i])
-                critical_stations['y'].append(primary_stations_data['y'][i])
-                critical_stations['z'].append(primary_stations_data['z'][i])
-                critical_stations['names'].append(primary_stations_data['names'][i])
-            elif risk == 'HIGH RISK':
-                high_risk_stations['x'].append(primary_stations_data['x'][i])
-                high_risk_stations['y'].append(primary_stations_data['y'][i])
-                high_risk_stations['z'].append(primary_stations_data['z'][i])
-                high_risk_stations['names'].append(primary_stations_data['names'][i])
-            else:
-                normal_stations['x'].append(primary_stations_data['x'][i])
-                normal_stations['y'].append(primary_stations_data['y'][i])
-                normal_stations['z'].append(primary_stations_data['z'][i])
-                normal_stations['names'].append(primary_stations_data['names'][i])
-        
-        # Add CRITICAL risk stations (red, larger, pulsing effect)
-        if critical_stations['x']:
-            fig.add_trace(go.Scatter3d(
-                x=critical_stations['x'],
-                y=critical_stations['y'],
-                z=critical_stations['z'],
-                mode='markers+text' if focus_mode else 'markers',
-                marker=dict(
-                    size=primary_marker_size * 1.5,
-                    color='red',
-                    symbol='circle',
-                    line=dict(width=primary_line_width * 2, color='darkred'),
-                    opacity=1.0
-                ),
-                text=[name.split('<br>')[0] for name in critical_stations['names']] if focus_mode else None,
-                textposition='top center' if focus_mode else None,
-                name='🚨 CRITICAL RISK Stations',
-                hovertemplate='%{customdata[0]}<extra></extra>',
-                customdata=[[name] for name in critical_stations['names']]
-            ))
+    # One trace; risk level is encoded per point in marker size and color
+    if len(primary_stations):
+        station_risks = np.array(
+            [RISK_PRIORITY.get(risk_map.get(catnr, 'NORMAL'), 0) for catnr in primary_stations.catnr.tolist()]
+        )
+        # CRITICAL: red, larger (pulsing effect); HIGH RISK: orange, larger; otherwise red
+        station_sizes = np.select(
+            [station_risks == 2, station_risks == 1],
+            [primary_marker_size * 1.5, primary_marker_size * 1.2],
+            default=primary_marker_size
+        )
+        station_colors = np.where(station_risks == 1, 'orange', 'red').tolist()
+        station_line_colors = np.where(station_risks == 1, 'darkorange', 'darkred').tolist()
+        station_names = primary_stations_names.tolist()
         
-        # Add HIGH RISK stations (orange, larger)
-        if high_risk_stations['x']:
-            fig.add_trace(go.Scatter3d(
-                x=high_risk_stations['x'],
-                y=high_risk_stations['y'],
-                z=high_risk_stations['z'],
-                mode='markers+text' if focus_mode else 'markers',
-                marker=dict(
-                    size=primary_marker_size * 1.2,
-                    color='orange',
-                    symbol='circle',
-                    line=dict(width=primary_line_width * 1.5, color='darkorange'),
-                    opacity=1.0
-                ),
-                text=[name.split('<br>')[0] for name in high_risk_stations['names']] if focus_mode else None,
-                textposition='top center' if focus_mode else None,
-                name='⚠️ HIGH RISK Stations',
-                hovertemplate='%{customdata[0]}<extra></extra>',
-                customdata=[[name] for name in high_risk_stations['names']]
-            ))
+        fig.add_trace(go.Scatter3d(
+            x=to_display_array(primary_stations.x),
+            y=to_display_array(primary_stations.y),
+            z=to_display_array(primary_stations.z),
+            mode='markers+text' if focus_mode else 'markers',
+            marker=dict(
+                size=station_sizes,
+                color=station_colors,
+                symbol='circle',
+                line=dict(width=primary_line_width, color=station_line_colors),
+                opacity=1.0
+            ),
+            text=primary_stations.names if focus_mode else None,
+            textposition='top center' if focus_mode else None,
+            name='My Stations' if focus_mode else 'Stations',
+            legendgroup='stations',
+            hovertemplate='%{customdata[0]}<extra></extra>',
+            customdata=[[name] for name in station_names]
+        ))
         
-        # Add normal stations
-        if normal_stations['x']:
-            fig.add_trace(go.Scatter3d(
-                x=normal_stations['x'],
-                y=normal_stations['y'],
-                z=normal_stations['z'],
-                mode='markers+text' if focus_mode else 'markers',
-                marker=dict(
-                    size=primary_marker_size,
-                    color='red',
-                    symbol='circle',
-                    line=dict(width=primary_line_width, color='darkred'),
-                    opacity=1.0
-                ),
-                text=[name.split('<br>')[0] for name in normal_stations['names']] if focus_mode else None,
-                textposition='top center' if focus_mode else None,
-                name='My Stations' if focus_mode else 'Stations',
-                hovertemplate='%{customdata[0]}<extra></extra>',
-                customdata=[[name] for name in normal_stations['names']]
-            ))
+        # Legend-only entries for the risk styles present in the merged trace
+        for priority, legend_name, color, line_color, size in (
+            (2, '🚨 CRITICAL RISK Stations', 'red', 'darkred', primary_marker_size * 1.5),
+            (1, '⚠️ HIGH RISK Stations', 'orange', 'darkorange', primary_marker_size * 1.2),
+        ):
+            if (station_risks == priority).any():
+                fig.add_trace(go.Scatter3d(
+                    x=[None], y=[None], z=[None],
+                    mode='markers',
+                    marker=dict(size=size, color=color, symbol='circle', line=dict(width=primary_line_width, color=line_color)),
+                    name=legend_name,
+                    legendgroup='stations',
+                    hoverinfo='skip'
+                ))
     
     # Add primary satellites (blue)
-    if primary_satellites_data['x']:
+    if len(primary_satellites):
         fig.add_trace(go.Scatter3d(
-            x=primary_satellites_data['x'],
-            y=primary_satellites_data['y'],
-            z=primary_satellites_data['z'],
+            x=to_display_array(primary_satellites.x),
+            y=to_display_array(primary_satellites.y),
+            z=to_display_array(primary_satellites.z),
             mode='markers+text' if focus_mode else 'markers',
             marker=dict(
                 size=primary_marker_size if focus_mode else 6,
@@ -1461,19 +2219,19 @@ def create_3d_tracked_satellites_plot(
                 line=dict(width=primary_line_width, color='darkblue'),
                 opacity=1.0
             ),
-            text=[name.split('<br>')[0] for name in primary_satellites_data['names']] if focus_mode else None,
+            text=primary_satellites.names if focus_mode else None,
             textposition='top center' if focus_mode else None,
             name='My Satellites' if focus_mode else 'Satellites',
             hovertemplate='%{customdata[0]}<extra></extra>',
-            customdata=[[name] for name in primary_satellites_data['names']]
+            customdata=[[name] for name in primary_satellites_names]
         ))
     
     # Add primary debris (orange)
-    if primary_debris_data['x']:
+    if len(primary_debris):
         fig.add_trace(go.Scatter3d(
-            x=primary_debris_data['x'],
-            y=primary_debris_data['y'],
-            z=primary_debris_data['z'],
+            x=to_display_array(primary_debris.x),
+            y=to_display_array(primary_debris.y),
+            z=to_display_array(primary_debris.z),
             mode='markers+text' if focus_mode else 'markers',
             marker=dict(
                 size=primary_marker_size if focus_mode else 5,
@@ -1482,106 +2240,96 @@ def create_3d_tracked_satellites_plot(
                 line=dict(width=primary_line_width, color='darkorange'),
                 opacity=1.0
             ),
-            text=[name.split('<br>')[0] for name in primary_debris_data['names']] if focus_mode else None,
+            text=primary_debris.names if focus_mode else None,
             textposition='top center' if focus_mode else None,
             name='My Debris' if focus_mode else 'Debris',
             hovertemplate='%{customdata[0]}<extra></extra>',
-            customdata=[[name] for name in primary_debris_data['names']]
-        ))
-    
-    # Add secondary objects (nearby objects in focus mode)
-    if focus_mode and secondary_data['x']:
-        fig.add_trace(go.Scatter3d(
-            x=secondary_data['x'],
-            y=secondary_data['y'],
-            z=secondary_data['z'],
-            mode='markers',
-            marker=dict(
-                size=secondary_marker_size,
-                color='gray',
-                symbol='circle',
-                line=dict(width=0.5, color='darkgray'),
-                opacity=secondary_opacity
-            ),
-            name='Nearby Objects',
-            hovertemplate='%{customdata[0]}<extra></extra>',
-            customdata=[[name] for name in secondary_data['names']]
+            customdata=[[name] for name in primary_debris_names]
         ))
     
-    # Add ISS current position (red, larger and more prominent)
+    # Add ISS current position (red, larger and more prominent), sharing one
+    # trace with the secondary objects (nearby objects in focus mode)
     # In focus mode, show with label; in normal mode, just marker
-    iss_marker_size = 14 if focus_mode else 12
-    fig.add_trace(go.Scatter3d(
-        x=[iss_x],
-        y=[iss_y],
-        z=[iss_z],
-        mode='markers+text' if focus_mode else 'markers',
-        marker=dict(
-            size=iss_marker_size,
-            color='red',
-            symbol='circle',
-            line=dict(width=3 if focus_mode else 2, color='darkred')
-        ),
-        text=['ISS'] if focus_mode else None,
-        textposition='top center' if focus_mode else None,
-        name='ISS Current Position',
-        hovertemplate=f'ISS<br>Lat: {iss_position["latitude"]:.2f}°<br>Lon: {iss_position["longitude"]:.2f}°<br>Alt: {iss_position["altitude"]:.2f} km<extra></extra>'
+    nearby_layer = None
+    if focus_mode and len(secondary_data['x']):
+        nearby_layer = {
+            'x': secondary_data['x'],
+            'y': secondary_data['y'],
+            'z': secondary_data['z'],
+            'hover': secondary_data['names'],
+            'size': secondary_marker_size,
+            'color': f'rgba(128, 128, 128, {secondary_opacity})',
+            'name': 'Nearby Objects'
+        }
+    fig.add_trace(iss_marker_trace(
+        iss_pos_3d,
+        f'ISS<br>Lat: {iss_position["latitude"]:.2f}°<br>Lon: {iss_position["longitude"]:.2f}°<br>Alt: {iss_position["altitude"]:.2f} km',
+        size=14 if focus_mode else 12,
+        line_width=3 if focus_mode else 2,
+        show_label=focus_mode,
+        background=nearby_layer
     ))
     
     # Add conjunction lines between pairs
-    if conjunction_pairs and all_sat_positions:
-        # Build position map
-        pos_map = {}
-        for sat_pos in all_sat_positions:
-            x, y, z, name, alt, sat_type, catnr, lat, lon = sat_pos
-            if not (math.isnan(x) or math.isnan(y) or math.isnan(z)):
-                pos_map[catnr] = (x, y, z)
-        
-        # Draw lines for each conjunction pair
+    if conjunction_pairs and len(all_sat_positions) > 0:
+        # Row index of each tracked satellite (rows with invalid positions were
+        # already dropped by calculate_tracked_satellite_positions)
+        idx_of = all_sat_positions.row_by_catnr
+        
+        # Group the endpoint row indices per risk level
+        pairs_by_risk = {}
         for sat1_catnr, sat2_catnr, risk_level, distance in conjunction_pairs:
-            if sat1_catnr in pos_map and sat2_catnr in pos_map:
-                pos1 = pos_map[sat1_catnr]
-                pos2 = pos_map[sat2_catnr]
-                
-                # Determine line color based on risk
-                if risk_level == 'CRITICAL':
-                    line_color = 'red'
-                    line_width = 3
-                elif risk_level == 'HIGH RISK':
-                    line_color = 'orange'
-                    line_width = 2
-                else:
-                    line_color = 'yellow'
-                    line_width = 1
-                
-                fig.add_trace(go.Scatter3d(
-                    x=[pos1[0], pos2[0]],
-                    y=[pos1[1], pos2[1]],
-                    z=[pos1[2], pos2[2]],
-                    mode='lines',
-                    line=dict(color=line_color, width=line_width, dash='dash'),
-                    name=f'Conjunction: {risk_level}',
-                    showlegend=False,
-                    hovertemplate=f'{risk_level} Risk<br>Distance: {distance:.3f} km<extra></extra>'
-                ))
+            i = idx_of.get(sat1_catnr)
+            j = idx_of.get(sat2_catnr)
+            if i is not None and j is not None:
+                pairs_by_risk.setdefault(risk_level, []).append((i, j, distance))
+        
+        # Gather the line segments per risk level in one indexing pass; a NaN
+        # row breaks the line between segments so each risk level is one trace
+        segments_by_risk = {}
+        for risk_level, pairs in pairs_by_risk.items():
+            first, second, distances = (np.array(column) for column in zip(*pairs))
+            gap = np.full((len(pairs), 3), np.nan)
+            points = np.stack([tracked_sat_xyz[first], tracked_sat_xyz[second], gap], axis=1).reshape(-1, 3)
+            segments_by_risk[risk_level] = {
+                'x': to_display_array(points[:, 0]),
+                'y': to_display_array(points[:, 1]),
+                'z': to_display_array(points[:, 2]),
+                'distances': np.column_stack([distances, distances, np.full(len(pairs), np.nan)]).ravel()
+            }
+        
+        # Draw one dashed trace per risk level
+        for risk_level, segments in segments_by_risk.items():
+            # Determine line color based on risk
+            if risk_level == 'CRITICAL':
+                line_color = 'red'
+                line_width = 3
+            elif risk_level == 'HIGH RISK':
+                line_color = 'orange'
+                line_width = 2
+            else:
+                line_color = 'yellow'
+                line_width = 1
+            
+            fig.add_trace(go.Scatter3d(
+                x=segments['x'],
+                y=segments['y'],
+                z=segments['z'],
+                mode='lines',
+                line=dict(color=line_color, width=line_width, dash='dash'),
+                name=f'Conjunction: {risk_level}',
+                showlegend=False,
+                customdata=segments['distances'],
+                hovertemplate=f'{risk_level} Risk<br>Distance: %{{customdata:.3f}} km<extra></extra>'
+            ))
     
     # Set camera angle and layout
     # Use a reasonable range that shows Earth and satellites clearly
     axis_range = max(20000, proximity_radius_km * 2)  # Ensure Earth (6371 km) is visible
     
     fig.update_layout(
-        scene=dict(
-            xaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            yaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            zaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            aspectmode='cube',
-            camera=dict(
-                eye=dict(x=0.35, y=0.35, z=0.3),  # Maximized Earth view for demo
-                center=dict(x=0, y=0, z=0),
-                up=dict(x=0, y=0, z=1)
-            ),
-            bgcolor='#0e1117'
-        ),
+        # Maximized Earth view for demo
+        scene=dark_scene_layout(axis_range, camera_eye=dict(x=0.35, y=0.35, z=0.3)),
         title=None,
         height=700,
         margin=dict(l=0, r=0, t=50, b=0),
@@ -1608,25 +2356,18 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
     Returns:
         plotly.graph_objects.Figure: 3D plot figure
     """
-    earth_radius = 6371.0  # km
-    
     # Convert current ISS position to x, y, z
     iss_x, iss_y, iss_z = lat_lon_alt_to_xyz(
         position['latitude'],
         position['longitude'],
-        position['altitude'],
-        earth_radius
+        position['altitude']
     )
     
     # Calculate orbit path for next 90 minutes
-    from skyfield.api import load
-    ts = load.timescale()
-    skyfield_time = ts.from_datetime(current_time)
-    
-    orbit_path = calculate_orbit_path(satellite, current_time, duration_minutes=90, step_minutes=2)
+    orbit_path = get_orbit_path(satellite, current_time, duration_minutes=90, step_minutes=2)
     
     # Create Earth sphere with realistic colors
-    earth_x, earth_y, earth_z, earth_colors = create_earth_sphere(earth_radius, resolution=80)
+    earth_x, earth_y, earth_z, earth_colors = create_earth_sphere(EARTH_RADIUS_KM, resolution=80)
     
     # Create the 3D plot
     fig = go.Figure()
@@ -1652,6 +2393,7 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
     ))
     
     # Add orbital shell (multiple satellites) if enabled
+    shell_layer = None
     if show_orbital_shell:
         with st.spinner("Loading orbital shell data..."):
             # Download multiple satellites
@@ -1661,46 +2403,33 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
                 # Calculate positions for all satellites
                 satellite_positions = calculate_satellite_positions(satellites_data, current_time)
                 
-                if satellite_positions:
-                    # Separate ISS from other satellites
-                    other_sats_x = []
-                    other_sats_y = []
-                    other_sats_z = []
-                    other_sats_names = []
-                    
-                    for x, y, z, name, alt, norad_id in satellite_positions:
-                        # Skip ISS (we'll show it separately in red)
-                        if norad_id == '25544' or 'ISS' in name.upper():
-                            continue
-                        other_sats_x.append(x)
-                        other_sats_y.append(y)
-                        other_sats_z.append(z)
-                        other_sats_names.append(f"{name} (Alt: {alt:.0f} km)")
+                if len(satellite_positions):
+                    # Separate ISS from other satellites (we'll show it separately in red)
+                    is_iss = (satellite_positions.catnr == 25544) | np.array(
+                        ['ISS' in name.upper() for name in satellite_positions.names], dtype=bool
+                    )
+                    other_sats = satellite_positions.select(~is_iss)
+                    other_sats_names = [
+                        f"{name} (Alt: {alt:.0f} km)"
+                        for name, alt in zip(other_sats.names, other_sats.alt.tolist())
+                    ]
                     
-                    # Add all other satellites as white dots (orbital shell)
-                    if other_sats_x:
-                        fig.add_trace(go.Scatter3d(
-                            x=other_sats_x,
-                            y=other_sats_y,
-                            z=other_sats_z,
-                            mode='markers',
-                            marker=dict(
-                                size=3,
-                                color='white',
-                                symbol='circle',
-                                opacity=0.8,
-                                line=dict(width=0)
-                            ),
-                            name=f'Orbital Shell ({len(other_sats_x)} satellites)',
-                            hovertemplate='%{text}<extra></extra>',
-                            text=other_sats_names
-                        ))
+                    # All other satellites are drawn as white dots (orbital shell)
+                    # in the same trace as the ISS marker below
+                    if len(other_sats):
+                        shell_layer = {
+                            'x': other_sats.x,
+                            'y': other_sats.y,
+                            'z': other_sats.z,
+                            'hover': other_sats_names,
+                            'size': 3,
+                            'color': 'rgba(255, 255, 255, 0.8)',
+                            'name': f'Orbital Shell ({len(other_sats)} satellites)'
+                        }
     
     # Add orbit path
-    if orbit_path:
-        path_x = [p[0] for p in orbit_path]
-        path_y = [p[1] for p in orbit_path]
-        path_z = [p[2] for p in orbit_path]
+    if len(orbit_path):
+        path_x, path_y, path_z = orbit_path.T
         
         fig.add_trace(go.Scatter3d(
             x=path_x,
@@ -1713,19 +2442,12 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
         ))
     
     # Add current ISS position (red dot, larger and more prominent)
-    fig.add_trace(go.Scatter3d(
-        x=[iss_x],
-        y=[iss_y],
-        z=[iss_z],
-        mode='markers',
-        marker=dict(
-            size=12,
-            color='red',
-            symbol='circle',
-            line=dict(width=2, color='darkred')
-        ),
-        name='ISS Current Position',
-        hovertemplate=f'ISS<br>Lat: {position["latitude"]:.2f}°<br>Lon: {position["longitude"]:.2f}°<br>Alt: {position["altitude"]:.2f} km<extra></extra>'
+    fig.add_trace(iss_marker_trace(
+        (iss_x, iss_y, iss_z),
+        f'ISS<br>Lat: {position["latitude"]:.2f}°<br>Lon: {position["longitude"]:.2f}°<br>Alt: {position["altitude"]:.2f} km',
+        size=12,
+        line_width=2,
+        background=shell_layer
     ))
     
     # Set camera angle to show Earth and orbit clearly
@@ -1740,18 +2462,8 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
         title_text = 'ISS 3D Orbit View'
     
     fig.update_layout(
-        scene=dict(
-            xaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            yaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            zaxis=dict(visible=False, range=[-axis_range, axis_range], backgroundcolor='#0e1117'),
-            aspectmode='cube',
-            camera=dict(
-                eye=dict(x=2.0, y=2.0, z=1.5),  # Position camera to see Earth and orbit
-                center=dict(x=0, y=0, z=0),
-                up=dict(x=0, y=0, z=1)
-            ),
-            bgcolor='#0e1117'
-        ),
+        # Position camera to see Earth and orbit
+        scene=dark_scene_layout(axis_range, camera_eye=dict(x=2.0, y=2.0, z=1.5)),
         title=dict(
             text=title_text,
             font=dict(color='white', size=20)
@@ -1766,6 +2478,355 @@ def create_3d_orbit_plot(position: dict, satellite, current_time, show_orbital_s
     return fig
 
 
+def render_satellite_table(sats: list, prefix: str, watched_set: set, risk_indicators: dict):
+    """
+    Render a group of satellites as one editable table.
+    
+    Each row shows visibility, name, watch star and risk indicator, all built
+    as column lists in one pass. The 👁 and ⭐ columns are checkboxes that
+    toggle visibility and the watched list, and ticking ℹ️ opens the
+    satellite's profile, so a group is a single widget instead of a row of
+    buttons per satellite.
+    
+    Args:
+        sats: Tracked satellite dicts to show, in display order
+        prefix: Widget key prefix, unique per group
+        watched_set: Set of watched catalog numbers
+        risk_indicators: Index from index_risk_indicators()
+    """
+    # The key is bumped after every edit so the table starts from fresh data
+    # (otherwise stale edits would stay applied to rows by position)
+    version_key = f"{prefix}table_version"
+    table_key = f"{prefix}table_{st.session_state.get(version_key, 0)}"
+    catnrs = [sat['catnr'] for sat in sats]
+    
+    # Apply only the changed rows reported by the editor
+    def apply_edits():
+        visibility = st.session_state.satellite_visibility
+        watched = st.session_state.get('watched_satellites', [])
+        for row, changes in st.session_state[table_key]['edited_rows'].items():
+            catnr = catnrs[row]
+            if '👁' in changes:
+                visibility[catnr] = changes['👁']
+            if '⭐' in changes:
+                if changes['⭐'] and catnr not in watched:
+                    watched.append(catnr)
+                elif not changes['⭐'] and catnr in watched:
+                    watched.remove(catnr)
+            if changes.get('ℹ️'):
+                st.session_state.selected_satellite = catnr
+        st.session_state.watched_satellites = watched
+        st.session_state[version_key] = st.session_state.get(version_key, 0) + 1
+    
+    visibility = st.session_state.satellite_visibility
+    st.data_editor(
+        {
+            "👁": [visibility.get(catnr, True) for catnr in catnrs],
+            "Name": [sat['name'] for sat in sats],
+            "⭐": [catnr in watched_set for catnr in catnrs],
+            "Risk": [risk_indicators.get(sat['name'], "🟢") for sat in sats],
+            "ℹ️": [False] * len(sats)
+        },
+        key=table_key,
+        on_change=apply_edits,
+        column_config={
+            "👁": st.column_config.CheckboxColumn(help="Show in 3D view", width="small"),
+            "⭐": st.column_config.CheckboxColumn(help="Watched", width="small"),
+            "Risk": st.column_config.TextColumn(width="small"),
+            "ℹ️": st.column_config.CheckboxColumn(help="Open profile", width="small")
+        },
+        disabled=["Name", "Risk"],
+        hide_index=True,
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_profile_panel(
+    tracked_by_catnr: dict,
+    satellites_tle_data: dict,
+    all_sat_positions: SatPositions,
+    conjunction_index: dict,
+    max_risk_index: dict
+):
+    """
+    Render the profile panel for the selected satellite.
+    
+    Runs as a fragment, so opening its expanders or closing the panel reruns
+    only the panel and leaves the 3D view alone. The star and visibility
+    buttons change the sidebar tables and the 3D view, so they still rerun
+    the whole app.
+    
+    Args:
+        tracked_by_catnr: Tracked satellite config dicts keyed by catalog number
+        satellites_tle_data: Dict mapping catalog numbers to TLE data
+        all_sat_positions: Positions of the tracked satellites
+        conjunction_index: Index from index_conjunctions()
+        max_risk_index: Index from index_max_risk()
+    """
+    selected_catnr = st.session_state.get('selected_satellite')
+    if not selected_catnr:
+        # Empty state - don't show placeholder message, keep UI clean
+        return
+    
+    # Find satellite info
+    sat_info = tracked_by_catnr.get(selected_catnr)
+    sat_tle_data = satellites_tle_data.get(selected_catnr) if sat_info else None
+    
+    if sat_info and sat_tle_data:
+        # Profile Panel Header (matching reference images)
+        profile_header_col1, profile_header_col2 = st.columns([4, 1])
+        with profile_header_col1:
+            st.subheader("🛰️ SATELLITE PROFILE")
+            st.markdown(f"**{sat_info['name']}**")
+            st.caption(f"NORAD ID: {selected_catnr}")
+        with profile_header_col2:
+            # Star button to add to watched list
+            is_watched = selected_catnr in st.session_state.get('watched_satellites', [])
+            star_icon = "⭐" if is_watched else "☆"
+            if st.button(star_icon, key=f"star_{selected_catnr}", help="Add to watched list"):
+                watched = st.session_state.get('watched_satellites', [])
+                if is_watched:
+                    watched.remove(selected_catnr)
+                else:
+                    if selected_catnr not in watched:
+                        watched.append(selected_catnr)
+                st.session_state.watched_satellites = watched
+                st.rerun()
+            # Visibility toggle for the 3D view
+            visibility = st.session_state.setdefault('satellite_visibility', {})
+            is_visible = visibility.get(selected_catnr, True)
+            visibility_icon = "👁️" if is_visible else "👁️‍🗨️"
+            if st.button(visibility_icon, key=f"vis_{selected_catnr}", help="Toggle visibility"):
+                visibility[selected_catnr] = not is_visible
+                st.rerun()
+            # Close button (cleared in a callback, so the fragment rerun it
+            # triggers already renders the panel closed)
+            def close_profile():
+                st.session_state.selected_satellite = None
+            
+            st.button("✕", key=f"close_{selected_catnr}", help="Close profile", on_click=close_profile)
+        
+        st.markdown("---")
+    
+    # General Information
+    st.markdown("**General Information**")
+    st.write(f"**Object Type:** {sat_info['type'].title()}")
+    st.write(f"**Mission Type:** Not Available")  # Placeholder - could be added to satellites.json
+    st.write(f"**Country:** Not Available")  # Placeholder
+    st.write(f"**Sector:** Not Available")  # Placeholder
+        
+    # Current Position
+    st.subheader("📍 Current Position")
+    # Use pre-calculated positions
+    i = all_sat_positions.row_by_catnr.get(selected_catnr)
+    if i is not None:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Latitude", f"{all_sat_positions.lat[i]:.4f}°")
+        with col2:
+            st.metric("Longitude", f"{all_sat_positions.lon[i]:.4f}°")
+        with col3:
+            st.metric("Altitude", f"{all_sat_positions.alt[i]:.2f} km")
+    
+    st.markdown("---")
+    
+    # TLE Freshness
+    st.subheader("📡 TLE Data")
+    epoch = sat_tle_data.get('EPOCH', 'Unknown')
+    if epoch != 'Unknown':
+        status_level, hours_old, status_message = get_data_freshness_status(epoch)
+        if status_level == 'fresh':
+            st.success(f"✅ {status_message}")
+        elif status_level == 'warning':
+            st.warning(f"⚠️ {status_message}")
+        elif status_level == 'old':
+            st.warning(f"⚠️ {status_message}")
+        else:
+            st.error(f"❌ {status_message}")
+    else:
+        st.info("TLE epoch information not available")
+    
+    st.markdown("---")
+    
+    # ========================================
+    # ORBITAL DATA SECTION (UI Phase 3)
+    # ========================================
+    with st.expander("🌍 Orbital Data", expanded=True):
+        orbital_params = calculate_orbital_parameters(sat_tle_data)
+        
+        if orbital_params and 'inclination' in orbital_params:
+            # Primary orbital parameters as one table of (parameter, value,
+            # hint) rows instead of a metric widget per value
+            st.markdown("**Orbital Parameters**")
+            inc = orbital_params.get('inclination', 0)
+            ecc = orbital_params.get('eccentricity', 0)
+            rows = [
+                ("Inclination", f"{inc:.2f}°", classify_orbit_value(inc, INCLINATION_HINTS)),
+                ("Eccentricity", f"{ecc:.6f}", classify_orbit_value(ecc, ECCENTRICITY_HINTS))
+            ]
+            period = orbital_params.get('period_minutes', 0)
+            if period > 0:
+                hours = int(period // 60)
+                mins = int(period % 60)
+                rows.append(("Orbital Period", f"{hours}h {mins}m", classify_orbit_value(period, PERIOD_HINTS)))
+            mm = orbital_params.get('mean_motion', 0)
+            if mm > 0:
+                rows.append(("Revs/Day", f"{mm:.4f}", None))
+            apogee = orbital_params.get('apogee_km', 0)
+            if apogee > 0:
+                rows.append(("Apogee", f"{apogee:.1f} km", "Highest altitude"))
+            perigee = orbital_params.get('perigee_km', 0)
+            if perigee > 0:
+                rows.append(("Perigee", f"{perigee:.1f} km", "Lowest altitude"))
+            
+            parameters, values, notes = zip(*rows)
+            st.dataframe(
+                {"Parameter": parameters, "Value": values, "Note": [note or "" for note in notes]},
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            # Advanced parameters (collapsible)
+            advanced_expander = st.expander("Advanced Parameters", expanded=False, key="advanced_parameters_expander", on_change="rerun")
+            if advanced_expander.open:
+                with advanced_expander:
+                    advanced_rows = []
+                    raan = orbital_params.get('raan', None)
+                    if raan is not None:
+                        advanced_rows.append(("RAAN", f"{raan:.2f}°"))
+                    sma = orbital_params.get('semi_major_axis_km', None)
+                    if sma is not None:
+                        advanced_rows.append(("Semi-major Axis", f"{sma:.1f} km"))
+                    arg_p = orbital_params.get('arg_perigee', None)
+                    if arg_p is not None:
+                        advanced_rows.append(("Arg. of Perigee", f"{arg_p:.2f}°"))
+                    
+                    if advanced_rows:
+                        parameters, values = zip(*advanced_rows)
+                        st.dataframe(
+                            {"Parameter": parameters, "Value": values},
+                            hide_index=True,
+                            use_container_width=True
+                        )
+        else:
+            st.info("Orbital parameters not available for this satellite")
+    
+    st.markdown("---")
+    
+    # Conjunction Status
+    st.subheader("⚠️ Conjunction Status")
+    risks = get_satellite_risks(conjunction_index, selected_catnr, sat_info['name'])
+    
+    if risks:
+        # Find highest risk (the first record at the precomputed max level)
+        max_level = get_max_risk_level(max_risk_index, sat_info['name'])
+        max_risk = next(risk for risk in risks if risk['risk_level'] == max_level)
+        
+        if max_risk['risk_level'] == 'CRITICAL':
+            st.error(f"🚨 **CRITICAL RISK**")
+        elif max_risk['risk_level'] == 'HIGH RISK':
+            st.warning(f"⚠️ **HIGH RISK**")
+        else:
+            st.info(f"ℹ️ **NORMAL RISK**")
+        
+        st.write(f"**Closest Object:** {max_risk['other_satellite']}")
+        st.write(f"**Distance:** {max_risk['distance_km']:.3f} km")
+        
+        # Time string is formatted once when the results are indexed
+        if max_risk['time_str']:
+            st.write(f"**Time of Closest Approach:** {max_risk['time_str']}")
+        
+        # Show all risks if multiple
+        if len(risks) > 1:
+            all_risks_expander = st.expander(f"View all {len(risks)} conjunction risks", key="all_risks_expander", on_change="rerun")
+            if all_risks_expander.open:
+                with all_risks_expander:
+                    for i, risk in enumerate(risks, 1):
+                        st.write(f"**{i}. {risk['other_satellite']}** - {risk['distance_km']:.3f} km ({risk['risk_level']})")
+    else:
+        st.success("✅ No conjunction risks detected")
+
+
+def render_status_bar(conjunction_results: Optional[dict], current_time: datetime, active_risks: int):
+    """
+    Render the four-column status bar under the orbital shell view.
+    
+    Only the fallback (no tracked satellites) 3D view shows it; the tracked
+    view reports the same information in its caption.
+    
+    Args:
+        conjunction_results: Conjunction results dictionary, or None
+        current_time: Time the view is showing
+        active_risks: Number of CRITICAL or HIGH RISK conjunctions
+        
+    Returns:
+        DeltaGenerator: The last column, so the caller can add the 3D view
+            legend under the risk summary
+    """
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Last conjunction check
+    if conjunction_results and 'timestamp' in conjunction_results:
+        try:
+            # Parse the check time once per results file and keep it as a
+            # POSIX timestamp, so each refresh is one float subtraction
+            raw_timestamp = conjunction_results['timestamp']
+            parsed_check = st.session_state.get('conjunction_check_time')
+            if parsed_check is None or parsed_check[0] != raw_timestamp:
+                check_time = datetime.fromisoformat(raw_timestamp.replace('Z', '+00:00'))
+                parsed_check = (raw_timestamp, check_time.replace(tzinfo=timezone.utc).timestamp())
+                st.session_state.conjunction_check_time = parsed_check
+            seconds_ago = current_time.timestamp() - parsed_check[1]
+            hours_ago = seconds_ago / 3600
+            if hours_ago < 1:
+                time_str = f"{int(seconds_ago / 60)} minutes ago"
+            else:
+                time_str = f"{hours_ago:.1f} hours ago"
+        except:
+            time_str = conjunction_results['timestamp']
+    else:
+        time_str = "Never"
+    
+    with col1:
+        st.caption(f"**Last conjunction check:** {time_str}")
+    
+    # Next check (placeholder for Phase 3)
+    with col2:
+        st.caption("**Next check:** Scheduled (Phase 3)")
+    
+    # Tracking stats
+    with col3:
+        st.caption(f"**Tracking:** 0 objects | {active_risks} active risks")
+    
+    with col4:
+        if active_risks > 0:
+            st.warning(f"⚠️ {active_risks} active risk(s) detected")
+        else:
+            st.success("✅ No active risks")
+    
+    return col4
+
+
+@st.fragment(run_every=AUTO_REFRESH_SECONDS)
+def render_auto_refresh(run_started_at: float):
+    """
+    Show the auto-refresh note and rerun the app every AUTO_REFRESH_SECONDS.
+    
+    The fragment runs once as part of each full run and then again on its own
+    timer in the browser session, so no server thread sleeps or polls while
+    waiting. Fragment reruns keep the arguments of the last full run, which is
+    how a timer tick is told apart from the full run itself.
+    
+    Args:
+        run_started_at: Unix time at which the current full run started
+    """
+    if time.time() - run_started_at >= AUTO_REFRESH_SECONDS:
+        st.rerun()
+    st.caption(f"🔄 Auto-refreshing every {AUTO_REFRESH_SECONDS} seconds")
+
+
 # Page configuration
 st.set_page_config(
     page_title="SatWatch - ISS Tracker",
@@ -1803,19 +2864,23 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Current time, read once per rerun and shared by everything below
+now_utc = datetime.now(timezone.utc)
+
 # Initialize time session state BEFORE sidebar (so it's available for data loading)
 if 'live_mode' not in st.session_state:
     st.session_state.live_mode = True
 if 'selected_date' not in st.session_state:
-    st.session_state.selected_date = datetime.now(timezone.utc).date()
+    st.session_state.selected_date = now_utc.date()
 if 'selected_hour' not in st.session_state:
-    st.session_state.selected_hour = datetime.now(timezone.utc).hour
+    st.session_state.selected_hour = now_utc.hour
 if 'selected_minute' not in st.session_state:
-    st.session_state.selected_minute = datetime.now(timezone.utc).minute
+    st.session_state.selected_minute = now_utc.minute
 
 # Calculate the target time based on session state
 if st.session_state.live_mode:
-    target_time = datetime.now(timezone.utc)
+    # Whole seconds, so widget reruns within the same second reuse cached positions
+    target_time = now_utc.replace(microsecond=0)
 else:
     target_time = datetime(
         year=st.session_state.selected_date.year,
@@ -1873,49 +2938,25 @@ with st.sidebar:
         if tracked_satellites and not use_local:
             # Only fetch from API if not in local mode
             with st.spinner("Loading tracked satellites..."):
-                catnr_list = [sat['catnr'] for sat in tracked_satellites]
+                catnr_list = tuple(sat['catnr'] for sat in tracked_satellites)
                 fetched_satellites = fetch_satellites(catnr_list)
                 
                 # Create a mapping of catalog number to TLE data
+                unnumbered = []
                 for sat_data in fetched_satellites:
-                    # Try to get NORAD catalog ID - it can be in different fields
-                    # NORAD_CAT_ID is the preferred field (numeric string)
-                    # OBJECT_ID might be international designator (e.g., '1998-067A')
-                    catnr = None
-                    
-                    # First try NORAD_CAT_ID (preferred field)
-                    if 'NORAD_CAT_ID' in sat_data:
-                        try:
-                            catnr = int(sat_data['NORAD_CAT_ID'])
-                        except (ValueError, TypeError):
-                            pass
+                    catnr = extract_catnr(sat_data)
                     
-                    # If that didn't work, try OBJECT_ID (but it might be a designator)
-                    if catnr is None and 'OBJECT_ID' in sat_data:
-                        obj_id = sat_data['OBJECT_ID']
-                        # Try to convert to int - if it fails, it's probably a designator
-                        try:
-                            catnr = int(obj_id)
-                        except (ValueError, TypeError):
-                            # OBJECT_ID is not numeric (likely international designator)
-                            # Try to find the catalog number from the TLE line instead
-                            tle_line1 = sat_data.get('TLE_LINE1', '')
-                            if tle_line1 and len(tle_line1) >= 7:
-                                # TLE line 1 has catalog number at positions 2-7 (1-indexed, so 1-6 in 0-indexed)
-                                try:
-                                    catnr = int(tle_line1[2:7].strip())
-                                except (ValueError, IndexError):
-                                    pass
-                    
-                    # If we still don't have a catalog number, skip this satellite
+                    # If we don't have a catalog number, skip this satellite
                     if catnr is None:
-                        sat_name = sat_data.get('OBJECT_NAME', 'Unknown')
-                        st.warning(f"Could not determine catalog number for {sat_name}, skipping")
+                        unnumbered.append(sat_data.get('OBJECT_NAME', 'Unknown'))
                         continue
                     
                     satellites_tle_data[catnr] = sat_data
                     loaded_satellites.append(catnr)
                 
+                if unnumbered:
+                    st.warning(f"Could not determine catalog number for {', '.join(unnumbered)}, skipping")
+                
                 # Also add ISS data if it's in tracked satellites but not already loaded
                 iss_catnr = 25544
                 if iss_catnr in [sat['catnr'] for sat in tracked_satellites] and iss_catnr not in satellites_tle_data:
@@ -2047,8 +3088,7 @@ with st.sidebar:
                     st.rerun()
             
             # Show time difference from now
-            now = datetime.now(timezone.utc)
-            time_diff = target_time - now
+            time_diff = target_time - now_utc
             if time_diff.total_seconds() > 0:
                 st.caption(f"🔮 Viewing {abs(time_diff.days)} days, {abs(time_diff.seconds // 3600)} hours into the **future**")
             else:
@@ -2117,15 +3157,16 @@ with st.sidebar:
             query_lower = search_query.lower()
             filtered_satellites = [
                 sat for sat in tracked_satellites
-                if query_lower in sat['name'].lower() or str(sat['catnr']) == search_query
+                if query_lower in sat['name_lower'] or sat['catnr_str'] == search_query
             ]
         
         # "My Satellites" quick filter button
         watched_satellites = st.session_state.get('watched_satellites', [])
+        watched_set = set(watched_satellites)
         if watched_satellites:
             if st.button("⭐ My Satellites", key="my_satellites_btn", use_container_width=True, type="primary"):
                 # Filter to only watched satellites
-                filtered_satellites = [sat for sat in tracked_satellites if sat['catnr'] in watched_satellites]
+                filtered_satellites = [sat for sat in tracked_satellites if sat['catnr'] in watched_set]
                 st.session_state.search_query = ""  # Clear search when using this filter
                 st.rerun()
         
@@ -2156,102 +3197,59 @@ with st.sidebar:
                 
                 # Load conjunction results for risk indicators
                 conjunction_results = load_conjunction_results()
+                max_risk_index = index_max_risk(conjunction_results)
+                risk_indicators = index_risk_indicators(
+                    max_risk_index, tuple(sat['name'] for sat in tracked_satellites)
+                )
                 
                 # Display filtered satellites
                 display_satellites = filtered_satellites
                 if show_starred_only:
-                    display_satellites = [sat for sat in display_satellites if sat['catnr'] in watched_satellites]
+                    display_satellites = [sat for sat in display_satellites if sat['catnr'] in watched_set]
                 
                 if display_satellites and show_space_objects:
                     # ========================================
                     # GROUP BY TYPE (UI Phase 4)
                     # ========================================
-                    # Separate satellites by type
-                    starred_sats = [sat for sat in display_satellites if sat['catnr'] in watched_satellites]
-                    stations = [sat for sat in display_satellites if sat.get('type') == 'station' and sat['catnr'] not in watched_satellites]
-                    satellites = [sat for sat in display_satellites if sat.get('type') == 'satellite' and sat['catnr'] not in watched_satellites]
-                    debris = [sat for sat in display_satellites if sat.get('type') == 'debris' and sat['catnr'] not in watched_satellites]
-                    other = [sat for sat in display_satellites if sat.get('type') not in ['station', 'satellite', 'debris'] and sat['catnr'] not in watched_satellites]
-                    
-                    # Helper function to render satellite entry
-                    def render_satellite_entry(sat, prefix=""):
-                        catnr = sat['catnr']
-                        name = sat['name']
-                        sat_type = sat.get('type', 'satellite')
-                        
-                        is_selected = st.session_state.get('selected_satellite') == catnr
-                        is_watched = catnr in watched_satellites
-                        is_visible = st.session_state.satellite_visibility.get(catnr, True)
-                        
-                        # Get risk indicator
-                        risks = get_satellite_risks(conjunction_results, catnr, name)
-                        risk_indicator = "🟢"
-                        if risks:
-                            max_risk = max([r['risk_level'] for r in risks], key=lambda x: {'CRITICAL': 2, 'HIGH RISK': 1, 'NORMAL': 0}.get(x, 0))
-                            if max_risk == 'CRITICAL':
-                                risk_indicator = "🔴"
-                            elif max_risk == 'HIGH RISK':
-                                risk_indicator = "🟠"
-                        
-                        col1, col2, col3, col4 = st.columns([1, 3, 1, 1])
-                        
-                        with col1:
-                            visibility_icon = "👁️" if is_visible else "👁️‍🗨️"
-                            if st.button(visibility_icon, key=f"{prefix}vis_{catnr}", help="Toggle visibility"):
-                                st.session_state.satellite_visibility[catnr] = not is_visible
-                                st.rerun()
-                        
-                        with col2:
-                            button_style = "primary" if is_selected else "secondary"
-                            if st.button(name, key=f"{prefix}select_{catnr}", use_container_width=True, type=button_style):
-                                st.session_state.selected_satellite = catnr
-                                st.rerun()
-                        
-                        with col3:
-                            star_icon = "⭐" if is_watched else "☆"
-                            if st.button(star_icon, key=f"{prefix}star_{catnr}", help="Add to watched list"):
-                                watched = st.session_state.get('watched_satellites', [])
-                                if is_watched:
-                                    watched.remove(catnr)
-                                else:
-                                    if catnr not in watched:
-                                        watched.append(catnr)
-                                st.session_state.watched_satellites = watched
-                                st.rerun()
-                        
-                        with col4:
-                            st.markdown(risk_indicator)
+                    # Separate satellites by type in one pass (starred ones go to their own group)
+                    starred_sats, stations, satellites, debris, other = [], [], [], [], []
+                    type_groups = {'station': stations, 'satellite': satellites, 'debris': debris}
+                    for sat in display_satellites:
+                        if sat['catnr'] in watched_set:
+                            starred_sats.append(sat)
+                        else:
+                            type_groups.get(sat.get('type'), other).append(sat)
                     
                     # Render starred satellites first (pinned to top)
                     if starred_sats:
                         st.markdown("**⭐ Favorites**")
-                        for sat in starred_sats:
-                            render_satellite_entry(sat, "fav_")
+                        render_satellite_table(starred_sats, "fav_", watched_set, risk_indicators)
                         st.markdown("")
                     
                     # Render stations
                     if stations:
                         with st.expander(f"🏠 Stations ({len(stations)})", expanded=True):
-                            for sat in stations:
-                                render_satellite_entry(sat, "sta_")
+                            render_satellite_table(stations, "sta_", watched_set, risk_indicators)
                     
                     # Render satellites
                     if satellites:
                         with st.expander(f"🛰️ Satellites ({len(satellites)})", expanded=True):
-                            for sat in satellites:
-                                render_satellite_entry(sat, "sat_")
+                            render_satellite_table(satellites, "sat_", watched_set, risk_indicators)
                     
-                    # Render debris
+                    # Render debris (collapsed groups track their open state
+                    # and only build their table once expanded)
                     if debris:
-                        with st.expander(f"💥 Debris ({len(debris)})", expanded=False):
-                            for sat in debris:
-                                render_satellite_entry(sat, "deb_")
+                        debris_expander = st.expander(f"💥 Debris ({len(debris)})", expanded=False, key="debris_expander", on_change="rerun")
+                        if debris_expander.open:
+                            with debris_expander:
+                                render_satellite_table(debris, "deb_", watched_set, risk_indicators)
                     
                     # Render other types
                     if other:
-                        with st.expander(f"📡 Other ({len(other)})", expanded=False):
-                            for sat in other:
-                                render_satellite_entry(sat, "oth_")
+                        other_expander = st.expander(f"📡 Other ({len(other)})", expanded=False, key="other_expander", on_change="rerun")
+                        if other_expander.open:
+                            with other_expander:
+                                render_satellite_table(other, "oth_", watched_set, risk_indicators)
                 
                 elif not display_satellites:
                     st.caption("No satellites match your search.")
@@ -2262,28 +3260,14 @@ with st.sidebar:
         
         # WATCHED SATELLITES LIST (compact version)
         if watched_satellites:
-            with st.expander("⭐ My Satellites", expanded=False):
-                for watched_catnr in watched_satellites:
-                    sat_info = None
-                    for sat in tracked_satellites:
-                        if sat['catnr'] == watched_catnr:
-                            sat_info = sat
-                            break
-                    
-                    if sat_info:
-                        # Get risk indicator
-                        risks = get_satellite_risks(conjunction_results, watched_catnr, sat_info['name'])
-                        risk_color = "🟢"
-                        if risks:
-                            max_risk = max([r['risk_level'] for r in risks], key=lambda x: {'CRITICAL': 2, 'HIGH RISK': 1, 'NORMAL': 0}.get(x, 0))
-                            if max_risk == 'CRITICAL':
-                                risk_color = "🔴"
-                            elif max_risk == 'HIGH RISK':
-                                risk_color = "🟠"
-                        
-                        if st.button(f"{risk_color} {sat_info['name']}", key=f"watch_btn_{watched_catnr}", use_container_width=True):
-                            st.session_state.selected_satellite = watched_catnr
-                            st.rerun()
+            my_satellites_expander = st.expander("⭐ My Satellites", expanded=False, key="my_satellites_expander", on_change="rerun")
+            if my_satellites_expander.open:
+                with my_satellites_expander:
+                    # Same single-widget table as the Space Objects groups
+                    tracked_by_catnr = {sat['catnr']: sat for sat in tracked_satellites}
+                    watched_sats = [tracked_by_catnr[catnr] for catnr in watched_satellites if catnr in tracked_by_catnr]
+                    if watched_sats:
+                        render_satellite_table(watched_sats, "watch_", watched_set, risk_indicators)
         
         st.markdown("---")
         
@@ -2311,21 +3295,22 @@ with st.sidebar:
             help="Display additional active satellites to visualize space traffic density. Loads in <1 second.",
             key='show_full_traffic_checkbox'
         )
-        st.session_state.show_full_traffic = show_full_traffic
         
         # Traffic density slider (only show when full traffic is enabled)
         traffic_count = 50  # Default: 50 objects for near real-time
         if show_full_traffic:
-            traffic_count = st.slider(
-                "Traffic Density",
-                min_value=30,
-                max_value=100,
-                value=st.session_state.get('traffic_count', 50),
-                step=10,
-                help="Number of additional satellites to display (30-100). Lower = faster load.",
-                key='traffic_count_slider'
-            )
-            st.session_state.traffic_count = traffic_count
+            # In a form so dragging the slider doesn't refetch traffic until Apply
+            with st.form("traffic_density_form"):
+                traffic_count = st.slider(
+                    "Traffic Density",
+                    min_value=30,
+                    max_value=100,
+                    value=st.session_state.get('traffic_count', 50),
+                    step=10,
+                    help="Number of additional satellites to display (30-100). Lower = faster load.",
+                    key='traffic_count_slider'
+                )
+                st.form_submit_button("Apply", use_container_width=True)
             st.caption(f"⚡ Loading {traffic_count} satellites (~200-500ms)")
         
         st.markdown("---")
@@ -2333,55 +3318,55 @@ with st.sidebar:
         # VIEW FILTERS (in expander, matching reference images)
         if tracked_satellites:
             with st.expander("⚙️ View Filters", expanded=False):
-                # Type filters (checkboxes)
-                show_stations = st.checkbox(
-                    "Show Stations",
-                    value=st.session_state.get('show_stations', True),
-                    help="Display space stations (red)",
-                    key='show_stations_checkbox'
-                )
-                st.session_state.show_stations = show_stations
-                
-                show_satellites = st.checkbox(
-                    "Show Satellites",
-                    value=st.session_state.get('show_satellites', True),
-                    help="Display operational satellites (blue)",
-                    key='show_satellites_checkbox'
-                )
-                st.session_state.show_satellites = show_satellites
-                
-                show_debris = st.checkbox(
-                    "Show Debris",
-                    value=st.session_state.get('show_debris', True),
-                    help="Display space debris (orange)",
-                    key='show_debris_checkbox'
-                )
-                st.session_state.show_debris = show_debris
-                
-                st.markdown("---")
-                
-                # Proximity radius slider
-                proximity_radius = st.slider(
-                    "Proximity Radius (km)",
-                    min_value=100,
-                    max_value=10000,
-                    value=st.session_state.get('proximity_radius', 5000),
-                    step=100,
-                    help="Show objects within this distance",
-                    key='proximity_radius_slider'
-                )
-                st.session_state.proximity_radius = proximity_radius
-                
-                st.markdown("---")
-                
-                # Focus Mode toggle (ON by default for demo)
-                focus_mode = st.checkbox(
-                    "Focus on my satellites",
-                    value=st.session_state.get('focus_mode', True),
-                    help="When ON: Show your tracked satellites prominently with nearby objects as secondary. When OFF: Show all objects equally.",
-                    key='focus_mode_checkbox'
-                )
-                st.session_state.focus_mode = focus_mode
+                # Filters apply together on submit, so each click or slider nudge
+                # doesn't rerun the whole 3D view
+                with st.form("view_filters_form"):
+                    # Type filters (checkboxes)
+                    show_stations = st.checkbox(
+                        "Show Stations",
+                        value=st.session_state.get('show_stations', True),
+                        help="Display space stations (red)",
+                        key='show_stations_checkbox'
+                    )
+                    
+                    show_satellites = st.checkbox(
+                        "Show Satellites",
+                        value=st.session_state.get('show_satellites', True),
+                        help="Display operational satellites (blue)",
+                        key='show_satellites_checkbox'
+                    )
+                    
+                    show_debris = st.checkbox(
+                        "Show Debris",
+                        value=st.session_state.get('show_debris', True),
+                        help="Display space debris (orange)",
+                        key='show_debris_checkbox'
+                    )
+                    
+                    st.markdown("---")
+                    
+                    # Proximity radius slider
+                    proximity_radius = st.slider(
+                        "Proximity Radius (km)",
+                        min_value=100,
+                        max_value=10000,
+                        value=st.session_state.get('proximity_radius', 5000),
+                        step=100,
+                        help="Show objects within this distance",
+                        key='proximity_radius_slider'
+                    )
+                    
+                    st.markdown("---")
+                    
+                    # Focus Mode toggle (ON by default for demo)
+                    focus_mode = st.checkbox(
+                        "Focus on my satellites",
+                        value=st.session_state.get('focus_mode', True),
+                        help="When ON: Show your tracked satellites prominently with nearby objects as secondary. When OFF: Show all objects equally.",
+                        key='focus_mode_checkbox'
+                    )
+                    
+                    st.form_submit_button("Apply", use_container_width=True)
                 
                 st.caption(f"Tracking {len(tracked_satellites)} satellites")
         else:
@@ -2391,11 +3376,6 @@ with st.sidebar:
             show_debris = True
             proximity_radius = 5000  # Larger radius for demo
             focus_mode = True  # ON by default for demo
-            st.session_state.show_stations = show_stations
-            st.session_state.show_satellites = show_satellites
-            st.session_state.show_debris = show_debris
-            st.session_state.proximity_radius = proximity_radius
-            st.session_state.focus_mode = focus_mode
         
         st.markdown("---")
         
@@ -2407,38 +3387,56 @@ with st.sidebar:
             help="Display multiple satellites as a 'space highway' around Earth",
             key='show_orbital_shell_checkbox'
         )
-        st.session_state.show_orbital_shell = show_orbital_shell
         
         if show_orbital_shell:
-            satellite_group = st.selectbox(
-                "Satellite Group",
-                ['active', 'stations', 'starlink', 'weather', 'noaa', 'goes', 'last-30-days'],
-                index=0,
-                help="Choose which group of satellites to display",
-                key='satellite_group_select'
-            )
-            st.session_state.satellite_group = satellite_group
-            
-            max_satellites = st.slider(
-                "Max Satellites",
-                min_value=50,
-                max_value=1000,
-                value=st.session_state.get('max_satellites', 500),
-                step=50,
-                help="Maximum number of satellites to display (more = slower loading)",
-                key='max_satellites_slider'
-            )
-            st.session_state.max_satellites = max_satellites
+            # In a form so the shell is only re-downloaded on Apply
+            with st.form("orbital_shell_form"):
+                satellite_group = st.selectbox(
+                    "Satellite Group",
+                    ['active', 'stations', 'starlink', 'weather', 'noaa', 'goes', 'last-30-days'],
+                    index=0,
+                    help="Choose which group of satellites to display",
+                    key='satellite_group_select'
+                )
+                
+                max_satellites = st.slider(
+                    "Max Satellites",
+                    min_value=50,
+                    max_value=1000,
+                    value=st.session_state.get('max_satellites', 500),
+                    step=50,
+                    help="Maximum number of satellites to display (more = slower loading)",
+                    key='max_satellites_slider'
+                )
+                
+                st.form_submit_button("Apply", use_container_width=True)
         else:
             satellite_group = 'active'
             max_satellites = 500
-            st.session_state.satellite_group = satellite_group
-            st.session_state.max_satellites = max_satellites
+        
+        # Publish the sidebar settings for the main area in one update (the
+        # widgets keep their own keyed state)
+        view_settings = {
+            'show_full_traffic': show_full_traffic,
+            'show_stations': show_stations,
+            'show_satellites': show_satellites,
+            'show_debris': show_debris,
+            'proximity_radius': proximity_radius,
+            'focus_mode': focus_mode,
+            'show_orbital_shell': show_orbital_shell,
+            'satellite_group': satellite_group,
+            'max_satellites': max_satellites
+        }
+        if show_full_traffic:
+            # Kept while traffic is off so the slider comes back at the last value
+            view_settings['traffic_count'] = traffic_count
+        st.session_state.update(view_settings)
 
 # Main content area
 if position and json_data:
     # Get tracked satellites data from session state (set in sidebar)
     tracked_satellites = st.session_state.get('tracked_satellites', [])
+    tracked_by_catnr = {sat['catnr']: sat for sat in tracked_satellites}
     satellites_tle_data = st.session_state.get('satellites_tle_data', {})
     show_stations = st.session_state.get('show_stations', True)
     show_satellites = st.session_state.get('show_satellites', True)
@@ -2448,6 +3446,14 @@ if position and json_data:
     
     # Load conjunction results
     conjunction_results = load_conjunction_results()
+    conjunction_index = index_conjunctions(conjunction_results)
+    max_risk_index = index_max_risk(conjunction_results)
+    
+    # Number of CRITICAL/HIGH RISK conjunctions, shown by the status lines below
+    active_risks = sum(
+        1 for result in (conjunction_results or {}).get('results', ())
+        if result.get('risk_level') in ('CRITICAL', 'HIGH RISK')
+    )
     
     # Initialize watched satellites if not set
     if 'watched_satellites' not in st.session_state:
@@ -2458,230 +3464,29 @@ if position and json_data:
         st.session_state.selected_satellite = None
     
     # Get the selected time from session state (set before sidebar)
-    current_time = st.session_state.get('selected_time', datetime.now(timezone.utc))
+    current_time = st.session_state.get('selected_time', now_utc)
     
     # Calculate positions for all tracked satellites (needed for profile panel and views)
-    all_sat_positions = []
+    all_sat_positions = SatPositions.from_rows([])
     if tracked_satellites and satellites_tle_data:
         try:
-            all_sat_positions = calculate_tracked_satellite_positions(
+            all_sat_positions = get_tracked_satellite_positions(
                 tracked_satellites,
                 satellites_tle_data,
                 current_time
             )
         except Exception as e:
-            all_sat_positions = []
+            all_sat_positions = SatPositions.from_rows([])
     
     # Main content layout: 3D view on left, profile panel on right (matching reference images)
     main_col1, main_col2 = st.columns([2, 1])
     
     # Satellite Profile Panel (right sidebar, matching reference images)
-    selected_catnr = st.session_state.get('selected_satellite')
     with main_col2:
-        if selected_catnr:
-            # Find satellite info
-            sat_info = None
-            sat_tle_data = None
-            for sat in tracked_satellites:
-                if sat['catnr'] == selected_catnr:
-                    sat_info = sat
-                    sat_tle_data = satellites_tle_data.get(selected_catnr)
-                    break
-            
-            if sat_info and sat_tle_data:
-                # Profile Panel Header (matching reference images)
-                profile_header_col1, profile_header_col2 = st.columns([4, 1])
-                with profile_header_col1:
-                    st.subheader("🛰️ SATELLITE PROFILE")
-                    st.markdown(f"**{sat_info['name']}**")
-                    st.caption(f"NORAD ID: {selected_catnr}")
-                with profile_header_col2:
-                    # Star button to add to watched list
-                    is_watched = selected_catnr in st.session_state.get('watched_satellites', [])
-                    star_icon = "⭐" if is_watched else "☆"
-                    if st.button(star_icon, key=f"star_{selected_catnr}", help="Add to watched list"):
-                        watched = st.session_state.get('watched_satellites', [])
-                        if is_watched:
-                            watched.remove(selected_catnr)
-                        else:
-                            if selected_catnr not in watched:
-                                watched.append(selected_catnr)
-                        st.session_state.watched_satellites = watched
-                        st.rerun()
-                    # Close button
-                    if st.button("✕", key=f"close_{selected_catnr}", help="Close profile"):
-                        st.session_state.selected_satellite = None
-                        st.rerun()
-                
-                st.markdown("---")
-            
-            # General Information
-            st.markdown("**General Information**")
-            st.write(f"**Object Type:** {sat_info['type'].title()}")
-            st.write(f"**Mission Type:** Not Available")  # Placeholder - could be added to satellites.json
-            st.write(f"**Country:** Not Available")  # Placeholder
-            st.write(f"**Sector:** Not Available")  # Placeholder
-                
-            # Current Position
-            st.subheader("📍 Current Position")
-            # Use pre-calculated positions
-            if all_sat_positions:
-                for sat_pos in all_sat_positions:
-                    x, y, z, name, alt, sat_type, catnr, lat, lon = sat_pos
-                    if catnr == selected_catnr:
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Latitude", f"{lat:.4f}°")
-                        with col2:
-                            st.metric("Longitude", f"{lon:.4f}°")
-                        with col3:
-                            st.metric("Altitude", f"{alt:.2f} km")
-                        break
-            
-            st.markdown("---")
-            
-            # TLE Freshness
-            st.subheader("📡 TLE Data")
-            epoch = sat_tle_data.get('EPOCH', 'Unknown')
-            if epoch != 'Unknown':
-                status_level, hours_old, status_message = get_data_freshness_status(epoch)
-                if status_level == 'fresh':
-                    st.success(f"✅ {status_message}")
-                elif status_level == 'warning':
-                    st.warning(f"⚠️ {status_message}")
-                elif status_level == 'old':
-                    st.warning(f"⚠️ {status_message}")
-                else:
-                    st.error(f"❌ {status_message}")
-            else:
-                st.info("TLE epoch information not available")
-            
-            st.markdown("---")
-            
-            # ========================================
-            # ORBITAL DATA SECTION (UI Phase 3)
-            # ========================================
-            with st.expander("🌍 Orbital Data", expanded=True):
-                orbital_params = calculate_orbital_parameters(sat_tle_data)
-                
-                if orbital_params and 'inclination' in orbital_params:
-                    # Primary orbital parameters
-                    st.markdown("**Orbital Parameters**")
-                    
-                    # Inclination and Eccentricity row
-                    orb_col1, orb_col2 = st.columns(2)
-                    with orb_col1:
-                        inc = orbital_params.get('inclination', 0)
-                        st.metric("Inclination", f"{inc:.2f}°")
-                        # Orbit type hint
-                        if inc < 10:
-                            st.caption("Near-equatorial")
-                        elif inc > 80 and inc < 100:
-                            st.caption("Polar orbit")
-                        elif abs(inc - 98.7) < 5:
-                            st.caption("Sun-synchronous")
-                    
-                    with orb_col2:
-                        ecc = orbital_params.get('eccentricity', 0)
-                        st.metric("Eccentricity", f"{ecc:.6f}")
-                        if ecc < 0.01:
-                            st.caption("Near-circular")
-                        elif ecc < 0.1:
-                            st.caption("Slightly elliptical")
-                        else:
-                            st.caption("Elliptical")
-                    
-                    # Period and Semi-major axis row
-                    orb_col3, orb_col4 = st.columns(2)
-                    with orb_col3:
-                        period = orbital_params.get('period_minutes', 0)
-                        if period > 0:
-                            hours = int(period // 60)
-                            mins = int(period % 60)
-                            st.metric("Orbital Period", f"{hours}h {mins}m")
-                            # Orbit altitude hint
-                            if period < 100:
-                                st.caption("Low Earth Orbit")
-                            elif period < 720:
-                                st.caption("LEO/MEO")
-                            elif period > 1400 and period < 1450:
-                                st.caption("Geostationary")
-                    
-                    with orb_col4:
-                        mm = orbital_params.get('mean_motion', 0)
-                        if mm > 0:
-                            st.metric("Revs/Day", f"{mm:.4f}")
-                    
-                    # Apogee and Perigee row
-                    st.markdown("**Altitude Range**")
-                    orb_col5, orb_col6 = st.columns(2)
-                    with orb_col5:
-                        apogee = orbital_params.get('apogee_km', 0)
-                        if apogee > 0:
-                            st.metric("Apogee", f"{apogee:.1f} km")
-                    
-                    with orb_col6:
-                        perigee = orbital_params.get('perigee_km', 0)
-                        if perigee > 0:
-                            st.metric("Perigee", f"{perigee:.1f} km")
-                    
-                    # Advanced parameters (collapsible)
-                    with st.expander("Advanced Parameters", expanded=False):
-                        adv_col1, adv_col2 = st.columns(2)
-                        with adv_col1:
-                            raan = orbital_params.get('raan', None)
-                            if raan is not None:
-                                st.metric("RAAN", f"{raan:.2f}°")
-                            
-                            sma = orbital_params.get('semi_major_axis_km', None)
-                            if sma is not None:
-                                st.metric("Semi-major Axis", f"{sma:.1f} km")
-                        
-                        with adv_col2:
-                            arg_p = orbital_params.get('arg_perigee', None)
-                            if arg_p is not None:
-                                st.metric("Arg. of Perigee", f"{arg_p:.2f}°")
-                else:
-                    st.info("Orbital parameters not available for this satellite")
-            
-            st.markdown("---")
-            
-            # Conjunction Status
-            st.subheader("⚠️ Conjunction Status")
-            risks = get_satellite_risks(conjunction_results, selected_catnr, sat_info['name'])
-            
-            if risks:
-                # Find highest risk
-                max_risk = max(risks, key=lambda r: {'CRITICAL': 2, 'HIGH RISK': 1, 'NORMAL': 0}.get(r['risk_level'], 0))
-                
-                if max_risk['risk_level'] == 'CRITICAL':
-                    st.error(f"🚨 **CRITICAL RISK**")
-                elif max_risk['risk_level'] == 'HIGH RISK':
-                    st.warning(f"⚠️ **HIGH RISK**")
-                else:
-                    st.info(f"ℹ️ **NORMAL RISK**")
-                
-                st.write(f"**Closest Object:** {max_risk['other_satellite']}")
-                st.write(f"**Distance:** {max_risk['distance_km']:.3f} km")
-                
-                # Parse time string
-                try:
-                    if isinstance(max_risk['time'], str):
-                        risk_time = datetime.fromisoformat(max_risk['time'].replace('Z', '+00:00'))
-                        st.write(f"**Time of Closest Approach:** {risk_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-                except:
-                    st.write(f"**Time of Closest Approach:** {max_risk['time']}")
-                
-                # Show all risks if multiple
-                if len(risks) > 1:
-                    with st.expander(f"View all {len(risks)} conjunction risks"):
-                        for i, risk in enumerate(risks, 1):
-                            st.write(f"**{i}. {risk['other_satellite']}** - {risk['distance_km']:.3f} km ({risk['risk_level']})")
-            else:
-                st.success("✅ No conjunction risks detected")
-        else:
-            # Empty state - don't show placeholder message, keep UI clean
-            pass
+        render_profile_panel(
+            tracked_by_catnr, satellites_tle_data, all_sat_positions,
+            conjunction_index, max_risk_index
+        )
     
     # 3D Orbit View (main content, in left column)
     with main_col1:
@@ -2690,8 +3495,7 @@ if position and json_data:
         if live_mode:
             time_status = f"🟢 LIVE · {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC"
         else:
-            now = datetime.now(timezone.utc)
-            time_diff = current_time - now
+            time_diff = current_time - now_utc
             if time_diff.total_seconds() > 0:
                 time_status = f"📅 {current_time.strftime('%Y-%m-%d %H:%M')} UTC · {abs(time_diff.days)}d {abs(time_diff.seconds // 3600)}h ahead"
             else:
@@ -2699,9 +3503,7 @@ if position and json_data:
         st.caption(time_status)
         
         # Validate position values before creating 3D plot
-        if (math.isnan(position['latitude']) or 
-            math.isnan(position['longitude']) or 
-            math.isnan(position['altitude'])):
+        if not np.isfinite([position['latitude'], position['longitude'], position['altitude']]).all():
             st.error(
                 "❌ **Position Calculation Failed**\n\n"
                 "The ISS position could not be calculated. This may be due to:\n"
@@ -2716,7 +3518,7 @@ if position and json_data:
         else:
             # Get satellite object for orbit calculation
             try:
-                satellite = parse_tle_from_json(json_data)
+                satellite = get_earth_satellite(json_data)
             
                 # Check if we have tracked satellites to show
                 if tracked_satellites and satellites_tle_data:
@@ -2727,89 +3529,75 @@ if position and json_data:
                     # Get satellite visibility state
                     satellite_visibility = st.session_state.get('satellite_visibility', {})
                     
-                    # If full traffic mode is enabled, fetch additional satellites (with caching)
-                    full_traffic_data = {}
-                    if show_full_traffic:
-                        traffic_count = st.session_state.get('traffic_count', 50)
-                        
-                        # Check if we have cached data for this count
-                        cache_key = f'full_traffic_data_{traffic_count}'
-                        cached_traffic = st.session_state.get(cache_key)
-                        cached_count = st.session_state.get('cached_traffic_count')
-                        
-                        # Only fetch if we don't have cached data or count changed
-                        if cached_traffic and cached_count == traffic_count:
-                            # Use cached data - no refetch needed
-                            full_traffic_data = cached_traffic
-                        else:
-                            # Fetch fresh data
+                    # Everything the 3D view depends on. When none of it changed
+                    # since the last rerun (an expander was toggled, a profile
+                    # opened), the previous figure is reused instead of rebuilt
+                    full_traffic_count = st.session_state.get('traffic_count', 50) if show_full_traffic else None
+                    hidden_catnrs = tuple(sorted(catnr for catnr, visible in satellite_visibility.items() if not visible))
+                    viz_key = (
+                        current_time,
+                        satellite.model.jdsatepoch + satellite.model.jdsatepochF,
+                        tracked_satellites_key(tracked_satellites, satellites_tle_data),
+                        full_traffic_count,
+                        show_stations, show_satellites, show_debris,
+                        proximity_radius, focus_mode, hidden_catnrs,
+                        conjunction_results.get('timestamp') if conjunction_results else None
+                    )
+                    if st.session_state.get('last_viz_key') == viz_key:
+                        fig_3d, shown_count, total_count, nearby_count = st.session_state.last_viz_result
+                    else:
+                        # If full traffic mode is enabled, fetch additional satellites (cached per count)
+                        full_traffic_data = {}
+                        if show_full_traffic:
+                            traffic_count = st.session_state.get('traffic_count', 50)
                             try:
-                                # Fetch active satellites from CelesTrak (optimized for speed)
-                                full_traffic_list = download_multiple_satellites(group='active', limit=traffic_count)
-                                
-                                # Convert to the format expected by the visualization
-                                for sat_data in full_traffic_list:
-                                    if 'TLE_LINE1' in sat_data and 'TLE_LINE2' in sat_data:
-                                        # Extract catalog number
-                                        try:
-                                            catnr = int(sat_data.get('NORAD_CAT_ID', sat_data.get('OBJECT_ID', '0')))
-                                            if catnr > 0:
-                                                full_traffic_data[catnr] = sat_data
-                                        except (ValueError, TypeError):
-                                            continue
-                                
-                                # Cache the data for future reruns
-                                st.session_state[cache_key] = full_traffic_data
-                                st.session_state['cached_traffic_count'] = traffic_count
+                                full_traffic_data = cached_full_traffic(traffic_count)
                             except Exception as e:
-                                # If fetch fails, try to use cached data if available
-                                if cached_traffic:
-                                    full_traffic_data = cached_traffic
-                                    st.warning(f"Using cached traffic data (fetch failed: {e})")
-                                else:
-                                    st.warning(f"Could not load full traffic data: {e}")
-                    else:
-                        # Clear cache when full traffic is disabled
-                        if 'cached_traffic_count' in st.session_state:
-                            del st.session_state['cached_traffic_count']
-                            # Clear all cached traffic keys
-                            keys_to_remove = [k for k in st.session_state.keys() if k.startswith('full_traffic_data_')]
-                            for key in keys_to_remove:
-                                del st.session_state[key]
+                                st.warning(f"Could not load full traffic data: {e}")
                     
-                    # Merge full traffic data with tracked satellites (tracked take priority)
-                    combined_tle_data = {**full_traffic_data, **satellites_tle_data}
+                        # Layer tracked satellites over full traffic data (tracked take
+                        # priority) without copying either dict
+                        combined_tle_data = ChainMap(satellites_tle_data, full_traffic_data)
                     
-                    # Create expanded tracked list for full traffic mode
-                    if show_full_traffic:
-                        # Add all full traffic satellites to tracked list for visualization
-                        expanded_tracked = list(tracked_satellites)
-                        for catnr, sat_data in full_traffic_data.items():
-                            # Skip if already in tracked list
-                            if catnr not in [s['catnr'] for s in tracked_satellites]:
-                                expanded_tracked.append({
-                                    'name': sat_data.get('OBJECT_NAME', f'Satellite {catnr}'),
-                                    'catnr': catnr,
-                                    'type': 'satellite'  # Default type
-                                })
-                        visualization_tracked = expanded_tracked
-                    else:
-                        visualization_tracked = tracked_satellites
+                        # Create expanded tracked list for full traffic mode
+                        if show_full_traffic:
+                            # Add all full traffic satellites to tracked list for visualization
+                            expanded_tracked = list(tracked_satellites)
+                            tracked_catnrs = {sat['catnr'] for sat in tracked_satellites}
+                            for catnr, sat_data in full_traffic_data.items():
+                                # Skip if already in tracked list
+                                if catnr not in tracked_catnrs:
+                                    expanded_tracked.append({
+                                        'name': sat_data.get('OBJECT_NAME', f'Satellite {catnr}'),
+                                        'catnr': catnr,
+                                        'type': 'satellite'  # Default type
+                                    })
+                            visualization_tracked = expanded_tracked
+                        else:
+                            visualization_tracked = tracked_satellites
                     
-                    fig_3d, shown_count, total_count, nearby_count = create_3d_tracked_satellites_plot(
-                        position,
-                        satellite,
-                        visualization_tracked,
-                        combined_tle_data,
-                        current_time,
-                        show_stations=show_stations,
-                        show_satellites=show_satellites,
-                        show_debris=show_debris,
-                        proximity_radius_km=proximity_radius,
-                        focus_mode=focus_mode,
-                        conjunction_results=conjunction_results,
-                        satellite_visibility=satellite_visibility
-                    )
+                        fig_3d, shown_count, total_count, nearby_count = create_3d_tracked_satellites_plot(
+                            position,
+                            satellite,
+                            visualization_tracked,
+                            combined_tle_data,
+                            current_time,
+                            show_stations=show_stations,
+                            show_satellites=show_satellites,
+                            show_debris=show_debris,
+                            proximity_radius_km=proximity_radius,
+                            focus_mode=focus_mode,
+                            conjunction_results=conjunction_results,
+                            satellite_visibility=satellite_visibility,
+                            # Same satellites, TLEs and time as the profile panel
+                            # unless full traffic widened the list
+                            tracked_positions=None if show_full_traffic else all_sat_positions
+                        )
+                    
+                        # A failed traffic download isn't kept, so the next rerun retries it
+                        if full_traffic_data or not show_full_traffic:
+                            st.session_state.last_viz_key = viz_key
+                            st.session_state.last_viz_result = (fig_3d, shown_count, total_count, nearby_count)
                     
                     # Show the 3D plot first (main focus)
                     st.plotly_chart(fig_3d, use_container_width=True, key="3d_plot")
@@ -2821,121 +3609,97 @@ if position and json_data:
                         st.caption(f"Showing {shown_count} of {total_count} objects within {proximity_radius} km")
                     
                     # Minimal status (only show if there are active risks)
-                    active_risks = 0
-                    if conjunction_results and 'results' in conjunction_results:
-                        active_risks = len([r for r in conjunction_results['results'] if r.get('risk_level') in ['CRITICAL', 'HIGH RISK']])
-                    
                     if active_risks > 0:
                         st.warning(f"⚠️ {active_risks} active conjunction risk(s) detected")
                     
                     # Debug information to help diagnose issues
                     if shown_count == 0 and total_count > 1:
-                        with st.expander("🔍 Debug Information - Why are satellites not showing?", expanded=True):
-                            # Calculate positions for debug info
-                            debug_all_sat_positions = calculate_tracked_satellite_positions(
-                                tracked_satellites, 
-                                satellites_tle_data, 
-                                current_time
-                            )
-                            
-                            st.write(f"**Configuration:**")
-                            st.write(f"- Tracked satellites in config: {len(tracked_satellites)}")
-                            st.write(f"- Satellites with TLE data loaded: {len(satellites_tle_data)}")
-                            st.write(f"- Positions successfully calculated: {len(debug_all_sat_positions)}")
-                            st.write(f"- Proximity radius: {proximity_radius} km")
-                            st.write("")
-                            
-                            st.write(f"**Satellite Details:**")
-                            for sat_config in tracked_satellites:
-                                catnr = sat_config['catnr']
-                                name = sat_config['name']
-                                sat_type = sat_config['type']
+                        # Collapsed by default and only built once opened, so the
+                        # per-satellite report isn't redone on every auto-refresh
+                        debug_expander = st.expander("🔍 Debug Information - Why are satellites not showing?", expanded=False, key="debug_expander", on_change="rerun")
+                        if debug_expander.open:
+                            with debug_expander:
+                                # Same batch-propagated positions as the profile panel
+                                # (tracked satellites at current_time), so nothing is
+                                # propagated again here
+                                debug_all_sat_positions = all_sat_positions
                                 
-                                has_tle = catnr in satellites_tle_data
-                                type_enabled = (show_stations and sat_type == 'station') or \
-                                             (show_satellites and sat_type == 'satellite') or \
-                                             (show_debris and sat_type == 'debris')
+                                st.markdown(
+                                    "**Configuration:**\n"
+                                    f"- Tracked satellites in config: {len(tracked_satellites)}\n"
+                                    f"- Satellites with TLE data loaded: {len(satellites_tle_data)}\n"
+                                    f"- Positions successfully calculated: {len(debug_all_sat_positions)}\n"
+                                    f"- Proximity radius: {proximity_radius} km"
+                                )
                                 
-                                st.write(f"**{name}** (CATNR: {catnr}, Type: {sat_type})")
+                                # Distance from the ISS for every calculated position in one pass
+                                debug_iss_xyz = np.array(lat_lon_alt_to_xyz(
+                                    position['latitude'],
+                                    position['longitude'],
+                                    position['altitude']
+                                ))
+                                debug_xyz = debug_all_sat_positions.xyz
+                                debug_distances = calculate_distance_3d(debug_xyz, debug_iss_xyz)
+                                debug_within_radius = debug_distances <= proximity_radius
                                 
-                                if not has_tle:
-                                    st.error(f"  ✗ No TLE data loaded - satellite fetch may have failed")
-                                elif not type_enabled:
-                                    st.warning(f"  ⚠ Type filter disabled - {sat_type} type is not shown")
-                                else:
-                                    # Calculate position and distance
-                                    try:
-                                        sat_tle = satellites_tle_data[catnr]
-                                        
-                                        # Check if TLE data has required fields
-                                        if 'TLE_LINE1' not in sat_tle or 'TLE_LINE2' not in sat_tle:
-                                            st.error(f"  ✗ Missing TLE_LINE1 or TLE_LINE2 in TLE data")
-                                            st.write(f"  - Available fields: {list(sat_tle.keys())}")
-                                            continue
-                                        
-                                        sat_obj = parse_tle_from_json(sat_tle)
-                                        from skyfield.api import load
-                                        ts = load.timescale()
-                                        skyfield_time = ts.from_datetime(current_time)
-                                        geocentric = sat_obj.at(skyfield_time)
-                                        subpoint = geocentric.subpoint()
-                                        
-                                        lat = subpoint.latitude.degrees
-                                        lon = subpoint.longitude.degrees
-                                        alt = subpoint.elevation.km
-                                        
-                                        # Check for NaN
-                                        if math.isnan(lat) or math.isnan(lon) or math.isnan(alt):
-                                            st.error(f"  ✗ Position calculation returned NaN")
-                                            st.write(f"  - Lat: {lat}, Lon: {lon}, Alt: {alt}")
-                                            st.write(f"  - TLE_LINE1: {sat_tle.get('TLE_LINE1', 'Missing')[:50]}...")
-                                            continue
-                                        
-                                        sat_x, sat_y, sat_z = lat_lon_alt_to_xyz(lat, lon, alt)
-                                        
-                                        # Check for NaN in converted coordinates
-                                        if math.isnan(sat_x) or math.isnan(sat_y) or math.isnan(sat_z):
-                                            st.error(f"  ✗ Coordinate conversion returned NaN")
-                                            continue
-                                        
-                                        # Calculate distance from ISS
-                                        iss_x, iss_y, iss_z = lat_lon_alt_to_xyz(
-                                            position['latitude'],
-                                            position['longitude'],
-                                            position['altitude']
+                                # Split the calculated positions into two tables with boolean masks;
+                                # satellites hidden by the type filter are listed below instead
+                                enabled_types = {t for t, shown in (('station', show_stations), ('satellite', show_satellites), ('debris', show_debris)) if shown}
+                                debug_type_enabled = np.isin(debug_all_sat_positions.types, list(enabled_types))
+                                debug_names = np.asarray(debug_all_sat_positions.names, dtype=object)
+                                for title, mask in (
+                                    (f"**Within {proximity_radius} km radius** (should be visible)", debug_type_enabled & debug_within_radius),
+                                    (f"**Outside {proximity_radius} km radius**", debug_type_enabled & ~debug_within_radius),
+                                ):
+                                    st.markdown(title)
+                                    st.dataframe(
+                                        {
+                                            "Name": debug_names[mask],
+                                            "CATNR": debug_all_sat_positions.catnr[mask],
+                                            "Type": debug_all_sat_positions.types[mask],
+                                            "Altitude (km)": np.round(debug_all_sat_positions.alt[mask]),
+                                            "Distance from ISS (km)": np.round(debug_distances[mask]),
+                                        },
+                                        hide_index=True,
+                                        use_container_width=True
+                                    )
+                                
+                                st.markdown("**Satellites without a distance:**")
+                                problem_count = 0
+                                for sat_config in tracked_satellites:
+                                    catnr = sat_config['catnr']
+                                    name = sat_config['name']
+                                    sat_type = sat_config['type']
+                                    
+                                    if catnr not in satellites_tle_data:
+                                        problem = ":red[✗ No TLE data loaded - satellite fetch may have failed]"
+                                    elif sat_type not in enabled_types:
+                                        problem = f":orange[⚠ Type filter disabled - {sat_type} type is not shown]"
+                                    elif catnr in debug_all_sat_positions.row_by_catnr:
+                                        continue
+                                    elif not REQUIRED_TLE_FIELDS.issubset(satellites_tle_data[catnr]):
+                                        # Element-only records are formatted into TLE lines, so this one
+                                        # also lacked usable orbital elements
+                                        problem = (
+                                            ":red[✗ Missing TLE_LINE1 or TLE_LINE2 in TLE data]\n"
+                                            f"- Available fields: {sorted(satellites_tle_data[catnr].keys())}"
+                                        )
+                                    else:
+                                        # Rows with NaN/inf positions were dropped by the batch calculation
+                                        problem = (
+                                            ":red[✗ Position calculation returned NaN]\n"
+                                            f"- TLE_LINE1: {satellites_tle_data[catnr]['TLE_LINE1'][:50]}..."
                                         )
-                                        distance = calculate_distance_3d((iss_x, iss_y, iss_z), (sat_x, sat_y, sat_z))
-                                        
-                                        within_radius = distance <= proximity_radius
-                                        
-                                        st.write(f"  - Position: ({sat_x:.0f}, {sat_y:.0f}, {sat_z:.0f}) km")
-                                        st.write(f"  - Altitude: {alt:.0f} km")
-                                        st.write(f"  - Distance from ISS: **{distance:.0f} km**")
-                                        
-                                        if within_radius:
-                                            st.success(f"  ✓ Within {proximity_radius} km radius - should be visible")
-                                        else:
-                                            st.warning(f"  ⚠ Outside {proximity_radius} km radius (need {distance - proximity_radius:.0f} km more)")
-                                            
-                                    except Exception as e:
-                                        st.error(f"  ✗ Error calculating position: {e}")
-                                        import traceback
-                                        st.code(traceback.format_exc())
+                                    
+                                    problem_count += 1
+                                    st.markdown(f"**{name}** (CATNR: {catnr}, Type: {sat_type})\n- {problem}")
                                 
-                                st.write("")
-                    
+                                if not problem_count:
+                                    st.caption("None - every tracked satellite is in one of the tables above")
+                        
                     # Info about 3D view
                     st.info("**3D View Features:**")
-                    st.markdown("""
-                    - **Earth**: Semi-transparent gray sphere (radius: 6,371 km)
-                    - **ISS Position**: Red dot showing current location
-                    - **Orbit Path**: Red line showing predicted path for next 90 minutes
-                    - **Stations**: Red markers (space stations)
-                    - **Satellites**: Blue markers (operational satellites)
-                    - **Debris**: Orange markers (space debris)
-                    - **Interactive**: Rotate, zoom, and pan to explore the 3D view
-                    - **Proximity Filter**: Only objects within the selected radius are shown
-                    """)
+                    st.markdown(TRACKED_VIEW_FEATURES_MD)
                 else:
                     # Fall back to orbital shell view if no tracked satellites
                     show_shell = st.session_state.get('show_orbital_shell', False)
@@ -2956,55 +3720,14 @@ if position and json_data:
                     st.plotly_chart(fig_3d, use_container_width=True, key="3d_plot_alt")
                     
                     # Status Bar at bottom
-                    st.markdown("---")
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    # Last conjunction check
-                    if conjunction_results and 'timestamp' in conjunction_results:
-                        try:
-                            check_time = datetime.fromisoformat(conjunction_results['timestamp'].replace('Z', '+00:00'))
-                            time_ago = current_time - check_time.replace(tzinfo=timezone.utc)
-                            hours_ago = time_ago.total_seconds() / 3600
-                            if hours_ago < 1:
-                                time_str = f"{int(time_ago.total_seconds() / 60)} minutes ago"
-                            else:
-                                time_str = f"{hours_ago:.1f} hours ago"
-                        except:
-                            time_str = conjunction_results['timestamp']
-                    else:
-                        time_str = "Never"
-                    
-                    with col1:
-                        st.caption(f"**Last conjunction check:** {time_str}")
-                    
-                    # Next check (placeholder for Phase 3)
-                    with col2:
-                        st.caption("**Next check:** Scheduled (Phase 3)")
-                    
-                    # Tracking stats
-                    active_risks = 0
-                    if conjunction_results and 'results' in conjunction_results:
-                        active_risks = len([r for r in conjunction_results['results'] if r.get('risk_level') in ['CRITICAL', 'HIGH RISK']])
+                    status_col = render_status_bar(conjunction_results, current_time, active_risks)
                     
-                    with col3:
-                        st.caption(f"**Tracking:** 0 objects | {active_risks} active risks")
-                    
-                    with col4:
-                        if active_risks > 0:
-                            st.warning(f"⚠️ {active_risks} active risk(s) detected")
-                        else:
-                            st.success("✅ No active risks")
-                        
+                    with status_col:
                         # Info about 3D view
                         st.info("**3D View Features:**")
-                        features_text = """
-                        - **Earth**: Semi-transparent gray sphere (radius: 6,371 km)
-                        - **ISS Position**: Red dot showing current location
-                        - **Orbit Path**: Red line showing predicted path for next 90 minutes
-                        - **Interactive**: Rotate, zoom, and pan to explore the 3D view
-                        """
+                        features_text = ORBIT_VIEW_FEATURES_MD
                         if show_shell:
-                            features_text += f"\n- **Orbital Shell**: White dots showing {max_sats} satellites from '{sat_group}' group"
+                            features_text += f"- **Orbital Shell**: White dots showing {max_sats} satellites from '{sat_group}' group\n"
                         st.markdown(features_text)
                         
                     if not tracked_satellites:
@@ -3017,26 +3740,7 @@ if position and json_data:
     # Auto-refresh indicator (below tabs)
     st.markdown("---")
     
-    # Initialize refresh tracking
-    if 'last_refresh_time' not in st.session_state:
-        st.session_state.last_refresh_time = datetime.now(timezone.utc).timestamp()
-    
-    # Calculate time since last refresh
-    current_timestamp = datetime.now(timezone.utc).timestamp()
-    elapsed = current_timestamp - st.session_state.last_refresh_time
-    
-    # Show countdown
-    remaining_seconds = max(0, 10 - int(elapsed))
-    refresh_placeholder = st.empty()
-    with refresh_placeholder:
-        st.caption(f"🔄 Auto-refreshing in {remaining_seconds} seconds...")
-    
-    # Only rerun if 10 seconds have passed AND we haven't rerun recently
-    if elapsed >= 10:
-        st.session_state.last_refresh_time = current_timestamp
-        # Use rerun with a small delay to prevent rapid loops
-        import time
-        time.sleep(0.5)  # Small delay to stabilize
-        st.rerun()
+    # Timer-driven refresh (see render_auto_refresh)
+    render_auto_refresh(now_utc.timestamp())
 else:
     st.error("Unable to load ISS position data. Please check your data source.")
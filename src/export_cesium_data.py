@@ -33,8 +33,9 @@ from typing import List, Dict, Optional
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from skyfield.api import load, EarthSatellite
-from iss_tracker_json import parse_tle_from_json
+import numpy as np
+from skyfield.api import EarthSatellite, wgs84
+from iss_tracker_json import get_timescale, parse_tle_from_json
 
 
 def calculate_positions_over_time(
@@ -55,40 +56,32 @@ def calculate_positions_over_time(
     Returns:
         list: List of position dictionaries with time, lat, lon, alt_km
     """
-    ts = load.timescale()
-    positions = []
+    ts = get_timescale()
     
-    num_steps = (duration_minutes * 60) // step_seconds + 1
+    # Propagate every step with one Skyfield time array instead of one
+    # satellite.at() and subpoint() per sample
+    offsets = np.arange((duration_minutes * 60) // step_seconds + 1) * step_seconds
+    skyfield_times = ts.from_datetime(start_time) + offsets / 86400.0
+    geo_position = wgs84.geographic_position_of(satellite.at(skyfield_times))
     
-    for i in range(num_steps):
-        # Calculate time for this step
-        current_time = start_time + timedelta(seconds=i * step_seconds)
-        skyfield_time = ts.from_datetime(current_time)
-        
-        try:
-            # Calculate position
-            geocentric = satellite.at(skyfield_time)
-            subpoint = geocentric.subpoint()
-            
-            lat = subpoint.latitude.degrees
-            lon = subpoint.longitude.degrees
-            alt_km = subpoint.elevation.km
-            
-            # Skip if NaN
-            if any(map(lambda x: x != x, [lat, lon, alt_km])):  # NaN check
-                continue
-            
-            positions.append({
-                'time': current_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                'lat': round(lat, 4),
-                'lon': round(lon, 4),
-                'alt_km': round(alt_km, 1)
-            })
-            
-        except Exception as e:
-            # Skip positions that can't be calculated
-            print(f"Warning: Could not calculate position at {current_time}: {e}")
-            continue
+    lats = geo_position.latitude.degrees
+    lons = geo_position.longitude.degrees
+    alts = geo_position.elevation.km
+    
+    # Skip samples SGP4 could not propagate (NaN)
+    valid = np.isfinite(lats) & np.isfinite(lons) & np.isfinite(alts)
+    
+    positions = [
+        {
+            'time': (start_time + timedelta(seconds=offset)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'lat': round(lat, 4),
+            'lon': round(lon, 4),
+            'alt_km': round(alt_km, 1)
+        }
+        for offset, lat, lon, alt_km in zip(
+            offsets[valid].tolist(), lats[valid].tolist(), lons[valid].tolist(), alts[valid].tolist()
+        )
+    ]
     
     return positions
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Geometry Kernels
+
+Numeric helpers shared by the dashboard's 3D views. Numba is used to JIT the
+tight loops when it is installed; otherwise the NumPy versions are used, so
+Numba stays an optional dependency.
+
+Kept out of dashboard.py because Streamlit re-executes the dashboard script on
+every rerun, while this module is imported (and compiled) once per process.
+
+Author: SatWatch Project
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# WGS84 ellipsoid (same model Skyfield's wgs84 uses)
+WGS84_RADIUS_KM = 6378.137
+WGS84_FLATTENING = 1 / 298.257223563
+WGS84_E2 = 2 * WGS84_FLATTENING - WGS84_FLATTENING ** 2
+
+
+def pairwise_min_distance_numpy(points: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Distance from each point to its nearest target, using NumPy broadcasting.
+
+    Args:
+        points: Array of shape (N, 3) with x, y, z in kilometers
+        targets: Array of shape (T, 3) with x, y, z in kilometers (T >= 1)
+
+    Returns:
+        np.ndarray: Array of shape (N,) with the minimum distance in kilometers.
+            A NaN coordinate in the point or in any target gives NaN.
+    """
+    diff = points[:, None, :] - targets[None, :, :]
+    return np.sqrt((diff * diff).sum(axis=-1)).min(axis=1)
+
+
+def any_within_radius_numpy(points: np.ndarray, targets: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Flag the points that lie within radius of at least one target, using NumPy.
+
+    Squared distances are compared against radius squared, so no square roots
+    are taken.
+
+    Args:
+        points: Array of shape (N, 3) with x, y, z in kilometers
+        targets: Array of shape (T, 3) with x, y, z in kilometers
+        radius: Distance threshold in kilometers
+
+    Returns:
+        np.ndarray: Boolean array of shape (N,). Points with NaN coordinates
+            are never within the radius.
+    """
+    diff = points[:, None, :] - targets[None, :, :]
+    return ((diff * diff).sum(axis=-1) <= radius * radius).any(axis=1)
+
+
+def spherical_to_cartesian_numpy(lat_deg: np.ndarray, lon_deg: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """
+    Convert latitude/longitude/radius to x, y, z on a sphere, using NumPy.
+
+    Args:
+        lat_deg: 1-D array of latitudes in degrees
+        lon_deg: 1-D array of longitudes in degrees
+        radius: 1-D array of distances from Earth's center in kilometers
+
+    Returns:
+        np.ndarray: Array of shape (N, 3) with x, y, z in kilometers
+    """
+    lat_rad = np.radians(lat_deg)
+    lon_rad = np.radians(lon_deg)
+    r_cos_lat = radius * np.cos(lat_rad)
+    return np.stack([r_cos_lat * np.cos(lon_rad), r_cos_lat * np.sin(lon_rad), radius * np.sin(lat_rad)], axis=-1)
+
+
+def teme_to_geodetic(r_teme: np.ndarray, gmst_radians: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert TEME positions to WGS84 latitude/longitude/elevation.
+    
+    TEME is taken to Earth-fixed coordinates with a single rotation by
+    Greenwich mean sidereal time (polar motion ignored), then converted to
+    geodetic coordinates with the same three-step latitude iteration as
+    Skyfield's wgs84. This skips the GCRS round trip and its nutation and
+    precession, which only moves the result by metres.
+    
+    Args:
+        r_teme: Array of shape (N, 3) with TEME x, y, z in kilometers
+        gmst_radians: Greenwich mean sidereal time in radians
+        
+    Returns:
+        tuple: (latitudes, longitudes, elevations) arrays in degrees, degrees,
+            km. Rows with NaN coordinates give NaN.
+    """
+    cos_g, sin_g = np.cos(gmst_radians), np.sin(gmst_radians)
+    x = cos_g * r_teme[:, 0] + sin_g * r_teme[:, 1]
+    y = cos_g * r_teme[:, 1] - sin_g * r_teme[:, 0]
+    z = r_teme[:, 2]
+    
+    R = np.hypot(x, y)
+    lat = np.arctan2(z, R)
+    for _ in range(3):
+        sin_lat = np.sin(lat)
+        e2_sin_lat = WGS84_E2 * sin_lat
+        a_c = WGS84_RADIUS_KM / np.sqrt(1.0 - e2_sin_lat * sin_lat)
+        hyp = z + a_c * e2_sin_lat
+        lat = np.arctan2(hyp, R)
+    
+    elevation = np.hypot(hyp, R) - a_c
+    return np.degrees(lat), np.degrees(np.arctan2(y, x)), elevation
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def spherical_to_cartesian(lat_deg: np.ndarray, lon_deg: np.ndarray, radius: np.ndarray) -> np.ndarray:
+        """
+        Convert latitude/longitude/radius to x, y, z on a sphere (Numba kernel).
+
+        Same contract as spherical_to_cartesian_numpy, in one pass without
+        temporary arrays.
+        """
+        n = lat_deg.shape[0]
+        out = np.empty((n, 3))
+        for i in range(n):
+            lat_rad = np.radians(lat_deg[i])
+            lon_rad = np.radians(lon_deg[i])
+            r_cos_lat = radius[i] * np.cos(lat_rad)
+            out[i, 0] = r_cos_lat * np.cos(lon_rad)
+            out[i, 1] = r_cos_lat * np.sin(lon_rad)
+            out[i, 2] = radius[i] * np.sin(lat_rad)
+        return out
+
+    @njit(cache=True)
+    def pairwise_min_distance(points: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Distance from each point to its nearest target (Numba kernel).
+
+        Same contract as pairwise_min_distance_numpy, but never allocates the
+        (N, T, 3) difference array. A NaN coordinate in the point or in any
+        target gives NaN, as with np.min.
+        """
+        n = points.shape[0]
+        out = np.empty(n)
+        for i in range(n):
+            best = np.inf
+            for j in range(targets.shape[0]):
+                dx = points[i, 0] - targets[j, 0]
+                dy = points[i, 1] - targets[j, 1]
+                dz = points[i, 2] - targets[j, 2]
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 != d2:
+                    best = d2
+                    break
+                if d2 < best:
+                    best = d2
+            out[i] = np.sqrt(best)
+        return out
+
+    @njit(cache=True, parallel=True)
+    def any_within_radius(points: np.ndarray, targets: np.ndarray, radius: float) -> np.ndarray:
+        """
+        Flag the points that lie within radius of at least one target (Numba kernel).
+
+        Same contract as any_within_radius_numpy. Points are split across
+        threads, and each point stops at the first target inside the radius.
+        """
+        n = points.shape[0]
+        radius_sq = radius * radius
+        out = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            for j in range(targets.shape[0]):
+                dx = points[i, 0] - targets[j, 0]
+                dy = points[i, 1] - targets[j, 1]
+                dz = points[i, 2] - targets[j, 2]
+                if dx * dx + dy * dy + dz * dz <= radius_sq:
+                    out[i] = True
+                    break
+        return out
+else:
+    any_within_radius = any_within_radius_numpy
+    spherical_to_cartesian = spherical_to_cartesian_numpy
+    pairwise_min_distance = pairwise_min_distance_numpy
@@ -9,12 +9,32 @@ Author: SatWatch Project
 """
 
 import json
+import math
 import os
 import requests
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from skyfield.api import load, EarthSatellite
 
+# Orbital elements needed to build TLE lines when a record has none
+ORBITAL_ELEMENT_FIELDS = ('MEAN_MOTION', 'ECCENTRICITY', 'INCLINATION',
+                          'RA_OF_ASC_NODE', 'ARG_OF_PERICENTER', 'MEAN_ANOMALY', 'EPOCH')
+
+
+@lru_cache(maxsize=None)
+def get_timescale():
+    """
+    Return a shared Skyfield timescale.
+    
+    Building a timescale loads leap-second and Delta T tables, so it is done
+    once per process instead of for every satellite parsed.
+    
+    Returns:
+        Timescale: Skyfield timescale object
+    """
+    return load.timescale()
+
 
 def extract_epoch_from_tle_line1(tle_line1: str) -> str:
     """
@@ -192,40 +212,59 @@ def download_iss_tle_json() -> dict:
     )
 
 
+def tle_checksum(line: str) -> int:
+    """
+    Compute the modulo-10 checksum of a TLE line (digits count as their value, '-' as 1).
+    """
+    return sum(int(c) if c.isdigit() else c == '-' for c in line[:68]) % 10
+
+
+def format_tle_decimal(value: float) -> str:
+    """
+    Format a value below 1 in TLE decimal-point form, e.g. ' .00009674'.
+    """
+    return ('-' if value < 0 else ' ') + f"{abs(value):.8f}"[1:]
+
+
+def format_tle_exponent(value: float) -> str:
+    """
+    Format a value in TLE assumed-decimal exponent form, e.g. ' 18216-3' for 0.18216e-3.
+    """
+    if value == 0:
+        return " 00000+0"
+    exponent = math.floor(math.log10(abs(value))) + 1
+    mantissa = round(abs(value) / 10 ** exponent * 1e5)
+    if mantissa == 100000:
+        mantissa, exponent = 10000, exponent + 1
+    return f"{'-' if value < 0 else ' '}{mantissa:05d}{'-' if exponent < 0 else '+'}{abs(exponent)}"
+
+
 def format_tle_line1(norad_id: int, classification: str, element_set_no: int, 
                      epoch_dt, mean_motion_dot: float, bstar: float) -> str:
     """
     Format TLE Line 1 according to standard TLE format.
     
     Format: 1 NNNNNU NNNNNAAA NNNNN.NNNNNNNN +.NNNNNNNN +NNNNN-N +NNNNN-N N NNNNN
+    (the international designator is left blank)
     """
-    # Calculate day of year
-    day_of_year = epoch_dt.timetuple().tm_yday
-    year_short = epoch_dt.year % 100
-    
     # Format epoch as YYDDD.DDDDDDDD
-    fractional_day = (epoch_dt.hour * 3600 + epoch_dt.minute * 60 + epoch_dt.second) / 86400.0
-    epoch_str = f"{year_short:02d}{day_of_year:03d}.{fractional_day:8.8f}"[:14]
-    
-    # Format mean motion dot (rev/day^2) - convert to rev/day^2 format
-    mm_dot_str = f"{mean_motion_dot:+.8f}"[:10]
-    
-    # Format BSTAR (drag term) - convert to scientific notation format
-    bstar_exp = int(abs(bstar) * 1e5)
-    bstar_sign = '-' if bstar < 0 else '+'
-    bstar_str = f"{bstar_sign}{bstar_exp:05d}"
-    
-    # Build line 1
-    line1 = (f"1 {norad_id:05d}{classification} "
-             f"{element_set_no:04d}A "
-             f"{epoch_str:<14} "
-             f"{mm_dot_str} "
-             f"00000+0 "
-             f"{bstar_str}-0 "
+    day_of_year = epoch_dt.timetuple().tm_yday
+    fractional_day = (
+        epoch_dt.hour * 3600 + epoch_dt.minute * 60 + epoch_dt.second + epoch_dt.microsecond / 1e6
+    ) / 86400.0
+    epoch_str = f"{epoch_dt.year % 100:02d}{day_of_year + fractional_day:012.8f}"
+    
+    # Build line 1 (second derivative of mean motion is not in the JSON, so zero)
+    line1 = (f"1 {int(norad_id):05d}{classification} "
+             f"{'':8} "
+             f"{epoch_str} "
+             f"{format_tle_decimal(mean_motion_dot)} "
+             f"{format_tle_exponent(0)} "
+             f"{format_tle_exponent(bstar)} "
              f"0 "
-             f"{element_set_no:05d}")
+             f"{int(element_set_no) % 10000:4d}")
     
-    return line1.ljust(69)
+    return line1 + str(tle_checksum(line1))
 
 
 def format_tle_line2(norad_id: int, inclination: float, raan: float,
@@ -240,31 +279,37 @@ def format_tle_line2(norad_id: int, inclination: float, raan: float,
     ecc_str = f"{int(eccentricity * 1e7):07d}"
     
     # Build line 2
-    line2 = (f"2 {norad_id:05d} "
+    line2 = (f"2 {int(norad_id):05d} "
              f"{inclination:8.4f} "
              f"{raan:8.4f} "
              f"{ecc_str} "
              f"{arg_perigee:8.4f} "
              f"{mean_anomaly:8.4f} "
              f"{mean_motion:11.8f}"
-             f"{rev_at_epoch:05d}")
+             f"{int(rev_at_epoch) % 100000:5d}")
     
-    return line2.ljust(69)
+    return line2 + str(tle_checksum(line2))
 
 
-def create_satellite_from_elements(json_data: dict) -> EarthSatellite:
+def tle_lines_from_elements(json_data: dict) -> tuple[str, str]:
     """
-    Create a Skyfield EarthSatellite from individual orbital elements.
-    
-    Constructs proper TLE lines from orbital elements and creates an EarthSatellite.
+    Construct TLE lines from individual orbital elements.
     
     Args:
-        json_data: Dictionary containing orbital elements
+        json_data: Dictionary containing orbital elements (see ORBITAL_ELEMENT_FIELDS)
         
     Returns:
-        EarthSatellite: Skyfield satellite object ready for calculations
+        tuple: (line1, line2) in standard TLE format
+        
+    Raises:
+        ValueError: If orbital elements are missing or EPOCH can't be parsed
     """
-    from datetime import datetime
+    missing = [f for f in ORBITAL_ELEMENT_FIELDS if f not in json_data]
+    if missing:
+        raise ValueError(
+            f"Invalid JSON data: Missing TLE_LINE1/TLE_LINE2 and missing "
+            f"orbital elements: {', '.join(missing)}"
+        )
     
     # Extract orbital elements
     epoch_str = json_data.get('EPOCH', '')
@@ -280,7 +325,6 @@ def create_satellite_from_elements(json_data: dict) -> EarthSatellite:
     norad_id = json_data.get('NORAD_CAT_ID', 25544)
     classification = json_data.get('CLASSIFICATION_TYPE', 'U')
     rev_at_epoch = json_data.get('REV_AT_EPOCH', 0)
-    name = json_data.get('OBJECT_NAME', 'ISS')
     
     # Parse epoch
     try:
@@ -293,9 +337,26 @@ def create_satellite_from_elements(json_data: dict) -> EarthSatellite:
                              epoch_dt, mean_motion_dot, bstar)
     line2 = format_tle_line2(norad_id, inclination, raan, eccentricity,
                             arg_perigee, mean_anomaly, mean_motion, rev_at_epoch)
+    return line1, line2
+
+
+def create_satellite_from_elements(json_data: dict) -> EarthSatellite:
+    """
+    Create a Skyfield EarthSatellite from individual orbital elements.
+    
+    Constructs proper TLE lines from orbital elements and creates an EarthSatellite.
+    
+    Args:
+        json_data: Dictionary containing orbital elements
+        
+    Returns:
+        EarthSatellite: Skyfield satellite object ready for calculations
+    """
+    line1, line2 = tle_lines_from_elements(json_data)
+    name = json_data.get('OBJECT_NAME', 'ISS')
     
     # Create the satellite object
-    ts = load.timescale()
+    ts = get_timescale()
     satellite = EarthSatellite(line1, line2, name, ts)
     
     return satellite
@@ -328,24 +389,14 @@ def parse_tle_from_json(json_data: dict) -> EarthSatellite:
             raise ValueError(f"Invalid TLE format in JSON data")
         
         # Create the satellite object from TLE data
-        ts = load.timescale()
+        ts = get_timescale()
         satellite = EarthSatellite(line1, line2, name, ts)
         return satellite
     
     # If TLE lines are missing, create satellite from orbital elements
-    # Check if we have the required orbital elements
-    required_fields = ['MEAN_MOTION', 'ECCENTRICITY', 'INCLINATION', 
-                      'RA_OF_ASC_NODE', 'ARG_OF_PERICENTER', 'MEAN_ANOMALY', 'EPOCH']
-    
-    if all(field in json_data for field in required_fields):
-        print("  Creating satellite from orbital elements...")
-        return create_satellite_from_elements(json_data)
-    else:
-        missing = [f for f in required_fields if f not in json_data]
-        raise ValueError(
-            f"Invalid JSON data: Missing TLE_LINE1/TLE_LINE2 and missing "
-            f"orbital elements: {', '.join(missing)}"
-        )
+    # (create_satellite_from_elements raises if any are missing)
+    print("  Creating satellite from orbital elements...")
+    return create_satellite_from_elements(json_data)
 
 
 def calculate_iss_position(satellite: EarthSatellite) -> dict:
@@ -359,7 +410,7 @@ def calculate_iss_position(satellite: EarthSatellite) -> dict:
         dict: Dictionary containing latitude, longitude, altitude, and timestamp
     """
     # Load the timescale (needed for time calculations)
-    ts = load.timescale()
+    ts = get_timescale()
     
     # Get the current time
     current_time = ts.now()
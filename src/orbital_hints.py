@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Orbital Data Hints
+
+Short descriptions shown next to a satellite's inclination, eccentricity and
+orbital period in the dashboard's profile panel (e.g. 'Polar orbit').
+
+Kept out of dashboard.py so the lookup tables can be imported (and tested)
+without running the Streamlit script.
+
+Author: SatWatch Project
+"""
+
+import bisect
+import math
+from typing import Final, Optional
+
+# Orbital data hints as (bin edges, labels) for classify_orbit_value; a value
+# falls in the bin to the left of the first edge above it, None means no hint.
+# Edges that are exclusive lower bounds (inclination > 80°, period > 1400 min)
+# are nudged up by one float step so the edge value itself stays in the lower
+# bin. Polar orbits are checked before sun-synchronous ones (98.7° ± 5°), so
+# only the part of that band from 100° is labelled sun-synchronous.
+INCLINATION_HINTS: Final[tuple] = (
+    (10, math.nextafter(80, math.inf), 100, 103.7),
+    ('Near-equatorial', None, 'Polar orbit', 'Sun-synchronous', None)
+)
+ECCENTRICITY_HINTS: Final[tuple] = (
+    (0.01, 0.1),
+    ('Near-circular', 'Slightly elliptical', 'Elliptical')
+)
+PERIOD_HINTS: Final[tuple] = (                          # Minutes
+    (100, 720, math.nextafter(1400, math.inf), 1450),
+    ('Low Earth Orbit', 'LEO/MEO', None, 'Geostationary', None)
+)
+
+
+def classify_orbit_value(value: float, hints: tuple) -> Optional[str]:
+    """
+    Look up the orbital data hint for a value.
+
+    Args:
+        value: Orbital parameter (inclination, eccentricity or period)
+        hints: (bin edges, labels) pair such as INCLINATION_HINTS
+
+    Returns:
+        str: Hint label, or None if the value's bin has no hint
+    """
+    edges, labels = hints
+    return labels[bisect.bisect_right(edges, value)]
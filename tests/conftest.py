@@ -0,0 +1,39 @@
+"""Shared pytest fixtures for SatWatch tests."""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture(scope="session")
+def dashboard():
+    """
+    The helper functions defined in dashboard.py, without running the page.
+
+    dashboard.py is a Streamlit script, so importing it would render the
+    whole app. Only the definitions above the '# Page configuration' marker
+    are executed; Streamlit's caches work in bare mode.
+    """
+    path = SRC_DIR / 'dashboard.py'
+    definitions = path.read_text(encoding='utf-8').split('\n# Page configuration\n', 1)[0]
+    module = types.ModuleType('dashboard')
+    module.__file__ = str(path)
+    # Registered so st.cache_data can pickle classes defined in the module
+    sys.modules['dashboard'] = module
+    exec(compile(definitions, str(path), 'exec'), module.__dict__)
+    return module
+
+
+@pytest.fixture
+def iss_record():
+    """The ISS record from data/iss_tle.json (TLE lines and orbital elements)."""
+    with open(DATA_DIR / 'iss_tle.json', 'r', encoding='utf-8') as f:
+        return json.load(f)[0]
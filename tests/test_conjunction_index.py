@@ -0,0 +1,72 @@
+"""Tests for the dashboard's conjunction risk lookups."""
+
+
+def conjunction(sat1: str, sat2: str, distance_km: float, risk_level: str = 'NORMAL') -> dict:
+    """Conjunction result in the format written by conjunction_risk.py."""
+    return {
+        'sat1_name': sat1,
+        'sat2_name': sat2,
+        'min_distance_km': distance_km,
+        'min_distance_time': '2026-01-10T03:00:00Z',
+        'risk_level': risk_level,
+        'sat1_position_at_closest': {'lat': 1.0},
+        'sat2_position_at_closest': {'lat': 2.0},
+    }
+
+
+RESULTS = {'results': [
+    conjunction('HUBBLE', 'ISS (ZARYA)', 50.0, 'MEDIUM'),
+    conjunction('ISS (ZARYA)', 'STARLINK-1', 5.0, 'HIGH'),
+    conjunction('ISS DEB', 'ISS (ZARYA)', 1.0, 'HIGH'),
+    conjunction('TIANGONG', 'HUBBLE', 200.0),
+]}
+
+
+def test_get_satellite_risks_exact_name(dashboard):
+    """Test that an exact name returns that satellite's side of each result."""
+    index = dashboard.index_conjunctions(RESULTS)
+    risks = dashboard.get_satellite_risks(index, 20580, 'HUBBLE')
+    assert [risk['other_satellite'] for risk in risks] == ['ISS (ZARYA)', 'TIANGONG']
+    assert risks[0]['position_at_closest'] == {'lat': 1.0}
+    assert risks[1]['position_at_closest'] == {'lat': 2.0}
+    assert risks[0]['time_str'] == '2026-01-10 03:00:00 UTC'
+
+
+def test_get_satellite_risks_short_name(dashboard):
+    """Test that a short config name ('ISS') falls back to a substring match."""
+    index = dashboard.index_conjunctions(RESULTS)
+    risks = dashboard.get_satellite_risks(index, 25544, 'ISS')
+    assert [risk['distance_km'] for risk in risks] == [50.0, 5.0, 1.0]
+    assert dashboard.get_satellite_risks(index, 0, 'UNKNOWN') == []
+
+
+def test_get_satellite_risks_both_sides_reported_once(dashboard):
+    """Test that a result matching both sides is reported once, as sat1."""
+    index = dashboard.index_conjunctions(RESULTS)
+    risks = dashboard.get_satellite_risks(index, 25544, 'ISS')
+    both = [risk for risk in risks if risk['distance_km'] == 1.0]
+    assert len(both) == 1
+    assert both[0]['other_satellite'] == 'ISS (ZARYA)'
+    assert both[0]['position_at_closest'] == {'lat': 1.0}
+
+
+def test_get_satellite_risks_keeps_result_order(dashboard):
+    """Test that risks come back in result order, not grouped by name."""
+    results = {'results': [
+        conjunction('ISS DEB', 'COSMOS', 3.0),
+        conjunction('ISS (ZARYA)', 'HUBBLE', 2.0),
+        conjunction('COSMOS', 'ISS DEB', 1.0),
+        conjunction('ISS (ZARYA)', 'ISS DEB', 0.5),
+    ]}
+    index = dashboard.index_conjunctions(results)
+    risks = dashboard.get_satellite_risks(index, 25544, 'ISS')
+    assert [risk['distance_km'] for risk in risks] == [3.0, 2.0, 1.0, 0.5]
+    # Result 3 matches both sides and was indexed under 'ISS DEB' first
+    assert risks[3]['other_satellite'] == 'ISS DEB'
+
+
+def test_index_conjunctions_same_name_both_sides(dashboard):
+    """Test that a result with the same name on both sides is indexed once."""
+    index = dashboard.index_conjunctions({'results': [conjunction('ISS', 'ISS', 0.1)]})
+    assert len(index['ISS']) == 1
+    assert dashboard.index_conjunctions({}) == {}
@@ -0,0 +1,47 @@
+"""Tests for the dashboard's tracked-satellite downloads."""
+
+from unittest.mock import Mock, patch
+
+import requests
+
+
+def three_line_response(record: dict) -> Mock:
+    """Mock CelesTrak 3LE response for a record."""
+    response = Mock()
+    response.status_code = 200
+    response.text = f"{record['OBJECT_NAME']}\n{record['TLE_LINE1']}\n{record['TLE_LINE2']}\n"
+    response.raise_for_status = Mock()
+    return response
+
+
+def test_fetch_satellites_failure_is_not_cached(dashboard, iss_record):
+    """Test that a failed download is retried on the next call."""
+    dashboard.fetch_satellite.clear()
+    session = Mock()
+    session.get.side_effect = [
+        requests.ConnectionError("connection reset"),
+        three_line_response(iss_record),
+    ]
+    with patch.object(dashboard, 'get_http_session', return_value=session), \
+            patch.object(dashboard.st, 'warning') as warning:
+        assert dashboard.fetch_satellites((25544,)) == []
+        warning.assert_called_once()
+
+        satellites = dashboard.fetch_satellites((25544,))
+
+    assert [sat['NORAD_CAT_ID'] for sat in satellites] == ['25544']
+    assert satellites[0]['TLE_LINE1'] == iss_record['TLE_LINE1']
+    assert session.get.call_count == 2
+
+
+def test_fetch_satellites_success_is_cached(dashboard, iss_record):
+    """Test that a successful download is reused."""
+    dashboard.fetch_satellite.clear()
+    session = Mock()
+    session.get.return_value = three_line_response(iss_record)
+    with patch.object(dashboard, 'get_http_session', return_value=session):
+        first = dashboard.fetch_satellites((25544,))
+        second = dashboard.fetch_satellites((25544,))
+
+    assert first == second
+    assert session.get.call_count == 1
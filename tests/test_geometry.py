@@ -0,0 +1,80 @@
+"""Tests for the vectorised geometry helpers."""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from sgp4.api import Satrec
+from skyfield.api import wgs84
+
+from geometry import (
+    any_within_radius,
+    any_within_radius_numpy,
+    pairwise_min_distance,
+    pairwise_min_distance_numpy,
+    teme_to_geodetic,
+)
+from iss_tracker_json import get_timescale, parse_tle_from_json
+
+POINTS = np.array([
+    [7000.0, 0.0, 0.0],
+    [0.0, 7100.0, 0.0],
+    [np.nan, 0.0, 0.0],
+    [0.0, 0.0, 42164.0],
+])
+TARGETS = np.array([
+    [7000.0, 10.0, 0.0],
+    [0.0, 7000.0, 0.0],
+])
+
+
+def test_pairwise_min_distance_matches_numpy():
+    """Test that the kernel and the NumPy version agree, NaN rows included."""
+    expected = pairwise_min_distance_numpy(POINTS, TARGETS)
+    np.testing.assert_allclose(pairwise_min_distance(POINTS, TARGETS), expected)
+    assert expected[0] == pytest.approx(10.0)
+    assert expected[1] == pytest.approx(100.0)
+    assert np.isnan(expected[2])
+
+
+def test_pairwise_min_distance_nan_target():
+    """Test that a NaN target gives NaN in both versions."""
+    targets = np.vstack([TARGETS, [np.nan, np.nan, np.nan]])
+    assert np.isnan(pairwise_min_distance_numpy(POINTS, targets)).all()
+    assert np.isnan(pairwise_min_distance(POINTS, targets)).all()
+
+
+def test_any_within_radius_matches_numpy():
+    """Test that the kernel and the NumPy version agree, NaN rows included."""
+    expected = any_within_radius_numpy(POINTS, TARGETS, 50.0)
+    np.testing.assert_array_equal(any_within_radius(POINTS, TARGETS, 50.0), expected)
+    assert expected.tolist() == [True, False, False, False]
+
+
+@pytest.mark.parametrize("hours", [0, 6, 24, 72])
+def test_teme_to_geodetic_matches_skyfield(dashboard, iss_record, hours):
+    """Test that the batch path agrees with Skyfield's wgs84 to within metres."""
+    satellite = parse_tle_from_json(iss_record)
+    target_time = satellite.epoch.utc_datetime() + timedelta(hours=hours)
+    tle_pair = (iss_record['TLE_LINE1'], iss_record['TLE_LINE2'])
+    lat, lon, alt = dashboard.batch_geographic_positions((tle_pair,), target_time)
+
+    expected = wgs84.geographic_position_of(
+        satellite.at(get_timescale().from_datetime(target_time))
+    )
+    # ~2 m of agreement (all in longitude); 5e-5 degrees is ~5 m on the ground
+    assert lat[0] == pytest.approx(expected.latitude.degrees, abs=5e-5)
+    assert lon[0] == pytest.approx(expected.longitude.degrees, abs=5e-5)
+    assert alt[0] == pytest.approx(expected.elevation.km, abs=0.005)
+
+
+def test_teme_to_geodetic_nan_row(iss_record):
+    """Test that a NaN row gives NaN without affecting the other rows."""
+    satrec = Satrec.twoline2rv(iss_record['TLE_LINE1'], iss_record['TLE_LINE2'])
+    _, r_teme, _ = satrec.sgp4(satrec.jdsatepoch, satrec.jdsatepochF)
+    gmst = get_timescale().tt_jd(satrec.jdsatepoch + satrec.jdsatepochF).gmst * (np.pi / 12)
+
+    single = teme_to_geodetic(np.array([r_teme]), gmst)
+    lat, lon, alt = teme_to_geodetic(np.array([r_teme, [np.nan] * 3]), gmst)
+    assert [lat[0], lon[0], alt[0]] == [value[0] for value in single]
+    assert np.isnan([lat[1], lon[1], alt[1]]).all()
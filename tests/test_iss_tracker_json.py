@@ -0,0 +1,44 @@
+"""Tests for building TLE lines from CelesTrak orbital elements."""
+
+import pytest
+from sgp4.api import Satrec
+
+from iss_tracker_json import format_tle_exponent, tle_checksum, tle_lines_from_elements
+
+
+def test_tle_lines_from_elements_match_published_tle(iss_record):
+    """Test that formatted lines parse to the same elements as the real TLE."""
+    line1, line2 = tle_lines_from_elements(iss_record)
+    assert len(line1) == len(line2) == 69
+    assert int(line1[-1]) == tle_checksum(line1)
+    assert int(line2[-1]) == tle_checksum(line2)
+
+    formatted = Satrec.twoline2rv(line1, line2)
+    published = Satrec.twoline2rv(iss_record['TLE_LINE1'], iss_record['TLE_LINE2'])
+    assert formatted.jdsatepoch + formatted.jdsatepochF == pytest.approx(
+        published.jdsatepoch + published.jdsatepochF, abs=1e-8
+    )
+    for element in ('bstar', 'ndot', 'ecco', 'inclo', 'nodeo', 'argpo', 'mo', 'no_kozai'):
+        assert getattr(formatted, element) == pytest.approx(getattr(published, element))
+
+
+def test_tle_checksum_published_lines(iss_record):
+    """Test the checksum against CelesTrak's own lines."""
+    assert tle_checksum(iss_record['TLE_LINE1']) == int(iss_record['TLE_LINE1'][-1])
+    assert tle_checksum(iss_record['TLE_LINE2']) == int(iss_record['TLE_LINE2'][-1])
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.00018216, ' 18216-3'),
+    (-0.000011, '-11000-4'),
+    (0.0, ' 00000+0'),
+])
+def test_format_tle_exponent(value, expected):
+    """Test TLE assumed-decimal exponent formatting."""
+    assert format_tle_exponent(value) == expected
+
+
+def test_tle_lines_from_elements_missing_elements():
+    """Test that records without lines or elements are rejected."""
+    with pytest.raises(ValueError, match="MEAN_MOTION"):
+        tle_lines_from_elements({'OBJECT_NAME': 'ISS', 'EPOCH': '2026-01-09T18:57:52'})
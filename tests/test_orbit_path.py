@@ -0,0 +1,33 @@
+"""Tests for the dashboard's cached orbit path."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from iss_tracker_json import parse_tle_from_json
+
+START_TIME = datetime(2026, 1, 10, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("seconds", [0, 1, 61, 119])
+def test_get_orbit_path_starts_at_current_time(dashboard, iss_record, seconds):
+    """Test that the path starts at the current position and covers the next 90 minutes."""
+    satellite = parse_tle_from_json(iss_record)
+    current_time = START_TIME + timedelta(seconds=seconds)
+    path = dashboard.get_orbit_path(satellite, current_time, duration_minutes=90, step_minutes=2)
+
+    now = dashboard.calculate_orbit_path(satellite, current_time, 0, 2)
+    end = dashboard.calculate_orbit_path(satellite, current_time + timedelta(minutes=90), 0, 2)
+    np.testing.assert_array_equal(path[0], now[0])
+    # The last point is within one step (~1000 km at ISS speed) of the 90-minute mark
+    assert np.linalg.norm(path[-1] - end[0]) < 1000
+    assert len(path) == 46
+
+
+def test_get_orbit_path_on_step_boundary_matches_uncached(dashboard, iss_record):
+    """Test that a start on the step grid gives the plain calculate_orbit_path result."""
+    satellite = parse_tle_from_json(iss_record)
+    path = dashboard.get_orbit_path(satellite, START_TIME, duration_minutes=90, step_minutes=2)
+    expected = dashboard.calculate_orbit_path(satellite, START_TIME, 90, 2)
+    np.testing.assert_allclose(path, expected, atol=1e-3)
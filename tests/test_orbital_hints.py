@@ -0,0 +1,59 @@
+"""Tests for the orbital data hint lookup tables."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from orbital_hints import (
+    ECCENTRICITY_HINTS,
+    INCLINATION_HINTS,
+    PERIOD_HINTS,
+    classify_orbit_value,
+)
+
+
+@pytest.mark.parametrize("inclination, expected", [
+    (0.0, 'Near-equatorial'),
+    (9.99, 'Near-equatorial'),
+    (10.0, None),
+    (51.64, None),
+    (80.0, None),
+    (80.01, 'Polar orbit'),
+    (98.7, 'Polar orbit'),
+    (100.0, 'Sun-synchronous'),
+    (103.69, 'Sun-synchronous'),
+    (103.7, None),
+    (120.0, None),
+])
+def test_classify_orbit_value_inclination_edges(inclination, expected):
+    """Test that inclination bins keep the dashboard's strict bounds."""
+    assert classify_orbit_value(inclination, INCLINATION_HINTS) == expected
+
+
+@pytest.mark.parametrize("period, expected", [
+    (92.9, 'Low Earth Orbit'),
+    (100.0, 'LEO/MEO'),
+    (719.9, 'LEO/MEO'),
+    (720.0, None),
+    (1400.0, None),
+    (1400.01, 'Geostationary'),
+    (1436.1, 'Geostationary'),
+    (1450.0, None),
+])
+def test_classify_orbit_value_period_edges(period, expected):
+    """Test that period bins keep the dashboard's strict bounds."""
+    assert classify_orbit_value(period, PERIOD_HINTS) == expected
+
+
+@pytest.mark.parametrize("eccentricity, expected", [
+    (0.0004, 'Near-circular'),
+    (0.01, 'Slightly elliptical'),
+    (0.1, 'Elliptical'),
+    (0.7, 'Elliptical'),
+])
+def test_classify_orbit_value_eccentricity_edges(eccentricity, expected):
+    """Test the eccentricity bins."""
+    assert classify_orbit_value(eccentricity, ECCENTRICITY_HINTS) == expected
@@ -0,0 +1,59 @@
+"""Tests for the dashboard's batched tracked-satellite positions."""
+
+from datetime import datetime, timezone
+
+import pytest
+from skyfield.api import wgs84
+
+from iss_tracker_json import get_timescale, parse_tle_from_json
+
+TARGET_TIME = datetime(2026, 1, 10, 3, 0, tzinfo=timezone.utc)
+ISS_CONFIG = {'name': 'ISS', 'catnr': 25544, 'type': 'station'}
+
+
+def element_only(record: dict) -> dict:
+    """Copy of a record without TLE lines, like CelesTrak's JSON format."""
+    return {key: value for key, value in record.items() if key not in ('TLE_LINE1', 'TLE_LINE2')}
+
+
+def test_calculate_tracked_satellite_positions_with_tle_lines(dashboard, iss_record):
+    """Test that a record with TLE lines gets a position."""
+    positions = dashboard.calculate_tracked_satellite_positions(
+        [ISS_CONFIG], {25544: iss_record}, TARGET_TIME
+    )
+    assert positions.catnr.tolist() == [25544]
+    assert 300 < positions.alt[0] < 500
+
+
+def test_calculate_tracked_satellite_positions_element_only_record(dashboard, iss_record):
+    """Test that an element-only record is propagated instead of skipped."""
+    record = element_only(iss_record)
+    positions = dashboard.calculate_tracked_satellite_positions(
+        [ISS_CONFIG], {25544: record}, TARGET_TIME
+    )
+    assert positions.catnr.tolist() == [25544]
+
+    # Same result as the per-satellite Skyfield path for that record
+    expected = wgs84.geographic_position_of(
+        parse_tle_from_json(record).at(get_timescale().from_datetime(TARGET_TIME))
+    )
+    assert positions.lat[0] == pytest.approx(expected.latitude.degrees, abs=1e-3)
+    assert positions.lon[0] == pytest.approx(expected.longitude.degrees, abs=1e-3)
+    assert positions.alt[0] == pytest.approx(expected.elevation.km, abs=0.01)
+
+    # ...and the same place as the record's own TLE lines
+    from_lines = dashboard.calculate_tracked_satellite_positions(
+        [ISS_CONFIG], {25544: iss_record}, TARGET_TIME
+    )
+    assert positions.lat[0] == pytest.approx(from_lines.lat[0], abs=0.01)
+    assert positions.lon[0] == pytest.approx(from_lines.lon[0], abs=0.01)
+    assert positions.alt[0] == pytest.approx(from_lines.alt[0], abs=0.1)
+
+
+def test_tracked_satellites_key_element_only_record(dashboard, iss_record):
+    """Test that element-only records are keyed on their elements."""
+    record = element_only(iss_record)
+    newer = dict(record, EPOCH='2026-01-10T06:00:00.000000')
+    _, tle_key = dashboard.tracked_satellites_key([ISS_CONFIG], {25544: record})
+    _, newer_key = dashboard.tracked_satellites_key([ISS_CONFIG], {25544: newer})
+    assert tle_key != newer_key